@@ -0,0 +1,193 @@
+"""
+Widget paint benchmark
+
+Instantiate widgets under Qt offscreen platform with synthetic module data,
+drive timerEvent & paint for N frames, and report frame time per widget.
+Game is not required, API reads from empty shared memory data.
+
+Usage:
+    python tests/benchmark_widgets.py [-f FRAMES] [-w WIDGET ...] [-m]
+        [--save-baseline FILE] [--baseline FILE]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(".")
+
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QPixmap
+from PySide2.QtWidgets import QApplication
+
+from tinypedal.setting import cfg
+from tinypedal.api_control import api
+from tinypedal.class_style import cstyle
+from tinypedal.module_control import wctrl
+from tinypedal.module_info import minfo
+from tinypedal.overlay_control import octrl
+from tinypedal import widget
+from tinypedal.widget._base import fclock
+
+TRACK_RADIUS = 500  # meters
+TRACK_NODES = 2000
+TOTAL_VEHICLES = 24
+
+
+def set_synthetic_track():
+    """Set synthetic circular track map"""
+    track_length = 2 * math.pi * TRACK_RADIUS
+    coords = tuple(
+        (math.cos(index / TRACK_NODES * 2 * math.pi) * TRACK_RADIUS,
+         math.sin(index / TRACK_NODES * 2 * math.pi) * TRACK_RADIUS)
+        for index in range(TRACK_NODES + 1)
+    )
+    dists = tuple(
+        (index / TRACK_NODES * track_length,
+         math.sin(index / TRACK_NODES * 6 * math.pi) * 10)
+        for index in range(TRACK_NODES + 1)
+    )
+    minfo.mapping.coordinates = coords
+    minfo.mapping.elevations = dists
+    minfo.mapping.sectors = (TRACK_NODES // 3, TRACK_NODES * 2 // 3)
+    minfo.mapping.lastModified = 1.0
+
+
+def set_synthetic_vehicles(frame: int):
+    """Set synthetic vehicles data for current frame"""
+    output = minfo.vehicles
+    output.total = TOTAL_VEHICLES
+    output.playerIndex = 0
+    output.leaderIndex = TOTAL_VEHICLES - 1
+    output.drawOrder = list(range(TOTAL_VEHICLES))
+    plr_progress = frame * 0.001 % 1
+    for index, data in enumerate(output.dataSet[:TOTAL_VEHICLES]):
+        progress = (plr_progress + index * 0.002 * (1 + index % 3)) % 1
+        rad = progress * 2 * math.pi
+        data.isPlayer = index == 0
+        data.positionOverall = TOTAL_VEHICLES - index
+        data.positionInClass = data.positionOverall
+        data.driverName = f"Driver {index}"
+        data.vehicleName = f"Vehicle {index}"
+        data.vehicleClass = f"Class {index % 3}"
+        data.lapProgress = progress
+        data.worldPositionX = math.cos(rad) * TRACK_RADIUS
+        data.worldPositionY = math.sin(rad) * TRACK_RADIUS
+        data.relativeRotatedPositionX = (index % 3 - 1) * 3.0
+        data.relativeRotatedPositionY = (progress - plr_progress) * 2 * math.pi * TRACK_RADIUS
+        data.relativeStraightDistance = abs(data.relativeRotatedPositionY)
+        data.relativeOrientationRadians = 0.0
+    output.dataSetVersion = frame
+
+
+def percentile(data: list, percent: float) -> float:
+    """Percentile of sorted data"""
+    if not data:
+        return 0.0
+    return data[min(int(len(data) * percent), len(data) - 1)]
+
+
+def benchmark_widget(name: str, frames: int, trace_memory: bool) -> dict:
+    """Benchmark single widget, return result dict"""
+    overlay = getattr(widget, name).Realtime(cfg, name)
+    pixmap = QPixmap(max(overlay.width(), 1), max(overlay.height(), 1))
+    frame_times = []
+    memory_peaks = []
+    for frame in range(frames):
+        set_synthetic_vehicles(frame)
+        pixmap.fill(Qt.transparent)
+        if trace_memory:
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+        time_start = perf_counter()
+        overlay.timerEvent(None)
+        overlay.render(pixmap)
+        frame_times.append(perf_counter() - time_start)
+        if trace_memory:
+            memory_peaks.append(tracemalloc.get_traced_memory()[1] - memory_start)
+    fclock.unregister(overlay)
+    overlay.unload_resource()
+    overlay.deleteLater()
+    frame_times.sort()
+    return {
+        "mean_ms": sum(frame_times) / len(frame_times) * 1000,
+        "p99_ms": percentile(frame_times, 0.99) * 1000,
+        "peak_kib": max(memory_peaks) / 1024 if memory_peaks else 0.0,
+    }
+
+
+def load_baseline(filename: str) -> dict:
+    """Load baseline result"""
+    try:
+        with open(filename, "r", encoding="utf-8") as jsonfile:
+            return json.load(jsonfile)
+    except (FileNotFoundError, json.decoder.JSONDecodeError):
+        print(f"Unable to load baseline: {filename}")
+        return {}
+
+
+def print_result(results: dict, baseline: dict):
+    """Print result table, sorted by mean frame time"""
+    print(f"{'widget':<24}{'mean ms':>10}{'p99 ms':>10}{'peak KiB':>10}{'vs base':>10}")
+    for name, result in sorted(results.items(), key=lambda item: -item[1].get("mean_ms", 0)):
+        if "error" in result:
+            print(f"{name:<24}  error: {result['error']}")
+            continue
+        base = baseline.get(name, {}).get("mean_ms", 0)
+        ratio = f"{result['mean_ms'] / base:.2f}x" if base else "-"
+        print(
+            f"{name:<24}{result['mean_ms']:>10.3f}{result['p99_ms']:>10.3f}"
+            f"{result['peak_kib']:>10.1f}{ratio:>10}"
+        )
+
+
+def main():
+    """Run benchmark"""
+    parser = argparse.ArgumentParser(description="Widget paint benchmark")
+    parser.add_argument("-f", "--frames", type=int, default=300, help="frames per widget")
+    parser.add_argument("-w", "--widget", nargs="*", default=None, help="widget names")
+    parser.add_argument("-m", "--memory", action="store_true", help="trace peak memory per frame")
+    parser.add_argument("--save-baseline", default="", help="save result to baseline file")
+    parser.add_argument("--baseline", default="", help="compare with baseline file")
+    args = parser.parse_args()
+
+    root = QApplication(sys.argv)
+    cfg.load_global()
+    cfg.filename.setting = f"{cfg.preset_list[0]}.json"
+    cfg.load()
+    cstyle.reset()
+    api.connect()
+    api.start()
+    octrl.state.active = True
+    set_synthetic_track()
+
+    if args.memory:
+        if hasattr(tracemalloc, "reset_peak"):  # python 3.9+
+            tracemalloc.start()
+        else:
+            args.memory = False
+            print("Memory tracing requires python 3.9 or higher")
+
+    results = {}
+    for name in args.widget or wctrl.names:
+        try:
+            results[name] = benchmark_widget(name, max(args.frames, 1), args.memory)
+        except Exception as error:  # keep benchmarking other widgets
+            results[name] = {"error": repr(error)}
+
+    api.stop()
+    print_result(results, load_baseline(args.baseline) if args.baseline else {})
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as jsonfile:
+            json.dump(results, jsonfile, indent=4)
+    root.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,640 @@
+"""
+Data module replay harness
+
+Drive data module update loops synchronously against scripted or recorded
+API data, one frame per loop iteration, without timing dependency.
+Each module still runs its own update_data() loop, but module event wait
+is replaced by a step gate, so that modules advance strictly frame by frame
+and in listed order. Module output (minfo) can be printed, compared with
+expected output, or checked by callback after each frame.
+
+Replay file format (JSON lines), one frame per line, each frame only
+needs to contain changed values, unchanged values carry over from previous frame:
+    {"timing.elapsed": 10.02, "lap.distance": 501.3, "vehicle.speed:3": 52.1}
+    Key "group.method" for player vehicle, "group.method:index" for vehicle index,
+    key "state.active" sets overlay active state (default true).
+
+Expected file format (JSON lines):
+    {"frame": 120, "delta.deltaBest": 0.0, "fuel.amountCurrent": 10.5}
+
+Usage:
+    python tests/module_replay.py -m MODULE [MODULE ...] [-r REPLAY | -s LAPS [-v VEHICLES]]
+        [-o OUTPUT ...] [-e EXPECTED] [--tolerance TOL] [--record FILE -f FRAMES]
+        [--save-expected FILE [--save-step STEP]]
+
+Example:
+    python tests/module_replay.py -m module_events module_pace -s 3 -o pace.laptimePace
+
+Expected output fixtures of synthetic scenarios are in "tests/replay" folder,
+and are checked by "tests/test_module_replay.py".
+"""
+
+from __future__ import annotations
+import argparse
+import importlib
+import json
+import math
+import shutil
+import sys
+import tempfile
+import threading
+from time import perf_counter, sleep
+from typing import Any, Callable
+
+sys.path.append(".")
+
+from tinypedal.setting import cfg, copy_setting
+from tinypedal.api_control import api
+from tinypedal.api_connector import APIDataSet
+from tinypedal.adapter import rfactor2
+from tinypedal.module_info import minfo
+from tinypedal.userfile.lap_history import LapHistoryWriter
+from tinypedal.userfile.state_journal import StateJournal
+
+DEFAULT_VALUES = {
+    "check.combo_id": "replay",
+    "check.track_id": "replay",
+    "check.vehicle_id": "replay",
+    "check.session_id": (0, 0, 0),
+    "check.sim_name": "RF2",
+    "vehicle.position_xyz": (0.0, 0.0, 0.0),
+    "vehicle.vehicle_name": "replay",
+    "vehicle.class_name": "replay",
+    "vehicle.driver_name": "replay",
+    "vehicle.total_vehicles": 1,
+    "vehicle.is_player": True,
+    "lap.track_length": 1000.0,
+    "lap.maximum": 99999,
+    "session.lap_type": True,
+}
+ANNOTATION_DEFAULTS = {
+    "bool": False,
+    "float": 0.0,
+    "int": 0,
+    "str": "",
+    "list[bool]": (False,) * 4,
+    "list[float]": (0.0,) * 4,
+}
+STEP_TIMEOUT = 30  # seconds, maximum time for single module step
+
+
+def annotation_default(group: str, method: str) -> Any:
+    """Default value from API adapter method return annotation"""
+    adapter = APIDataSet.__annotations__.get(group, None)
+    if isinstance(adapter, str):
+        adapter = getattr(rfactor2, adapter.split(".")[-1], None)
+    annotation = getattr(getattr(adapter, method, None), "__annotations__", {}).get("return", "")
+    if not isinstance(annotation, str):
+        annotation = getattr(annotation, "__name__", "")
+    if annotation in ANNOTATION_DEFAULTS:
+        return ANNOTATION_DEFAULTS[annotation]
+    if annotation.startswith("tuple[") and "..." not in annotation:
+        return tuple(
+            ANNOTATION_DEFAULTS.get(item.strip(), 0.0)
+            for item in annotation[6:-1].split(",")
+        )
+    if annotation.startswith("tuple"):
+        return ()
+    return 0.0
+
+
+def tupled(value: Any) -> Any:
+    """Convert JSON list value to tuple, as returned from API"""
+    if isinstance(value, list):
+        return tuple(tupled(item) for item in value)
+    return value
+
+
+def load_frames(filename: str) -> list[dict]:
+    """Load replay or expected frames from JSON lines file"""
+    with open(filename, "r", encoding="utf-8") as jsonfile:
+        return [
+            {key: tupled(value) for key, value in json.loads(line).items()}
+            for line in jsonfile
+            if line.strip()
+        ]
+
+
+def save_frames(filename: str, frames: list[dict]):
+    """Save frames to JSON lines file"""
+    with open(filename, "w", encoding="utf-8") as jsonfile:
+        for frame in frames:
+            jsonfile.write(json.dumps(frame))
+            jsonfile.write("\n")
+
+
+class ReplayReader:
+    """Scripted API reader
+
+    Replace api.read, each api.read.group.method(index) call
+    returns value from current frame, or value carried over
+    from previous frames, or default value (DEFAULT_VALUES,
+    then API adapter return type).
+
+    Args:
+        frames: list of frame dict.
+        defaults: default value dict, overrides DEFAULT_VALUES.
+    """
+
+    def __init__(self, frames: list[dict], defaults: dict | None = None):
+        self._frames = frames
+        self._values = {**DEFAULT_VALUES, **(defaults or {})}
+        self._groups = {}
+        self.frame_index = -1
+
+    def __getattr__(self, group: str) -> ReplayGroup:
+        reader_group = self._groups.get(group, None)
+        if reader_group is None:
+            reader_group = self._groups[group] = ReplayGroup(self, group)
+        return reader_group
+
+    @property
+    def total_frames(self) -> int:
+        """Total frames"""
+        return len(self._frames)
+
+    def next_frame(self) -> dict | None:
+        """Advance to next frame, return frame data or None if finished"""
+        if self.frame_index + 1 >= len(self._frames):
+            return None
+        self.frame_index += 1
+        frame = self._frames[self.frame_index]
+        self._values.update(frame)
+        return frame
+
+    def value(self, key: str, index: int | None, default: Any) -> Any:
+        """Get value from key & vehicle index"""
+        if index is not None:
+            indexed = self._values.get(f"{key}:{index}", None)
+            if indexed is not None:
+                return indexed
+        return self._values.get(key, default)
+
+
+class ReplayGroup:
+    """Scripted API reader group"""
+
+    def __init__(self, reader: ReplayReader, group: str):
+        self._reader = reader
+        self._group = group
+
+    def __getattr__(self, method: str) -> Callable:
+        key = f"{self._group}.{method}"
+        value = self._reader.value
+        default = annotation_default(self._group, method)
+
+        def read(index: int | None = None, *_args, **_kwargs):
+            return value(key, index, default)
+
+        setattr(self, method, read)
+        return read
+
+
+class RecordingReader:
+    """Recording API reader
+
+    Proxy live api.read, record values read by modules in each frame,
+    only changed values are stored.
+
+    Args:
+        reader: live API reader (api.read).
+    """
+
+    def __init__(self, reader: Any):
+        self._reader = reader
+        self._groups = {}
+        self._frame = {}
+        self._last = {}
+        self.frames = []
+
+    def __getattr__(self, group: str) -> RecordingGroup:
+        reader_group = self._groups.get(group, None)
+        if reader_group is None:
+            reader_group = self._groups[group] = RecordingGroup(self, group)
+        return reader_group
+
+    def group(self, group: str) -> Any:
+        """Get live reader group"""
+        return getattr(self._reader, group)
+
+    def record(self, key: str, index: int | None, value: Any):
+        """Record value read"""
+        if index is not None:
+            key = f"{key}:{index}"
+        self._frame[key] = value
+
+    def next_frame(self):
+        """Finish current frame, store changed values"""
+        changed = {
+            key: value for key, value in self._frame.items()
+            if self._last.get(key, None) != value
+        }
+        self._last.update(self._frame)
+        self._frame = {}
+        self.frames.append(changed)
+
+
+class RecordingGroup:
+    """Recording API reader group"""
+
+    def __init__(self, reader: RecordingReader, group: str):
+        self._reader = reader
+        self._group = group
+
+    def __getattr__(self, method: str) -> Callable:
+        key = f"{self._group}.{method}"
+        live_read = getattr(self._reader.group(self._group), method)
+        record = self._reader.record
+
+        def read(index: int | None = None):
+            if index is None:  # most adapter methods take no index
+                value = live_read()
+            else:
+                value = live_read(index)
+            record(key, index, value)
+            return value
+
+        setattr(self, method, read)
+        return read
+
+
+class ReplayState:
+    """Overlay state replacement, only active state is used by modules"""
+
+    def __init__(self):
+        self.active = True
+
+
+class StepEvent:
+    """Module event replacement
+
+    Module update loop calls wait() once per iteration,
+    which blocks until next step is released by harness.
+    Returns True after stopped, which ends module update loop.
+    """
+
+    def __init__(self):
+        self._go = threading.Semaphore(0)
+        self._done = threading.Event()
+        self._stopped = False
+
+    def wait(self, _timeout: float | None = None) -> bool:
+        """Mark current step done, wait for next step"""
+        self._done.set()
+        self._go.acquire()
+        return self._stopped
+
+    def step(self):
+        """Release single step, wait until module reaches next wait"""
+        self._done.clear()
+        self._go.release()
+        if not self._done.wait(STEP_TIMEOUT):
+            raise TimeoutError("module step timeout")
+
+    def ready(self):
+        """Wait until module reaches first wait"""
+        if not self._done.wait(STEP_TIMEOUT):
+            raise TimeoutError("module start timeout")
+
+    def set(self):
+        """Stop module loop"""
+        self._stopped = True
+        self._go.release()
+
+    def clear(self):
+        """Reset stopped state"""
+        self._stopped = False
+
+    def is_set(self) -> bool:
+        """Is stopped"""
+        return self._stopped
+
+
+class ModuleReplay:
+    """Data module replay harness
+
+    Args:
+        module_names: data module names, updated in listed order per frame.
+        temp_path: temporary user data path.
+    """
+
+    def __init__(self, module_names: list[str], temp_path: str):
+        setup_config(temp_path)
+        self.state = ReplayState()
+        self.modules = []
+        self.journals = []
+        self.writers = []
+        self.errors = []
+        self.step_times = {name: [] for name in module_names}
+        for name in module_names:
+            module_file = importlib.import_module(f"tinypedal.module.{name}")
+            isolate_module(module_file, temp_path, self.journals, self.writers)
+            module = module_file.Realtime(cfg, name)
+            module.state = self.state
+            module._event = StepEvent()
+            self.modules.append(module)
+
+    def run(self, reader: ReplayReader | RecordingReader,
+            on_frame: Callable[[int, dict], None] | None = None,
+            frames: int = 0, interval: float = 0):
+        """Run all modules frame by frame
+
+        Args:
+            reader: replay reader, or recording reader for live API.
+            on_frame: callback after each frame, receives frame index & frame data.
+            frames: number of frames to record, only used by recording reader.
+            interval: seconds between frames, only used by recording reader.
+        """
+        api_read = api.read
+        api.read = reader
+        threads = [self.__start(module) for module in self.modules]
+        try:
+            frame_index = 0
+            while True:
+                if isinstance(reader, ReplayReader):
+                    frame = reader.next_frame()
+                    if frame is None:
+                        break
+                    self.state.active = frame.get("state.active", self.state.active)
+                elif frame_index >= frames:
+                    break
+                else:
+                    sleep(interval)
+                    # Same as overlay state, recorded for replaying garage exits
+                    self.state.active = bool(api.state)
+                    reader.record("state.active", None, self.state.active)
+                    frame = {}
+                for module in self.modules:
+                    time_start = perf_counter()
+                    module._event.step()
+                    self.step_times[module.module_name].append(perf_counter() - time_start)
+                    if self.errors:
+                        raise self.errors[0]
+                if isinstance(reader, RecordingReader):
+                    reader.next_frame()
+                if on_frame is not None:
+                    on_frame(frame_index, frame)
+                frame_index += 1
+        finally:
+            for module in self.modules:
+                module.stop()
+            for thread in threads:
+                thread.join(STEP_TIMEOUT)
+            for journal in self.journals:
+                journal.close()
+            for writer in self.writers:
+                writer.close()
+            api.read = api_read
+
+    def __start(self, module) -> threading.Thread:
+        """Start module update loop thread, wait until ready"""
+        module.closed = False
+        thread = threading.Thread(target=self.__update, args=(module,), daemon=True)
+        thread.start()
+        module._event.ready()
+        return thread
+
+    def __update(self, module):
+        """Module update loop, keep error for harness"""
+        try:
+            module.update_data()
+        except Exception as error:  # report to harness thread
+            self.errors.append(error)
+        module._event._done.set()
+
+
+class InlineJobs:
+    """Job executor replacement, run job immediately in module thread"""
+
+    @staticmethod
+    def submit(_name: str, func: Callable, *args: Any, **kwargs: Any):
+        """Run job"""
+        func(*args, **kwargs)
+
+
+def setup_config(temp_path: str):
+    """Set default module setting & user data path, no user file is loaded"""
+    cfg.user.config = copy_setting(cfg.default.config)
+    cfg.application = cfg.user.config["application"]
+    cfg.create()
+    cfg.overlay = cfg.user.setting["overlay"]
+    cfg.shared_memory_api = cfg.user.setting["shared_memory_api"]
+    cfg.units = cfg.user.setting["units"]
+    for key in cfg.path.__slots__:
+        if key != "config":
+            setattr(cfg.path, key, temp_path)
+
+
+def isolate_module(module_file, temp_path: str, journals: list, writers: list):
+    """Replace module background writers, keep replay deterministic
+
+    Replaced journals & lap history writers must be closed
+    before removing temporary user data path.
+    """
+    if hasattr(module_file, "jobs"):
+        module_file.jobs = InlineJobs()
+    if hasattr(module_file, "state_journal"):
+        module_file.state_journal = StateJournal(temp_path)
+        journals.append(module_file.state_journal)
+    if hasattr(module_file, "lap_history"):
+        module_file.lap_history = LapHistoryWriter()
+        writers.append(module_file.lap_history)
+
+
+def read_output(path: str) -> Any:
+    """Read module output from minfo, such as "delta.deltaBest" or "pace.laptimePace.0" """
+    value = minfo
+    for name in path.split("."):
+        if name.isdigit():
+            value = value[int(name)]
+        else:
+            value = getattr(value, name)
+    return plain_value(value)
+
+
+def plain_value(value: Any) -> Any:
+    """Copy output value as plain (nested) list, as output lists may be reused by module"""
+    if hasattr(value, "tolist"):  # typed array
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [plain_value(item) for item in value]
+    return value
+
+
+def load_expected(filename: str) -> dict[int, dict]:
+    """Load expected output frames from JSON lines file, keyed by frame index"""
+    return {frame["frame"]: frame for frame in load_frames(filename)}
+
+
+def check_expected(expected_frame: dict, frame_index: int, tolerance: float) -> list[str]:
+    """Compare module output with expected output frame, return mismatch messages"""
+    failures = []
+    for path, value in expected_frame.items():
+        if path == "frame":
+            continue
+        output = read_output(path)
+        if not compare_output(value, output, tolerance):
+            failures.append(f"frame {frame_index}: {path} expected {value}, got {output}")
+    return failures
+
+
+def compare_output(expected: Any, output: Any, tolerance: float) -> bool:
+    """Compare output value with expected value"""
+    if isinstance(expected, (list, tuple)):
+        if not isinstance(output, (list, tuple)) or len(expected) != len(output):
+            return False
+        return all(
+            compare_output(exp_value, out_value, tolerance)
+            for exp_value, out_value in zip(expected, output)
+        )
+    if isinstance(expected, float) or isinstance(output, float):
+        try:
+            return math.isclose(expected, output, abs_tol=tolerance)
+        except TypeError:
+            return False
+    return expected == output
+
+
+def synthetic_laps(laps: int, laptime: float = 60, track_length: float = 3000,
+                   interval: float = 0.02, vehicles: int = 1, laptime_step: float = 0.5,
+                   start_gap: float = 40) -> list[dict]:
+    """Create synthetic frames of vehicles driving laps at constant speed on circular track
+
+    Vehicle 0 is player (unindexed keys), each following vehicle starts
+    start_gap meters behind previous vehicle, and is laptime_step seconds slower.
+    """
+    frames = []
+    radius = track_length / (2 * math.pi)
+    total_frames = round(laps * laptime / interval)
+    session_stamp = 36000
+    for frame_index in range(total_frames + 1):
+        elapsed = frame_index * interval
+        frame = {
+            "check.session_id": (session_stamp, int(elapsed), 0),
+            "timing.elapsed": elapsed,
+            "lap.track_length": track_length,
+            "vehicle.total_vehicles": vehicles,
+        }
+        driven = []
+        for index in range(vehicles):
+            veh_laptime = laptime + index * laptime_step
+            veh_distance = elapsed / veh_laptime * track_length - index * start_gap
+            distance = veh_distance % track_length  # behind start line before first lap
+            completed_laps = max(int(veh_distance // track_length), 0)
+            if veh_distance >= 0:  # time of last start line crossing
+                lap_stime = (completed_laps + index * start_gap / track_length) * veh_laptime
+            else:
+                lap_stime = 0.0
+            current_laptime = elapsed - lap_stime
+            rad = distance / radius
+            driven.append((veh_distance, index))
+            suffix = f":{index}" if index else ""
+            frame.update({
+                f"timing.start{suffix}": lap_stime,
+                f"timing.current_laptime{suffix}": current_laptime,
+                f"timing.last_laptime{suffix}": veh_laptime if completed_laps else 0.0,
+                f"timing.best_laptime{suffix}": veh_laptime if completed_laps else 0.0,
+                f"timing.estimated_laptime{suffix}": veh_laptime,
+                f"timing.estimated_time_into{suffix}": distance / track_length * veh_laptime,
+                f"lap.distance{suffix}": distance,
+                f"lap.progress{suffix}": distance / track_length,
+                f"lap.completed_laps{suffix}": completed_laps,
+                f"lap.sector_index{suffix}": min(int(distance / track_length * 3), 2),
+                f"vehicle.speed{suffix}": track_length / veh_laptime,
+                f"vehicle.position_xyz{suffix}": (
+                    math.cos(rad) * radius, 0.0, math.sin(rad) * radius),
+                f"vehicle.position_longitudinal{suffix}": math.cos(rad) * radius,
+                f"vehicle.position_lateral{suffix}": -math.sin(rad) * radius,
+                f"vehicle.orientation_yaw_radians{suffix}": rad,
+                f"vehicle.fuel{suffix}": 100 - elapsed / veh_laptime * 2.5,
+                f"vehicle.tank_capacity{suffix}": 100.0,
+            })
+            if index:
+                frame[f"vehicle.is_player{suffix}"] = False
+                frame[f"vehicle.slot_id{suffix}"] = index
+                frame[f"vehicle.driver_name{suffix}"] = f"replay {index}"
+        driven.sort(reverse=True)
+        for place, (_, index) in enumerate(driven, 1):
+            frame[f"vehicle.place:{index}" if index else "vehicle.place"] = place
+        frames.append(frame)
+    return frames
+
+
+def percentile(data: list, percent: float) -> float:
+    """Percentile of sorted data"""
+    if not data:
+        return 0.0
+    return data[min(int(len(data) * percent), len(data) - 1)]
+
+
+def print_step_times(step_times: dict):
+    """Print module step time"""
+    print(f"{'module':<24}{'steps':>8}{'mean ms':>10}{'p99 ms':>10}")
+    for name, times in step_times.items():
+        times = sorted(times)
+        mean = sum(times) / len(times) * 1000 if times else 0.0
+        print(f"{name:<24}{len(times):>8}{mean:>10.3f}{percentile(times, 0.99) * 1000:>10.3f}")
+
+
+def main():
+    """Run replay"""
+    parser = argparse.ArgumentParser(description="Data module replay harness")
+    parser.add_argument("-m", "--module", nargs="+", required=True, help="module names")
+    parser.add_argument("-r", "--replay", default="", help="replay frames file")
+    parser.add_argument("-s", "--synthetic", type=int, default=2, help="synthetic laps")
+    parser.add_argument("-v", "--vehicles", type=int, default=1, help="synthetic vehicles")
+    parser.add_argument("-o", "--output", nargs="*", default=[], help="print minfo output paths")
+    parser.add_argument("-e", "--expected", default="", help="compare with expected output file")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="float tolerance")
+    parser.add_argument("--save-expected", default="", help="save output paths to expected file")
+    parser.add_argument("--save-step", type=int, default=1, help="save every N frames")
+    parser.add_argument("--record", default="", help="record live API frames to file")
+    parser.add_argument("-f", "--frames", type=int, default=3000, help="frames to record")
+    args = parser.parse_args()
+
+    temp_path = tempfile.mkdtemp(prefix="tinypedal_replay_")
+    expected = load_expected(args.expected) if args.expected else {}
+    saved = []
+    failures = []
+
+    def on_frame(frame_index: int, _frame: dict):
+        if args.output or args.save_expected:
+            outputs = {path: read_output(path) for path in args.output}
+            if not args.save_expected:
+                print(frame_index, outputs)
+            elif frame_index % max(args.save_step, 1) == 0:
+                saved.append({"frame": frame_index, **outputs})
+        if frame_index in expected:
+            failures.extend(check_expected(expected[frame_index], frame_index, args.tolerance))
+
+    try:
+        harness = ModuleReplay(args.module, f"{temp_path}/")
+        if args.record:
+            api.connect()
+            api.start()
+            reader = RecordingReader(api.read)
+            harness.run(reader, on_frame, max(args.frames, 1), harness.modules[0].active_interval)
+            api.stop()
+            save_frames(args.record, reader.frames)
+            print(f"Recorded {len(reader.frames)} frames: {args.record}")
+        else:
+            if args.replay:
+                frames = load_frames(args.replay)
+            else:
+                frames = synthetic_laps(args.synthetic, vehicles=max(args.vehicles, 1))
+            harness.run(ReplayReader(frames), on_frame)
+        print_step_times(harness.step_times)
+    finally:
+        shutil.rmtree(temp_path, ignore_errors=True)
+
+    if args.save_expected:
+        save_frames(args.save_expected, saved)
+    for failure in failures:
+        print(failure)
+    if expected:
+        print(f"{'FAILED' if failures else 'PASSED'}: {len(failures)} mismatch(es)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Data module replay tests
+
+Replay synthetic scenarios through data modules, and compare module output
+with expected output fixtures in "tests/replay" folder.
+
+Run tests:
+    python -m pytest tests/test_module_replay.py
+
+Update expected output fixtures after intended module output change:
+    python tests/test_module_replay.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(TEST_PATH))  # repository root
+sys.path.append(TEST_PATH)
+
+from module_replay import (
+    ModuleReplay,
+    ReplayReader,
+    synthetic_laps,
+    load_expected,
+    check_expected,
+    read_output,
+    save_frames,
+)
+
+FIXTURE_PATH = os.path.join(TEST_PATH, "replay")
+FIXTURE_STEP = 250  # frames, expected output interval
+TOLERANCE = 1e-6
+
+# Opponents start behind player and are faster, so that relative order & places change
+FIELD_SCENARIO = {"laps": 2, "vehicles": 4, "laptime_step": -2}
+
+REPLAY_CASES = {
+    # expected file: (module names, synthetic scenario, output paths)
+    "delta.jsonl": (
+        ("module_events", "module_delta"),
+        {"laps": 3},
+        (
+            "delta.lapTimeCurrent",
+            "delta.lapTimeLast",
+            "delta.lapTimeBest",
+            "delta.lapTimePace",
+            "delta.deltaBest",
+            "delta.deltaLast",
+            "delta.lapDistance",
+            "delta.metersDriven",
+        ),
+    ),
+    "fuel.jsonl": (
+        ("module_events", "module_delta", "module_fuel"),
+        {"laps": 3},
+        (
+            "fuel.amountCurrent",
+            "fuel.amountUsedCurrent",
+            "fuel.lastLapConsumption",
+            "fuel.lastLapValidConsumption",
+            "fuel.estimatedConsumption",
+            "fuel.estimatedLaps",
+            "fuel.deltaConsumption",
+            "fuel.neededRelative",
+        ),
+    ),
+    "relative.jsonl": (
+        ("module_relative",),
+        FIELD_SCENARIO,
+        (
+            "relative.relative",
+            "relative.standings",
+            "relative.classes",
+        ),
+    ),
+    "vehicles.jsonl": (
+        ("module_relative", "module_vehicles"),
+        FIELD_SCENARIO,
+        (
+            "vehicles.total",
+            "vehicles.leaderIndex",
+            "vehicles.playerIndex",
+            "vehicles.drawOrder",
+            "vehicles.nearestLine",
+            "vehicles.nearestTraffic",
+            "vehicles.dataSet.1.positionOverall",
+            "vehicles.dataSet.1.relativeTimeGap",
+            "vehicles.dataSet.2.positionOverall",
+            "vehicles.dataSet.2.lapProgress",
+            "vehicles.dataSet.3.positionOverall",
+            "vehicles.dataSet.3.relativeStraightDistance",
+        ),
+    ),
+}
+
+
+def replay(module_names: tuple, scenario: dict, temp_path: str, on_frame):
+    """Replay synthetic scenario through modules"""
+    harness = ModuleReplay(list(module_names), f"{temp_path}/")
+    harness.run(ReplayReader(synthetic_laps(**scenario)), on_frame)
+
+
+@pytest.mark.parametrize("filename", sorted(REPLAY_CASES))
+def test_module_replay(filename, tmp_path):
+    """Module output matches expected output fixture"""
+    module_names, scenario, _ = REPLAY_CASES[filename]
+    expected = load_expected(os.path.join(FIXTURE_PATH, filename))
+    checked = []
+    failures = []
+
+    def on_frame(frame_index: int, _frame: dict):
+        if frame_index in expected:
+            checked.append(frame_index)
+            failures.extend(check_expected(expected[frame_index], frame_index, TOLERANCE))
+
+    replay(module_names, scenario, str(tmp_path), on_frame)
+    assert checked == sorted(expected), "expected frames not replayed"
+    assert not failures, "\n".join(failures[:20])
+
+
+def update_fixtures():
+    """Save current module output as expected output fixtures"""
+    os.makedirs(FIXTURE_PATH, exist_ok=True)
+    for filename, (module_names, scenario, output_paths) in REPLAY_CASES.items():
+        saved = []
+
+        def on_frame(frame_index: int, _frame: dict):
+            if frame_index % FIXTURE_STEP == 0:
+                saved.append({"frame": frame_index, **{
+                    path: read_output(path) for path in output_paths}})
+
+        temp_path = tempfile.mkdtemp(prefix="tinypedal_replay_")
+        try:
+            replay(module_names, scenario, temp_path, on_frame)
+        finally:
+            shutil.rmtree(temp_path, ignore_errors=True)
+        save_frames(os.path.join(FIXTURE_PATH, filename), saved)
+        print(f"Saved {len(saved)} frames: {filename}")
+
+
+if __name__ == "__main__":
+    update_fixtures()
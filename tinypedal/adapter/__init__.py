@@ -22,6 +22,8 @@ API data adapter
 To create new API adapter, duplicate rfactor2.py and fill in entries.
 """
 
+from typing import Any
+
 from pyRfactor2SharedMemory import rF2MMap
 
 
@@ -30,16 +32,20 @@ class DataAdapter:
 
     Attributes:
         info: API object.
+        cache: API data reference cache object.
     """
 
     __slots__ = (
         "info",
+        "cache",
     )
 
-    def __init__(self, info: rF2MMap.RF2SM) -> None:
+    def __init__(self, info: rF2MMap.RF2SM, cache: Any = None) -> None:
         """Initialize API setting
 
         Args:
             info: API object.
+            cache: API data reference cache object, shared between adapters.
         """
         self.info = info
+        self.cache = cache
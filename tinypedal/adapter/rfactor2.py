@@ -24,6 +24,11 @@ Notes:
 """
 
 from __future__ import annotations
+import threading
+from ctypes import addressof
+from time import monotonic
+
+from pyRfactor2SharedMemory import rF2MMap
 
 from . import DataAdapter
 from .. import validator as val
@@ -39,6 +44,7 @@ from ..calculation import (
 
 chknm = val.infnan2zero
 cs2py = val.cbytes2str
+snapshot_buffer = False  # set from API access mode, only needed for direct access mode
 
 # 0 = TESTDAY, 1 = PRACTICE, 2 = QUALIFY, 3 = WARMUP, 4 = RACE
 RF2_SESSION_TYPE = (0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 4, 4, 4, 4, 0, 0, 0, 0)
@@ -46,6 +52,185 @@ RF2_SESSION_TYPE = (0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 4, 4, 4, 4, 0, 0, 0, 0)
 RF2_SECTORS = (2, 0, 1, 0, 0, 0, 0)
 
 
+RF2_CACHE_LIFETIME = 0.005  # seconds, vehicle data reference cache lifetime
+RF2_MAX_COPY_RETRY = 3  # maximum retry on torn read
+
+
+def buffer_root(data):
+    """Find root (mapped buffer) struct and byte offset of nested struct
+
+    Returns:
+        Root struct (None if root has no version block) and offset.
+    """
+    root = data
+    while root._b_base_ is not None:
+        root = root._b_base_
+    if root is data or not hasattr(root, "mVersionUpdateEnd"):
+        return None, 0
+    return root, addressof(data) - addressof(root)
+
+
+class BufferSnapshot:
+    """Version-checked private copy of mapped buffer
+
+    Only used in direct access mode, as copy access mode
+    already reads from version-checked private copy.
+
+    Buffer is only copied if version changed since last copy,
+    copy is verified by begin & end version counter, and retried if torn.
+    Last consistent copy is kept if all retries are torn.
+    Frame copy is shared by all module threads, and updated under lock.
+
+    Attributes:
+        torn: number of torn reads.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_source",
+        "_copy",
+        "_version",
+        "_frame",
+        "torn",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source = None
+        self._copy = None
+        self._version = -1
+        self._frame = None
+        self.torn = 0
+
+    def new_frame(self):
+        """Start new frame, buffer is checked again on next read"""
+        with self._lock:
+            self._frame = None
+
+    def view(self, data):
+        """Get view of nested struct in frame copy, or original if not mapped buffer"""
+        root, offset = buffer_root(data)
+        if root is None:
+            return data
+        with self._lock:
+            frame = self._frame
+            if frame is None or self._source is not root:
+                frame = self._frame = self.__update(root)
+        return type(data).from_buffer(frame, offset)
+
+    def __update(self, root):
+        """Update private copy if buffer version changed"""
+        if self._source is not root:
+            self._source = root
+            self._copy = None
+        if self._copy is not None and root.mVersionUpdateEnd == self._version:
+            return self._copy
+        for _ in range(RF2_MAX_COPY_RETRY):
+            data = type(root).from_buffer_copy(root)
+            if data.mVersionUpdateBegin == data.mVersionUpdateEnd:
+                self._copy = data
+                self._version = data.mVersionUpdateEnd
+                return data
+            self.torn += 1
+        if self._copy is None:
+            return data
+        return self._copy
+
+
+class VehicleCache:
+    """Vehicle data reference cache
+
+    Scoring & telemetry vehicle index mapping and struct references
+    are resolved once per frame and shared by all adapters,
+    cache is renewed after lifetime expired.
+
+    In direct access mode, scoring info & vehicle data is read from
+    version-checked private copy of mapped buffer (see BufferSnapshot),
+    so that all data read within same frame are consistent.
+
+    Args:
+        info: API object.
+        lifetime: cache lifetime (seconds).
+    """
+
+    __slots__ = (
+        "_info",
+        "_lifetime",
+        "_expire",
+        "_tele",
+        "_scor",
+        "_wheels",
+        "_scor_info",
+        "_tele_buffer",
+        "_scor_buffer",
+    )
+
+    def __init__(self, info: rF2MMap.RF2SM, lifetime: float = RF2_CACHE_LIFETIME):
+        self._info = info
+        self._lifetime = lifetime
+        self._expire = 0.0
+        self._tele = {}
+        self._scor = {}
+        self._wheels = {}
+        self._scor_info = None
+        self._tele_buffer = BufferSnapshot()
+        self._scor_buffer = BufferSnapshot()
+
+    def __renew(self):
+        """Renew cache if expired, replace (not clear) dict for thread safety"""
+        now = monotonic()
+        if now > self._expire:
+            self._expire = now + self._lifetime
+            self._tele = {}
+            self._scor = {}
+            self._wheels = {}
+            self._scor_info = None
+            if snapshot_buffer:
+                self._tele_buffer.new_frame()
+                self._scor_buffer.new_frame()
+
+    def scor_info(self):
+        """Scoring info data"""
+        self.__renew()
+        data = self._scor_info
+        if data is None:
+            data = self._info.rf2ScorInfo
+            if snapshot_buffer:
+                data = self._scor_buffer.view(data)
+            self._scor_info = data
+        return data
+
+    def tele(self, index: int | None = None):
+        """Telemetry vehicle data"""
+        self.__renew()
+        data = self._tele.get(index, None)
+        if data is None:
+            data = self._info.rf2TeleVeh(index)
+            if snapshot_buffer:
+                data = self._tele_buffer.view(data)
+            self._tele[index] = data
+        return data
+
+    def scor(self, index: int | None = None):
+        """Scoring vehicle data"""
+        self.__renew()
+        data = self._scor.get(index, None)
+        if data is None:
+            data = self._info.rf2ScorVeh(index)
+            if snapshot_buffer:
+                data = self._scor_buffer.view(data)
+            self._scor[index] = data
+        return data
+
+    def wheels(self, index: int | None = None) -> tuple:
+        """Telemetry wheel data (4 wheels)"""
+        self.__renew()
+        data = self._wheels.get(index, None)
+        if data is None:
+            data = self._wheels[index] = tuple(self.tele(index).mWheels)
+        return data
+
+
 class Check(DataAdapter):
     """Check"""
 
@@ -55,8 +240,8 @@ class Check(DataAdapter):
         """API state"""
         return (
             not self.info.isPaused and
-            (self.info.rf2ScorInfo.mInRealtime
-            or self.info.rf2TeleVeh().mIgnitionStarter)
+            (self.cache.scor_info().mInRealtime
+            or self.cache.tele().mIgnitionStarter)
         )
 
     def api_version(self) -> str:
@@ -65,7 +250,7 @@ class Check(DataAdapter):
 
     def sim_name(self) -> str:
         """Identify sim name"""
-        name = cs2py(self.info.rf2ScorInfo.mPlrFileName)
+        name = cs2py(self.cache.scor_info().mPlrFileName)
         if name == "Settings":
             return "LMU"
         if name:
@@ -74,27 +259,27 @@ class Check(DataAdapter):
 
     def combo_id(self) -> str:
         """Identify track & vehicle combo"""
-        track_name = cs2py(self.info.rf2ScorInfo.mTrackName)
-        class_name = cs2py(self.info.rf2ScorVeh().mVehicleClass)
+        track_name = cs2py(self.cache.scor_info().mTrackName)
+        class_name = cs2py(self.cache.scor().mVehicleClass)
         return strip_invalid_char(f"{track_name} - {class_name}")
 
     def vehicle_id(self) -> str:
         """Identify vehicle & class"""
-        class_name = cs2py(self.info.rf2ScorVeh().mVehicleClass)
-        veh_name = cs2py(self.info.rf2ScorVeh().mVehicleName)
+        class_name = cs2py(self.cache.scor().mVehicleClass)
+        veh_name = cs2py(self.cache.scor().mVehicleName)
         return strip_invalid_char(f"{class_name} - {veh_name}")
 
     def track_id(self) -> str:
         """Identify track name"""
-        return strip_invalid_char(cs2py(self.info.rf2ScorInfo.mTrackName))
+        return strip_invalid_char(cs2py(self.cache.scor_info().mTrackName))
 
     def session_id(self) -> tuple[int, int, int]:
         """Identify session"""
-        session_length = chknm(self.info.rf2ScorInfo.mEndET)
-        session_type = chknm(self.info.rf2ScorInfo.mSession)
+        session_length = chknm(self.cache.scor_info().mEndET)
+        session_type = chknm(self.cache.scor_info().mSession)
         session_stamp = int(session_length * 100 + session_type)
-        session_etime = int(chknm(self.info.rf2ScorInfo.mCurrentET))
-        session_tlaps = chknm(self.info.rf2ScorVeh().mTotalLaps)
+        session_etime = int(chknm(self.cache.scor_info().mCurrentET))
+        session_tlaps = chknm(self.cache.scor().mTotalLaps)
         return session_stamp, session_etime, session_tlaps
 
 
@@ -105,16 +290,16 @@ class Brake(DataAdapter):
 
     def bias_front(self, index: int | None = None) -> float:
         """Brake bias front (fraction)"""
-        return 1 - chknm(self.info.rf2TeleVeh(index).mRearBrakeBias)
+        return 1 - chknm(self.cache.tele(index).mRearBrakeBias)
 
     def pressure(self, index: int | None = None, scale: float = 1) -> list[float]:
         """Brake pressure (fraction)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mBrakePressure) * scale for data in wheel_data]
 
     def temperature(self, index: int | None = None) -> list[float]:
         """Brake temperature (Celsius)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mBrakeTemp) - 273.15 for data in wheel_data]
 
 
@@ -125,27 +310,27 @@ class ElectricMotor(DataAdapter):
 
     def state(self, index: int | None = None) -> int:
         """Motor state, 0 = n/a, 1 = off, 2 = drain, 3 = regen"""
-        return chknm(self.info.rf2TeleVeh(index).mElectricBoostMotorState)
+        return chknm(self.cache.tele(index).mElectricBoostMotorState)
 
     def battery_charge(self, index: int | None = None) -> float:
         """Battery charge (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mBatteryChargeFraction)
+        return chknm(self.cache.tele(index).mBatteryChargeFraction)
 
     def rpm(self, index: int | None = None) -> float:
         """Motor RPM (rev per minute)"""
-        return chknm(self.info.rf2TeleVeh(index).mElectricBoostMotorRPM)
+        return chknm(self.cache.tele(index).mElectricBoostMotorRPM)
 
     def torque(self, index: int | None = None) -> float:
         """Motor torque (Nm)"""
-        return chknm(self.info.rf2TeleVeh(index).mElectricBoostMotorTorque)
+        return chknm(self.cache.tele(index).mElectricBoostMotorTorque)
 
     def motor_temperature(self, index: int | None = None) -> float:
         """Motor temperature (Celsius)"""
-        return chknm(self.info.rf2TeleVeh(index).mElectricBoostMotorTemperature)
+        return chknm(self.cache.tele(index).mElectricBoostMotorTemperature)
 
     def water_temperature(self, index: int | None = None) -> float:
         """Motor water temperature (Celsius)"""
-        return chknm(self.info.rf2TeleVeh(index).mElectricBoostWaterTemperature)
+        return chknm(self.cache.tele(index).mElectricBoostWaterTemperature)
 
 
 class Engine(DataAdapter):
@@ -155,35 +340,35 @@ class Engine(DataAdapter):
 
     def gear(self, index: int | None = None) -> int:
         """Gear"""
-        return chknm(self.info.rf2TeleVeh(index).mGear)
+        return chknm(self.cache.tele(index).mGear)
 
     def gear_max(self, index: int | None = None) -> int:
         """Max gear"""
-        return chknm(self.info.rf2TeleVeh(index).mMaxGears)
+        return chknm(self.cache.tele(index).mMaxGears)
 
     def rpm(self, index: int | None = None) -> float:
         """RPM (rev per minute)"""
-        return chknm(self.info.rf2TeleVeh(index).mEngineRPM)
+        return chknm(self.cache.tele(index).mEngineRPM)
 
     def rpm_max(self, index: int | None = None) -> float:
         """Max RPM (rev per minute)"""
-        return chknm(self.info.rf2TeleVeh(index).mEngineMaxRPM)
+        return chknm(self.cache.tele(index).mEngineMaxRPM)
 
     def torque(self, index: int | None = None) -> float:
         """Torque (Nm)"""
-        return chknm(self.info.rf2TeleVeh(index).mEngineTorque)
+        return chknm(self.cache.tele(index).mEngineTorque)
 
     def turbo(self, index: int | None = None) -> float:
         """Turbo pressure (Pa)"""
-        return chknm(self.info.rf2TeleVeh(index).mTurboBoostPressure)
+        return chknm(self.cache.tele(index).mTurboBoostPressure)
 
     def oil_temperature(self, index: int | None = None) -> float:
         """Oil temperature (Celsius)"""
-        return chknm(self.info.rf2TeleVeh(index).mEngineOilTemp)
+        return chknm(self.cache.tele(index).mEngineOilTemp)
 
     def water_temperature(self, index: int | None = None) -> float:
         """Water temperature (Celsius)"""
-        return chknm(self.info.rf2TeleVeh(index).mEngineWaterTemp)
+        return chknm(self.cache.tele(index).mEngineWaterTemp)
 
 
 class Inputs(DataAdapter):
@@ -193,47 +378,47 @@ class Inputs(DataAdapter):
 
     def throttle(self, index: int | None = None) -> float:
         """Throttle filtered (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mFilteredThrottle)
+        return chknm(self.cache.tele(index).mFilteredThrottle)
 
     def throttle_raw(self, index: int | None = None) -> float:
         """Throttle raw (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mUnfilteredThrottle)
+        return chknm(self.cache.tele(index).mUnfilteredThrottle)
 
     def brake(self, index: int | None = None) -> float:
         """Brake filtered (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mFilteredBrake)
+        return chknm(self.cache.tele(index).mFilteredBrake)
 
     def brake_raw(self, index: int | None = None) -> float:
         """Brake raw (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mUnfilteredBrake)
+        return chknm(self.cache.tele(index).mUnfilteredBrake)
 
     def clutch(self, index: int | None = None) -> float:
         """Clutch filtered (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mFilteredClutch)
+        return chknm(self.cache.tele(index).mFilteredClutch)
 
     def clutch_raw(self, index: int | None = None) -> float:
         """Clutch raw (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mUnfilteredClutch)
+        return chknm(self.cache.tele(index).mUnfilteredClutch)
 
     def steering(self, index: int | None = None) -> float:
         """Steering filtered (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mFilteredSteering)
+        return chknm(self.cache.tele(index).mFilteredSteering)
 
     def steering_raw(self, index: int | None = None) -> float:
         """Steering raw (fraction)"""
-        return chknm(self.info.rf2TeleVeh(index).mUnfilteredSteering)
+        return chknm(self.cache.tele(index).mUnfilteredSteering)
 
     def steering_shaft_torque(self, index: int | None = None) -> float:
         """Steering shaft torque (Nm)"""
-        return chknm(self.info.rf2TeleVeh(index).mSteeringShaftTorque)
+        return chknm(self.cache.tele(index).mSteeringShaftTorque)
 
     def steering_range_physical(self, index: int | None = None) -> float:
         """Steering physical rotation range (degrees)"""
-        return chknm(self.info.rf2TeleVeh(index).mPhysicalSteeringWheelRange)
+        return chknm(self.cache.tele(index).mPhysicalSteeringWheelRange)
 
     def steering_range_visual(self, index: int | None = None) -> float:
         """Steering visual rotation range (degrees)"""
-        return chknm(self.info.rf2TeleVeh(index).mVisualSteeringWheelRange)
+        return chknm(self.cache.tele(index).mVisualSteeringWheelRange)
 
     def force_feedback(self) -> float:
         """Steering force feedback (fraction)"""
@@ -247,41 +432,41 @@ class Lap(DataAdapter):
 
     def number(self, index: int | None = None) -> int:
         """Current lap number"""
-        return chknm(self.info.rf2TeleVeh(index).mLapNumber)
+        return chknm(self.cache.tele(index).mLapNumber)
 
     def completed_laps(self, index: int | None = None) -> int:
         """Total completed laps"""
-        return chknm(self.info.rf2ScorVeh(index).mTotalLaps)
+        return chknm(self.cache.scor(index).mTotalLaps)
 
     def track_length(self) -> float:
         """Full lap or track length (meters)"""
-        return chknm(self.info.rf2ScorInfo.mLapDist)
+        return chknm(self.cache.scor_info().mLapDist)
 
     def distance(self, index: int | None = None) -> float:
         """Distance into lap (meters)"""
-        return chknm(self.info.rf2ScorVeh(index).mLapDist)
+        return chknm(self.cache.scor(index).mLapDist)
 
     def progress(self, index: int | None = None) -> float:
         """Lap progress (fraction), distance into lap"""
         return lap_progress_distance(
-            chknm(self.info.rf2ScorVeh(index).mLapDist),
-            chknm(self.info.rf2ScorInfo.mLapDist))
+            chknm(self.cache.scor(index).mLapDist),
+            chknm(self.cache.scor_info().mLapDist))
 
     def maximum(self) -> int:
         """Maximum lap"""
-        return chknm(self.info.rf2ScorInfo.mMaxLaps)
+        return chknm(self.cache.scor_info().mMaxLaps)
 
     def sector_index(self, index: int | None = None) -> int:
         """Sector index, convert to 0,1,2 order"""
-        return RF2_SECTORS[int(chknm(self.info.rf2ScorVeh(index).mSector))]
+        return RF2_SECTORS[int(chknm(self.cache.scor(index).mSector))]
 
     def behind_leader(self, index: int | None = None) -> int:
         """Laps behind leader"""
-        return chknm(self.info.rf2ScorVeh(index).mLapsBehindLeader)
+        return chknm(self.cache.scor(index).mLapsBehindLeader)
 
     def behind_next(self, index: int | None = None) -> int:
         """Laps behind next place"""
-        return chknm(self.info.rf2ScorVeh(index).mLapsBehindNext)
+        return chknm(self.cache.scor(index).mLapsBehindNext)
 
 
 class Session(DataAdapter):
@@ -291,15 +476,15 @@ class Session(DataAdapter):
 
     def elapsed(self) -> float:
         """Session elapsed time (seconds)"""
-        return chknm(self.info.rf2ScorInfo.mCurrentET)
+        return chknm(self.cache.scor_info().mCurrentET)
 
     def start(self) -> float:
         """Session start time (seconds)"""
-        return chknm(self.info.rf2ScorInfo.mStartET)
+        return chknm(self.cache.scor_info().mStartET)
 
     def end(self) -> float:
         """Session end time (seconds)"""
-        return chknm(self.info.rf2ScorInfo.mEndET)
+        return chknm(self.cache.scor_info().mEndET)
 
     def remaining(self) -> float:
         """Session time remaining (seconds)"""
@@ -307,78 +492,78 @@ class Session(DataAdapter):
 
     def session_type(self) -> int:
         """Session type"""
-        return RF2_SESSION_TYPE[int(chknm(self.info.rf2ScorInfo.mSession))]
+        return RF2_SESSION_TYPE[int(chknm(self.cache.scor_info().mSession))]
 
     def lap_type(self) -> bool:
         """Is lap type session, false for time type"""
-        return chknm(self.info.rf2ScorInfo.mMaxLaps) < 99999
+        return chknm(self.cache.scor_info().mMaxLaps) < 99999
 
     def in_race(self) -> bool:
         """Is in race session"""
-        return chknm(self.info.rf2ScorInfo.mSession) > 9
+        return chknm(self.cache.scor_info().mSession) > 9
 
     def in_countdown(self) -> bool:
         """Is in countdown phase before race"""
-        return self.info.rf2ScorInfo.mGamePhase == 4
+        return self.cache.scor_info().mGamePhase == 4
 
     def in_formation(self) -> bool:
         """Is in formation phase before race"""
-        return self.info.rf2ScorInfo.mGamePhase == 3
+        return self.cache.scor_info().mGamePhase == 3
 
     def pit_open(self) -> bool:
         """Is pit lane open"""
-        return chknm(self.info.rf2ScorInfo.mGamePhase) > 0
+        return chknm(self.cache.scor_info().mGamePhase) > 0
 
     def green_flag(self) -> bool:
         """Green flag"""
         # Inaccurate due to 5FPS refresh rate from API
-        return self.info.rf2ScorInfo.mGamePhase == 5
+        return self.cache.scor_info().mGamePhase == 5
 
     def blue_flag(self, index: int | None = None) -> bool:
         """Is under blue flag"""
-        return self.info.rf2ScorVeh(index).mFlag == 6
+        return self.cache.scor(index).mFlag == 6
 
     def yellow_flag(self) -> bool:
         """Is there yellow flag in any sectors"""
-        sec_flag = self.info.rf2ScorInfo.mSectorFlag
+        sec_flag = self.cache.scor_info().mSectorFlag
         return any(data == 1 for data in sec_flag)
 
     def start_lights(self) -> int:
         """Start lights countdown sequence"""
-        scor = self.info.rf2ScorInfo
+        scor = self.cache.scor_info()
         return chknm(scor.mNumRedLights) - chknm(scor.mStartLight) + 1
 
     def track_name(self) -> str:
         """Track name"""
-        return cs2py(self.info.rf2ScorInfo.mTrackName)
+        return cs2py(self.cache.scor_info().mTrackName)
 
     def track_temperature(self) -> float:
         """Track temperature (Celsius)"""
-        return chknm(self.info.rf2ScorInfo.mTrackTemp)
+        return chknm(self.cache.scor_info().mTrackTemp)
 
     def ambient_temperature(self) -> float:
         """Ambient temperature (Celsius)"""
-        return chknm(self.info.rf2ScorInfo.mAmbientTemp)
+        return chknm(self.cache.scor_info().mAmbientTemp)
 
     def raininess(self) -> float:
         """Rain severity (fraction)"""
-        return chknm(self.info.rf2ScorInfo.mRaining)
+        return chknm(self.cache.scor_info().mRaining)
 
     def wetness_minimum(self) -> float:
         """Road minimum wetness (fraction)"""
-        return chknm(self.info.rf2ScorInfo.mMinPathWetness)
+        return chknm(self.cache.scor_info().mMinPathWetness)
 
     def wetness_maximum(self) -> float:
         """Road maximum wetness (fraction)"""
-        return chknm(self.info.rf2ScorInfo.mMaxPathWetness)
+        return chknm(self.cache.scor_info().mMaxPathWetness)
 
     def wetness_average(self) -> float:
         """Road average wetness (fraction)"""
-        return chknm(self.info.rf2ScorInfo.mAvgPathWetness)
+        return chknm(self.cache.scor_info().mAvgPathWetness)
 
     def wetness(self) -> tuple[float, float, float]:
         """Road wetness set (fraction)"""
-        scor = self.info.rf2ScorInfo
+        scor = self.cache.scor_info()
         return (chknm(scor.mMinPathWetness),
                 chknm(scor.mMaxPathWetness),
                 chknm(scor.mAvgPathWetness))
@@ -391,19 +576,19 @@ class Switch(DataAdapter):
 
     def headlights(self, index: int | None = None) -> int:
         """Headlights"""
-        return chknm(self.info.rf2TeleVeh(index).mHeadlights)
+        return chknm(self.cache.tele(index).mHeadlights)
 
     def ignition_starter(self, index: int | None = None) -> int:
         """Ignition"""
-        return chknm(self.info.rf2TeleVeh(index).mIgnitionStarter)
+        return chknm(self.cache.tele(index).mIgnitionStarter)
 
     def speed_limiter(self, index: int | None = None) -> int:
         """Speed limiter"""
-        return chknm(self.info.rf2TeleVeh(index).mSpeedLimiter)
+        return chknm(self.cache.tele(index).mSpeedLimiter)
 
     def drs_status(self, index: int | None = None) -> int:
         """DRS status, 0 not_available, 1 available, 2 allowed(not activated), 3 activated"""
-        tele_veh = self.info.rf2TeleVeh(index)
+        tele_veh = self.cache.tele(index)
         status = tele_veh.mRearFlapLegalStatus
         if status == 1:
             return 1  # available
@@ -425,64 +610,64 @@ class Timing(DataAdapter):
 
     def start(self, index: int | None = None) -> float:
         """Current lap start time (seconds)"""
-        return chknm(self.info.rf2TeleVeh(index).mLapStartET)
+        return chknm(self.cache.tele(index).mLapStartET)
 
     def elapsed(self, index: int | None = None) -> float:
         """Current lap elapsed time (seconds)"""
-        return chknm(self.info.rf2TeleVeh(index).mElapsedTime)
+        return chknm(self.cache.tele(index).mElapsedTime)
 
     def current_laptime(self, index: int | None = None) -> float:
         """Current lap time (seconds)"""
-        tele_veh = self.info.rf2TeleVeh(index)
+        tele_veh = self.cache.tele(index)
         return chknm(tele_veh.mElapsedTime) - chknm(tele_veh.mLapStartET)
 
     def last_laptime(self, index: int | None = None) -> float:
         """Last lap time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mLastLapTime)
+        return chknm(self.cache.scor(index).mLastLapTime)
 
     def best_laptime(self, index: int | None = None) -> float:
         """Best lap time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mBestLapTime)
+        return chknm(self.cache.scor(index).mBestLapTime)
 
     def estimated_laptime(self, index: int | None = None) -> float:
         """Estimated lap time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mEstimatedLapTime)
+        return chknm(self.cache.scor(index).mEstimatedLapTime)
 
     def estimated_time_into(self, index: int | None = None) -> float:
         """Estimated time into lap (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mTimeIntoLap)
+        return chknm(self.cache.scor(index).mTimeIntoLap)
 
     def current_sector1(self, index: int | None = None) -> float:
         """Current lap sector 1 time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mCurSector1)
+        return chknm(self.cache.scor(index).mCurSector1)
 
     def current_sector2(self, index: int | None = None) -> float:
         """Current lap sector 1+2 time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mCurSector2)
+        return chknm(self.cache.scor(index).mCurSector2)
 
     def last_sector1(self, index: int | None = None) -> float:
         """Last lap sector 1 time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mLastSector1)
+        return chknm(self.cache.scor(index).mLastSector1)
 
     def last_sector2(self, index: int | None = None) -> float:
         """Last lap sector 1+2 time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mLastSector2)
+        return chknm(self.cache.scor(index).mLastSector2)
 
     def best_sector1(self, index: int | None = None) -> float:
         """Best lap sector 1 time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mBestSector1)
+        return chknm(self.cache.scor(index).mBestSector1)
 
     def best_sector2(self, index: int | None = None) -> float:
         """Best lap sector 1+2 time (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mBestSector2)
+        return chknm(self.cache.scor(index).mBestSector2)
 
     def behind_leader(self, index: int | None = None) -> float:
         """Time behind leader (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mTimeBehindLeader)
+        return chknm(self.cache.scor(index).mTimeBehindLeader)
 
     def behind_next(self, index: int | None = None) -> float:
         """Time behind next place (seconds)"""
-        return chknm(self.info.rf2ScorVeh(index).mTimeBehindNext)
+        return chknm(self.cache.scor(index).mTimeBehindNext)
 
 
 class Tyre(DataAdapter):
@@ -492,33 +677,33 @@ class Tyre(DataAdapter):
 
     def compound_front(self, index: int | None = None) -> int:
         """Tyre compound (front)"""
-        return chknm(self.info.rf2TeleVeh(index).mFrontTireCompoundIndex)
+        return chknm(self.cache.tele(index).mFrontTireCompoundIndex)
 
     def compound_rear(self, index: int | None = None) -> int:
         """Tyre compound (rear)"""
-        return chknm(self.info.rf2TeleVeh(index).mRearTireCompoundIndex)
+        return chknm(self.cache.tele(index).mRearTireCompoundIndex)
 
     def compound(self, index: int | None = None) -> tuple[int, int]:
         """Tyre compound set (front, rear)"""
-        tele_veh = self.info.rf2TeleVeh(index)
+        tele_veh = self.cache.tele(index)
         return chknm(tele_veh.mFrontTireCompoundIndex), chknm(tele_veh.mRearTireCompoundIndex)
 
     def compound_name_front(self, index: int | None = None) -> str:
         """Tyre compound name (front)"""
-        return cs2py(self.info.rf2TeleVeh(index).mFrontTireCompoundName)
+        return cs2py(self.cache.tele(index).mFrontTireCompoundName)
 
     def compound_name_rear(self, index: int | None = None) -> str:
         """Tyre compound name (rear)"""
-        return cs2py(self.info.rf2TeleVeh(index).mRearTireCompoundName)
+        return cs2py(self.cache.tele(index).mRearTireCompoundName)
 
     def compound_name(self, index: int | None = None) -> tuple[str, str]:
         """Tyre compound name set (front, rear)"""
-        tele_veh = self.info.rf2TeleVeh(index)
+        tele_veh = self.cache.tele(index)
         return cs2py(tele_veh.mFrontTireCompoundName), cs2py(tele_veh.mRearTireCompoundName)
 
     def surface_temperature_avg(self, index: int | None = None) -> list[float]:
         """Tyre surface temperature set (Celsius) average"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [
             chknm(mean(wheel_data[0].mTemperature)) - 273.15,
             chknm(mean(wheel_data[1].mTemperature)) - 273.15,
@@ -528,7 +713,7 @@ class Tyre(DataAdapter):
 
     def surface_temperature_ico(self, index: int | None = None) -> list[float]:
         """Tyre surface temperature set (Celsius) inner,center,outer"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [
             chknm(wheel_data[0].mTemperature[0]) - 273.15,
             chknm(wheel_data[0].mTemperature[1]) - 273.15,
@@ -546,7 +731,7 @@ class Tyre(DataAdapter):
 
     def inner_temperature_avg(self, index: int | None = None) -> list[float]:
         """Tyre inner temperature set (Celsius) average"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [
             chknm(mean(wheel_data[0].mTireInnerLayerTemperature)) - 273.15,
             chknm(mean(wheel_data[1].mTireInnerLayerTemperature)) - 273.15,
@@ -556,7 +741,7 @@ class Tyre(DataAdapter):
 
     def inner_temperature_ico(self, index: int | None = None) -> list[float]:
         """Tyre inner temperature set (Celsius) inner,center,outer"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [
             chknm(wheel_data[0].mTireInnerLayerTemperature[0]) - 273.15,
             chknm(wheel_data[0].mTireInnerLayerTemperature[1]) - 273.15,
@@ -574,22 +759,22 @@ class Tyre(DataAdapter):
 
     def pressure(self, index: int | None = None) -> list[float]:
         """Tyre pressure (kPa)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mPressure) for data in wheel_data]
 
     def load(self, index: int | None = None) -> list[float]:
         """Tyre load (Newtons)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mTireLoad) for data in wheel_data]
 
     def wear(self, index: int | None = None, scale: float = 1) -> list[float]:
         """Tyre wear (fraction)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mWear) * scale for data in wheel_data]
 
     def carcass_temperature(self, index: int | None = None) -> list[float]:
         """Tyre carcass temperature (Celsius)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mTireCarcassTemperature) - 273.15 for data in wheel_data]
 
 
@@ -604,7 +789,7 @@ class Vehicle(DataAdapter):
 
     def is_driving(self) -> bool:
         """Is local player driving or in monitor"""
-        return self.info.rf2TeleVeh().mIgnitionStarter
+        return self.cache.tele().mIgnitionStarter
 
     def player_index(self) -> int:
         """Get Local player index"""
@@ -612,19 +797,19 @@ class Vehicle(DataAdapter):
 
     def slot_id(self, index: int | None = None) -> int:
         """Vehicle slot id"""
-        return chknm(self.info.rf2ScorVeh(index).mID)
+        return chknm(self.cache.scor(index).mID)
 
     def driver_name(self, index: int | None = None) -> str:
         """Driver name"""
-        return cs2py(self.info.rf2ScorVeh(index).mDriverName)
+        return cs2py(self.cache.scor(index).mDriverName)
 
     def vehicle_name(self, index: int | None = None) -> str:
         """Vehicle name"""
-        return cs2py(self.info.rf2ScorVeh(index).mVehicleName)
+        return cs2py(self.cache.scor(index).mVehicleName)
 
     def class_name(self, index: int | None = None) -> str:
         """Vehicle class name"""
-        return cs2py(self.info.rf2ScorVeh(index).mVehicleClass)
+        return cs2py(self.cache.scor(index).mVehicleClass)
 
     def same_class(self, index: int | None = None) -> bool:
         """Is same vehicle class"""
@@ -632,123 +817,123 @@ class Vehicle(DataAdapter):
 
     def total_vehicles(self) -> int:
         """Total vehicles"""
-        return chknm(self.info.rf2ScorInfo.mNumVehicles)
+        return chknm(self.cache.scor_info().mNumVehicles)
 
     def place(self, index: int | None = None) -> int:
         """Vehicle overall place"""
-        return chknm(self.info.rf2ScorVeh(index).mPlace)
+        return chknm(self.cache.scor(index).mPlace)
 
     def in_pits(self, index: int | None = None) -> bool:
         """Is in pits"""
-        return bool(self.info.rf2ScorVeh(index).mInPits)
+        return bool(self.cache.scor(index).mInPits)
 
     def in_garage(self, index: int | None = None) -> bool:
         """Is in garage"""
-        return bool(self.info.rf2ScorVeh(index).mInGarageStall)
+        return bool(self.cache.scor(index).mInGarageStall)
 
     def number_pitstops(self, index: int | None = None) -> int:
         """Number of pit stops"""
-        return chknm(self.info.rf2ScorVeh(index).mNumPitstops)
+        return chknm(self.cache.scor(index).mNumPitstops)
 
     def number_penalties(self, index: int | None = None) -> int:
         """Number of penalties"""
-        return chknm(self.info.rf2ScorVeh(index).mNumPenalties)
+        return chknm(self.cache.scor(index).mNumPenalties)
 
     def pit_state(self, index: int | None = None) -> int:
         """Pit state, 0 = none, 1 = request, 2 = entering, 3 = stopped, 4 = exiting"""
-        return chknm(self.info.rf2ScorVeh(index).mPitState)
+        return chknm(self.cache.scor(index).mPitState)
 
     def finish_state(self, index: int | None = None) -> int:
         """Finish state, 0 = none, 1 = finished, 2 = DNF, 3 = DQ"""
-        return chknm(self.info.rf2ScorVeh(index).mFinishStatus)
+        return chknm(self.cache.scor(index).mFinishStatus)
 
     def fuel(self, index: int | None = None) -> float:
         """Remaining fuel (liters)"""
-        return chknm(self.info.rf2TeleVeh(index).mFuel)
+        return chknm(self.cache.tele(index).mFuel)
 
     def tank_capacity(self, index: int | None = None) -> float:
         """Fuel tank capacity (liters)"""
-        return chknm(self.info.rf2TeleVeh(index).mFuelCapacity)
+        return chknm(self.cache.tele(index).mFuelCapacity)
 
     def orientation_yaw_radians(self, index: int | None = None) -> float:
         """Orientation yaw (radians)"""
-        ori = self.info.rf2TeleVeh(index).mOri[2]
+        ori = self.cache.tele(index).mOri[2]
         return oriyaw2rad(chknm(ori.x), chknm(ori.z))
 
     def position_xyz(self, index: int | None = None) -> tuple[float, float, float]:
         """Raw x,y,z position (meters)"""
-        pos = self.info.rf2TeleVeh(index).mPos
+        pos = self.cache.tele(index).mPos
         return chknm(pos.x), chknm(pos.y), chknm(pos.z)
 
     def position_longitudinal(self, index: int | None = None) -> float:
         """Longitudinal axis position (meters) related to world plane"""
-        return chknm(self.info.rf2TeleVeh(index).mPos.x)  # in RF2 coord system
+        return chknm(self.cache.tele(index).mPos.x)  # in RF2 coord system
 
     def position_lateral(self, index: int | None = None) -> float:
         """Lateral axis position (meters) related to world plane"""
-        return -chknm(self.info.rf2TeleVeh(index).mPos.z)  # in RF2 coord system
+        return -chknm(self.cache.tele(index).mPos.z)  # in RF2 coord system
 
     def position_vertical(self, index: int | None = None) -> float:
         """Vertical axis position (meters) related to world plane"""
-        return chknm(self.info.rf2TeleVeh(index).mPos.y)  # in RF2 coord system
+        return chknm(self.cache.tele(index).mPos.y)  # in RF2 coord system
 
     def accel_lateral(self, index: int | None = None) -> float:
         """Lateral acceleration (m/s^2)"""
-        return chknm(self.info.rf2TeleVeh(index).mLocalAccel.x)  # X in RF2 coord system
+        return chknm(self.cache.tele(index).mLocalAccel.x)  # X in RF2 coord system
 
     def accel_longitudinal(self, index: int | None = None) -> float:
         """Longitudinal acceleration (m/s^2)"""
-        return chknm(self.info.rf2TeleVeh(index).mLocalAccel.z)  # Z in RF2 coord system
+        return chknm(self.cache.tele(index).mLocalAccel.z)  # Z in RF2 coord system
 
     def accel_vertical(self, index: int | None = None) -> float:
         """Vertical acceleration (m/s^2)"""
-        return chknm(self.info.rf2TeleVeh(index).mLocalAccel.y)  # Y in RF2 coord system
+        return chknm(self.cache.tele(index).mLocalAccel.y)  # Y in RF2 coord system
 
     def velocity_lateral(self, index: int | None = None) -> float:
         """Lateral velocity (m/s) x"""
-        return chknm(self.info.rf2TeleVeh(index).mLocalVel.x)  # X in RF2 coord system
+        return chknm(self.cache.tele(index).mLocalVel.x)  # X in RF2 coord system
 
     def velocity_longitudinal(self, index: int | None = None) -> float:
         """Longitudinal velocity (m/s) y"""
-        return chknm(self.info.rf2TeleVeh(index).mLocalVel.z)  # Z in RF2 coord system
+        return chknm(self.cache.tele(index).mLocalVel.z)  # Z in RF2 coord system
 
     def velocity_vertical(self, index: int | None = None) -> float:
         """Vertical velocity (m/s) z"""
-        return chknm(self.info.rf2TeleVeh(index).mLocalVel.y)  # Y in RF2 coord system
+        return chknm(self.cache.tele(index).mLocalVel.y)  # Y in RF2 coord system
 
     def speed(self, index: int | None = None) -> float:
         """Speed (m/s)"""
-        vel = self.info.rf2TeleVeh(index).mLocalVel
+        vel = self.cache.tele(index).mLocalVel
         return vel2speed(chknm(vel.x), chknm(vel.y), chknm(vel.z))
 
     def downforce_front(self, index: int | None = None) -> float:
         """Downforce front (Newtons)"""
-        return chknm(self.info.rf2TeleVeh(index).mFrontDownforce)
+        return chknm(self.cache.tele(index).mFrontDownforce)
 
     def downforce_rear(self, index: int | None = None) -> float:
         """Downforce rear (Newtons)"""
-        return chknm(self.info.rf2TeleVeh(index).mRearDownforce)
+        return chknm(self.cache.tele(index).mRearDownforce)
 
     def damage_severity(self, index: int | None = None) -> tuple[int, ...]:
         """Damage severity, sort row by row from left to right, top to bottom"""
-        dmg = self.info.rf2TeleVeh(index).mDentSeverity
+        dmg = self.cache.tele(index).mDentSeverity
         return dmg[1], dmg[0], dmg[7], dmg[2], dmg[6], dmg[3], dmg[4], dmg[5]  # RF2 order
 
     def is_detached(self, index: int | None = None) -> bool:
         """Whether any vehicle parts are detached"""
-        return bool(self.info.rf2TeleVeh(index).mDetached)
+        return bool(self.cache.tele(index).mDetached)
 
     def impact_time(self, index: int | None = None) -> float:
         """Last impact time stamp (seconds)"""
-        return chknm(self.info.rf2TeleVeh(index).mLastImpactET)
+        return chknm(self.cache.tele(index).mLastImpactET)
 
     def impact_magnitude(self, index: int | None = None) -> float:
         """Last impact magnitude"""
-        return chknm(self.info.rf2TeleVeh(index).mLastImpactMagnitude)
+        return chknm(self.cache.tele(index).mLastImpactMagnitude)
 
     def impact_position(self, index: int | None = None) -> tuple[float, float]:
         """Last impact position x,y coordinates"""
-        pos = self.info.rf2TeleVeh(index).mLastImpactPos
+        pos = self.cache.tele(index).mLastImpactPos
         return -chknm(pos.x), chknm(pos.z)
 
 
@@ -759,17 +944,17 @@ class Wheel(DataAdapter):
 
     def camber(self, index: int | None = None) -> list[float]:
         """Wheel camber (radians)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mCamber) for data in wheel_data]
 
     def toe(self, index: int | None = None) -> list[float]:
         """Wheel toe (radians)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mToe) for data in wheel_data]
 
     def toe_symmetric(self, index: int | None = None) -> list[float]:
         """Wheel toe symmetric (radians)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(wheel_data[0].mToe),
                 -chknm(wheel_data[1].mToe),
                 chknm(wheel_data[2].mToe),
@@ -777,68 +962,68 @@ class Wheel(DataAdapter):
 
     def rotation(self, index: int | None = None) -> list[float]:
         """Wheel rotation (radians per second)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mRotation) for data in wheel_data]
 
     def velocity_lateral(self, index: int | None = None) -> list[float]:
         """Lateral velocity (m/s) x"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mLateralGroundVel) for data in wheel_data]
 
     def velocity_longitudinal(self, index: int | None = None) -> list[float]:
         """Longitudinal velocity (m/s) y"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mLongitudinalGroundVel) for data in wheel_data]
 
     def slip_angle_fl(self, index: int | None = None) -> float:
         """Slip angle (radians) front left"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels[0]
+        wheel_data = self.cache.wheels(index)[0]
         return slip_angle(
             chknm(wheel_data.mLateralGroundVel),
             chknm(wheel_data.mLongitudinalGroundVel))
 
     def slip_angle_fr(self, index: int | None = None) -> float:
         """Slip angle (radians) front right"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels[1]
+        wheel_data = self.cache.wheels(index)[1]
         return slip_angle(
             chknm(wheel_data.mLateralGroundVel),
             chknm(wheel_data.mLongitudinalGroundVel))
 
     def slip_angle_rl(self, index: int | None = None) -> float:
         """Slip angle (radians) rear left"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels[2]
+        wheel_data = self.cache.wheels(index)[2]
         return slip_angle(
             chknm(wheel_data.mLateralGroundVel),
             chknm(wheel_data.mLongitudinalGroundVel))
 
     def slip_angle_rr(self, index: int | None = None) -> float:
         """Slip angle (radians) rear right"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels[3]
+        wheel_data = self.cache.wheels(index)[3]
         return slip_angle(
             chknm(wheel_data.mLateralGroundVel),
             chknm(wheel_data.mLongitudinalGroundVel))
 
     def ride_height(self, index: int | None = None) -> list[float]:
         """Ride height (millmeters)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [meter2millmeter(chknm(data.mRideHeight)) for data in wheel_data]
 
     def suspension_deflection(self, index: int | None = None) -> list[float]:
         """Suspension deflection (millmeters)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [meter2millmeter(chknm(data.mSuspensionDeflection)) for data in wheel_data]
 
     def suspension_force(self, index: int | None = None) -> list[float]:
         """Suspension force (Newtons)"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [chknm(data.mSuspForce) for data in wheel_data]
 
     def is_detached(self, index: int | None = None) -> list[bool]:
         """Whether wheel is detached"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return [bool(data.mDetached) for data in wheel_data]
 
     def is_offroad(self, index: int | None = None) -> bool:
         """Whether all wheels are complete offroad"""
-        wheel_data = self.info.rf2TeleVeh(index).mWheels
+        wheel_data = self.cache.wheels(index)
         return all(2 <= chknm(data.mSurfaceType) <= 4 for data in wheel_data)
@@ -50,19 +50,20 @@ class APIDataSet(NamedTuple):
 
 def set_dataset_rf2(info: rF2MMap.RF2SM) -> APIDataSet:
     """Set API data set - RF2"""
+    cache = rfactor2.VehicleCache(info)
     return APIDataSet(
-        rfactor2.Check(info),
-        rfactor2.Brake(info),
-        rfactor2.ElectricMotor(info),
-        rfactor2.Engine(info),
-        rfactor2.Inputs(info),
-        rfactor2.Lap(info),
-        rfactor2.Session(info),
-        rfactor2.Switch(info),
-        rfactor2.Timing(info),
-        rfactor2.Tyre(info),
-        rfactor2.Vehicle(info),
-        rfactor2.Wheel(info),
+        rfactor2.Check(info, cache),
+        rfactor2.Brake(info, cache),
+        rfactor2.ElectricMotor(info, cache),
+        rfactor2.Engine(info, cache),
+        rfactor2.Inputs(info, cache),
+        rfactor2.Lap(info, cache),
+        rfactor2.Session(info, cache),
+        rfactor2.Switch(info, cache),
+        rfactor2.Timing(info, cache),
+        rfactor2.Tyre(info, cache),
+        rfactor2.Vehicle(info, cache),
+        rfactor2.Wheel(info, cache),
     )
 
 
@@ -114,6 +115,7 @@ class SimRF2(Connector):
         self.info.setPlayerOverride(config[2])
         self.info.setPlayerIndex(config[3])
         rfactor2.cs2py = partial(val.cbytes2str, char_encoding=config[4])
+        rfactor2.snapshot_buffer = config[0] == 1  # direct access mode
 
 
 class SimLMU(Connector):
@@ -140,6 +142,7 @@ class SimLMU(Connector):
         self.info.setPlayerOverride(config[2])
         self.info.setPlayerIndex(config[3])
         rfactor2.cs2py = partial(val.cbytes2str, char_encoding=config[4])
+        rfactor2.snapshot_buffer = config[0] == 1  # direct access mode
 
 
 # Add new API to API_PACK
@@ -21,8 +21,9 @@ Calculation function
 """
 
 from __future__ import annotations
+from array import array
 from typing import Tuple, Sequence
-from math import dist, hypot, degrees, radians, atan, atan2, sin, cos, acos, ceil
+from math import dist, hypot, degrees, radians, atan, atan2, sin, cos, acos, ceil, floor, inf
 from statistics import fmean, stdev
 
 CoordXY = Tuple[float, float]
@@ -572,6 +573,121 @@ def svg_view_box(coords: Sequence[CoordXY], margin: int = 0) -> str:
     return f"{x1:.4f} {y1:.4f} {x2:.4f} {y2:.4f}"
 
 
+def grid_segments(coords: Sequence[CoordXY], cell_size: float, closed: bool = False):
+    """Split coordinates into grid cells of polylines (spatial index)
+
+    Each segment is added to all cells covered by its bounding box,
+    consecutive segments in same cell are joined into one polyline.
+
+    Args:
+        coords: coordinates list.
+        cell_size: grid cell size.
+        closed: whether to add segment from last to first coordinates.
+
+    Returns:
+        Dict of cell (x index, y index) & list of polylines.
+    """
+    cells = {}
+    last_index = {}
+    total = len(coords)
+    for index in range(total if closed and total > 2 else total - 1):
+        coord_a = coords[index]
+        coord_b = coords[(index + 1) % total]
+        x_min, x_max = sorted((int(coord_a[0] // cell_size), int(coord_b[0] // cell_size)))
+        y_min, y_max = sorted((int(coord_a[1] // cell_size), int(coord_b[1] // cell_size)))
+        for cell_x in range(x_min, x_max + 1):
+            for cell_y in range(y_min, y_max + 1):
+                cell = cell_x, cell_y
+                polylines = cells.get(cell, None)
+                if polylines is None:
+                    cells[cell] = [[coord_a, coord_b]]
+                elif last_index[cell] == index:
+                    polylines[-1].append(coord_b)
+                else:
+                    polylines.append([coord_a, coord_b])
+                last_index[cell] = index + 1
+    return cells
+
+
+def grid_cells(
+    x_min: float, x_max: float, y_min: float, y_max: float, cell_size: float) -> frozenset:
+    """Grid cells (x index, y index) covered by rectangle area"""
+    return frozenset(
+        (cell_x, cell_y)
+        for cell_x in range(floor(x_min / cell_size), floor(x_max / cell_size) + 1)
+        for cell_y in range(floor(y_min / cell_size), floor(y_max / cell_size) + 1)
+    )
+
+
+def polyline_importance(coords: Sequence[CoordXY], vertical: bool = False) -> array:
+    """Calculate node importance for polyline simplification (Douglas-Peucker)
+
+    Importance is the largest deviation tolerance at which node is still kept,
+    capped by parent node importance, so that simplified levels are nested.
+
+    Args:
+        coords: coordinates list.
+        vertical: measure vertical deviation (for plot) instead of perpendicular distance.
+
+    Returns:
+        Node importance array, first & last node are always kept (inf).
+    """
+    total = len(coords)
+    importance = array("d", [0.0]) * total
+    if total < 1:
+        return importance
+    importance[0] = importance[-1] = inf
+    stack = [(0, total - 1, inf)]
+    while stack:
+        first, last, parent = stack.pop()
+        if last - first < 2:
+            continue
+        x1, y1 = coords[first]
+        x2, y2 = coords[last]
+        dx = x2 - x1
+        dy = y2 - y1
+        if vertical:
+            slope = dy / dx if dx else 0
+        else:
+            length_sq = dx * dx + dy * dy
+        max_dev = -1.0
+        max_index = first + 1
+        for index in range(first + 1, last):
+            x0, y0 = coords[index]
+            if vertical:
+                dev = abs(y0 - y1 - (x0 - x1) * slope)
+            elif length_sq:
+                ratio = min(max(((x0 - x1) * dx + (y0 - y1) * dy) / length_sq, 0), 1)
+                dev = hypot(x0 - x1 - ratio * dx, y0 - y1 - ratio * dy)
+            else:
+                dev = hypot(x0 - x1, y0 - y1)
+            if dev > max_dev:
+                max_dev = dev
+                max_index = index
+        if max_dev > parent:
+            max_dev = parent
+        importance[max_index] = max_dev
+        stack.append((first, max_index, max_dev))
+        stack.append((max_index, last, max_dev))
+    return importance
+
+
+def simplify_nodes(coords: Sequence[CoordXY], importance: Sequence[float], tolerance: float):
+    """Select nodes from coordinates list that exceed simplification tolerance
+
+    Args:
+        coords: coordinates list.
+        importance: node importance array, see polyline_importance().
+        tolerance: maximum deviation tolerance, 0 for full detail.
+
+    Returns:
+        Simplified coordinates list.
+    """
+    if tolerance <= 0:
+        return list(coords)
+    return [coords for coords, value in zip(coords, importance) if value >= tolerance]
+
+
 def line_intersect_coords(
     coord_a: CoordXY, coord_b: CoordXY, rad: float, length: float):
     """Create intersect line coordinates from 2 coordinates
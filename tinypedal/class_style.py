@@ -0,0 +1,99 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vehicle class style
+"""
+
+from __future__ import annotations
+from typing import NamedTuple
+
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QBrush, QColor
+
+from .setting import cfg
+from .formatter import random_color_class
+
+
+class ClassStyle(NamedTuple):
+    """Vehicle class style"""
+
+    alias: str
+    color: str
+    brush: QBrush
+    is_preset: bool
+
+
+def create_class_style(alias: str, color: str, is_preset: bool) -> ClassStyle:
+    """Create vehicle class style
+
+    Args:
+        alias: class alias name.
+        color: class hex color string.
+        is_preset: whether class is defined in user classes preset.
+
+    Returns:
+        ClassStyle object.
+    """
+    return ClassStyle(
+        alias=alias,
+        color=color,
+        brush=QBrush(QColor(color), Qt.SolidPattern),
+        is_preset=is_preset,
+    )
+
+
+class ClassStyleRegistry:
+    """Vehicle class style registry
+
+    Compiled from user classes preset, shared by all widgets.
+    Unknown class name is added on first lookup with random color.
+    Call reset() after loading preset or modifying classes preset.
+    """
+
+    __slots__ = (
+        "_styles",
+    )
+
+    def __init__(self):
+        self._styles: dict[str, ClassStyle] = {}
+
+    def reset(self):
+        """Reset and compile styles from user classes preset"""
+        self._styles = {
+            class_name: create_class_style(style["alias"], style["color"], True)
+            for class_name, style in cfg.user.classes.items()
+        }
+
+    def select(self, class_name: str) -> ClassStyle:
+        """Select vehicle class style
+
+        Args:
+            class_name: vehicle class name.
+
+        Returns:
+            ClassStyle object.
+        """
+        style = self._styles.get(class_name, None)
+        if style is None:
+            style = create_class_style(class_name, random_color_class(class_name), False)
+            self._styles[class_name] = style
+        return style
+
+
+cstyle = ClassStyleRegistry()
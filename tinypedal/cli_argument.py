@@ -39,6 +39,17 @@ def get_cli_argument() -> argparse.Namespace:
             " 2 - output to file;"
         ),
     )
+    parse.add_argument(
+        "-f",
+        "--log-file-size",
+        default=0,
+        type=int,
+        help=(
+            "set maximum log file size (MB) before rotating,"
+            " only used with log level 2;"
+            " 0 - no rotating (default);"
+        ),
+    )
     parse.add_argument(
         "-s",
         "--single-instance",
@@ -0,0 +1,138 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Event bus
+"""
+
+from __future__ import annotations
+import logging
+import threading
+from collections import deque
+from typing import Iterator, NamedTuple
+
+# Event type
+LAP_COMPLETED = 1  # value = new lap start time, last value = last lap start time
+SECTOR_CROSSED = 2  # value = new sector index, last value = last sector index
+PIT_ENTRY = 3  # value = 1
+PIT_EXIT = 4  # value = 0
+SESSION_CHANGE = 5  # value = session stamp, index & slot id = -1
+
+MAX_QUEUED_EVENTS = 512
+
+logger = logging.getLogger(__name__)
+
+
+class Event(NamedTuple):
+    """Event data"""
+
+    type: int
+    index: int  # vehicle index at the moment of detection
+    slotID: int
+    value: float
+    lastValue: float  # value before change, such as last lap start time
+    distance: float  # lap distance at the moment of detection
+    elapsed: float  # session elapsed time
+
+
+class EventListener:
+    """Event listener
+
+    Events are queued until drained by subscriber from its own thread.
+    Oldest events are discarded and counted if exceeded maximum queued events.
+
+    Args:
+        event_types: subscribed event types.
+        max_events: maximum number of queued events.
+    """
+
+    __slots__ = (
+        "types",
+        "dropped",
+        "_events",
+    )
+
+    def __init__(self, event_types: frozenset[int], max_events: int = MAX_QUEUED_EVENTS):
+        self.types = event_types
+        self.dropped = 0
+        self._events: deque[Event] = deque(maxlen=max_events)
+
+    def put(self, event: Event):
+        """Put event to queue"""
+        events = self._events
+        if len(events) == events.maxlen:
+            self.dropped += 1
+        events.append(event)
+
+    def drain(self) -> Iterator[Event]:
+        """Get all queued events, in order of publish"""
+        events = self._events
+        while events:
+            yield events.popleft()
+
+    def clear(self):
+        """Clear queued events"""
+        self._events.clear()
+
+
+class EventBus:
+    """Event publish & subscribe bus
+
+    Publish is lock-free and only queues event to matching listeners,
+    so that publisher is never blocked by subscriber work.
+    """
+
+    __slots__ = (
+        "_listeners",
+        "_lock",
+    )
+
+    def __init__(self):
+        self._listeners: tuple[EventListener, ...] = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, *event_types: int) -> EventListener:
+        """Subscribe event types
+
+        Args:
+            event_types: event types, see event type constants.
+
+        Returns:
+            EventListener object.
+        """
+        listener = EventListener(frozenset(event_types))
+        with self._lock:
+            self._listeners = (*self._listeners, listener)
+        return listener
+
+    def unsubscribe(self, listener: EventListener):
+        """Unsubscribe listener, and report dropped events"""
+        with self._lock:
+            self._listeners = tuple(
+                _listener for _listener in self._listeners if _listener is not listener)
+        if listener.dropped:
+            logger.warning("EVENT BUS: %s event(s) dropped", listener.dropped)
+
+    def publish(self, event: Event):
+        """Publish event to listeners"""
+        for listener in self._listeners:
+            if event.type in listener.types:
+                listener.put(event)
+
+
+ebus = EventBus()
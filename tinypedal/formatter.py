@@ -80,7 +80,7 @@ def select_gear(index: int) -> str:
     return GEAR_SEQUENCE[index if -1 <= index <= 9 else 0]
 
 
-@lru_cache(maxsize=20)
+@lru_cache(maxsize=128)
 def random_color_class(name: str) -> str:
     """Generate random color for vehicle class"""
     random.seed(name)
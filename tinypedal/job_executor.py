@@ -0,0 +1,178 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background job executor
+"""
+
+from __future__ import annotations
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MAX_QUEUED_JOBS = 64
+SLOW_JOB_TIME = 0.5  # seconds, log job that takes longer
+
+
+class JobStats:
+    """Job timing stats"""
+
+    __slots__ = (
+        "count",
+        "failed",
+        "total_time",
+        "max_time",
+        "last_time",
+        "max_wait",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_time = 0.0
+        self.max_wait = 0.0
+
+    def add(self, run_time: float, wait_time: float, failed: bool):
+        """Add job timing"""
+        self.count += 1
+        self.failed += failed
+        self.total_time += run_time
+        self.last_time = run_time
+        if self.max_time < run_time:
+            self.max_time = run_time
+        if self.max_wait < wait_time:
+            self.max_wait = wait_time
+
+
+class JobExecutor:
+    """Background job executor
+
+    Runs post-lap work such as data serialization and file writing
+    from a single background thread in submitted order,
+    so that module update is not blocked by disk access.
+    Caller waits for queue space if queue is full.
+
+    Args:
+        max_queue: maximum number of queued jobs.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_thread",
+        "_lock",
+        "_stats",
+        "overflow",
+    )
+
+    def __init__(self, max_queue: int = MAX_QUEUED_JOBS):
+        self._queue = queue.Queue(max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats: dict[str, JobStats] = {}
+        self.overflow = 0
+
+    def submit(self, name: str, func: Callable, *args: Any, **kwargs: Any):
+        """Submit job, return immediately
+
+        Job arguments must not be modified by caller after submitted.
+
+        Args:
+            name: job name, for timing stats.
+            func: job function.
+            args: job function arguments.
+            kwargs: job function keyword arguments.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__running, daemon=True)
+                self._thread.start()
+        job = (name, func, args, kwargs, perf_counter())
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:  # wait for space, keep job order
+            self.overflow += 1
+            self._queue.put(job)
+
+    def stats(self) -> dict[str, JobStats]:
+        """Job timing stats, key = job name"""
+        with self._lock:
+            return self._stats.copy()
+
+    def close(self, timeout: float | None = None):
+        """Finish queued jobs and stop executor thread
+
+        Args:
+            timeout: maximum waiting time (seconds) for queued jobs,
+                None waits until all queued jobs finished (on APP close).
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            remaining = self._queue.qsize()
+            if remaining:
+                logger.info("JOBS: finishing %s queued job(s)", remaining)
+            self._queue.put(None)
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(
+                    "JOBS: %s queued job(s) unfinished after %ss",
+                    max(self._queue.qsize() - 1, 0), timeout)  # exclude stop sentinel
+        for name, stats in self.stats().items():
+            logger.info(
+                "JOBS: %s, %s run, %s failed, avg %.1fms, max %.1fms, max wait %.1fms",
+                name, stats.count, stats.failed, stats.total_time / max(stats.count, 1) * 1000,
+                stats.max_time * 1000, stats.max_wait * 1000)
+        if self.overflow:
+            logger.warning("JOBS: %s job(s) waited for full queue", self.overflow)
+
+    def __running(self):
+        """Executor thread"""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            self.__run(*job)
+
+    def __run(self, name: str, func: Callable, args: tuple, kwargs: dict, submitted: float):
+        """Run job & record timing"""
+        start = perf_counter()
+        failed = False
+        try:
+            func(*args, **kwargs)
+        except Exception:  # keep running other jobs
+            failed = True
+            logger.exception("JOBS: %s failed", name)
+        run_time = perf_counter() - start
+        with self._lock:
+            stats = self._stats.get(name, None)
+            if stats is None:
+                stats = self._stats[name] = JobStats()
+            stats.add(run_time, start - submitted, failed)
+        if run_time > SLOW_JOB_TIME:
+            logger.info("JOBS: %s took %.1fms", name, run_time * 1000)
+
+
+jobs = JobExecutor()
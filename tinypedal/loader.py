@@ -25,8 +25,12 @@ import signal
 
 from .setting import cfg
 from .api_control import api
+from .class_style import cstyle
+from .job_executor import jobs
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
+from .userfile.lap_history import lap_history
+from .userfile.state_journal import state_journal
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +45,7 @@ def start():
     cfg.filename.setting = f"{cfg.preset_list[0]}.json"
     cfg.load()
     cfg.save()
+    cstyle.reset()
     # 3 start api
     api.connect()
     api.start()
@@ -66,6 +71,12 @@ def close():
     unload_modules()
     # 2 stop api
     api.stop()
+    # 3 finish background jobs
+    jobs.close()
+    # 4 finish lap history writing
+    lap_history.close()
+    # 5 flush state journal
+    state_journal.close()
 
 
 def reload():
@@ -76,6 +87,7 @@ def reload():
     # 2 reload setting
     cfg.load()
     cfg.save(0)
+    cstyle.reset()
     # 3 restart api
     api.restart()
     # 4 load modules
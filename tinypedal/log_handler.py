@@ -20,18 +20,57 @@
 Log handler setup
 """
 
-import sys
+import atexit
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from .const import LOG_FILE, PATH_GLOBAL
 
+LOG_QUEUE_SIZE = 10000
+LOG_FILE_BACKUP_COUNT = 3
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Bounded queue handler
+
+    Records are put to queue without blocking,
+    and dropped if queue is full (writer is stalled by slow console or disk).
+
+    Args:
+        max_queue: maximum number of queued records.
+    """
+
+    def __init__(self, max_queue: int = LOG_QUEUE_SIZE):
+        super().__init__(queue.Queue(max_queue))
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        """Put record to queue, drop if full"""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriter(QueueListener):
+    """Background log writer
+
+    Writes queued records to all output handlers from a single thread.
+    """
+
+    def enqueue_sentinel(self):
+        """Wait for queue space, so that stop signal is never dropped"""
+        self.queue.put(self._sentinel)
+
 
-def new_stream_handler(_logger: logging.Logger, stream):
+def new_stream_handler(stream, level: int = logging.INFO) -> logging.Handler:
     """Create new stream handler
 
     Args:
-        _logger: logger instance.
         stream: stream object.
+        level: minimum logging level.
     Returns:
         Stream handler.
     """
@@ -40,32 +79,69 @@ def new_stream_handler(_logger: logging.Logger, stream):
     )
     _handler = logging.StreamHandler(stream)
     _handler.setFormatter(format_console)
-    _handler.setLevel(logging.INFO)
-    _logger.addHandler(_handler)
+    _handler.setLevel(level)
     return _handler
 
 
-def new_file_handler(_logger: logging.Logger, filepath: str, filename: str):
+def new_file_handler(filepath: str, filename: str, max_size: int = 0) -> logging.Handler:
     """Create new file handler
 
     Args:
-        _logger: logger instance.
         filepath: log file path.
         filename: log file name.
+        max_size: maximum log file size (MB) before rotating, 0 to disable rotating.
     Returns:
         File handler.
     """
     format_file = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
-    _handler = logging.FileHandler(f"{filepath}{filename}")
+    _handler = RotatingFileHandler(
+        f"{filepath}{filename}",
+        maxBytes=max(max_size, 0) * 1024 * 1024,
+        backupCount=LOG_FILE_BACKUP_COUNT if max_size > 0 else 0,
+        encoding="utf-8",
+    )
     _handler.setFormatter(format_file)
     _handler.setLevel(logging.INFO)
-    _logger.addHandler(_handler)
     return _handler
 
 
-def set_logging_level(_logger: logging.Logger, log_stream=None, log_level=1) -> None:
+def start_log_writer(_logger: logging.Logger, handlers: list) -> BoundedQueueHandler:
+    """Start background log writer
+
+    Args:
+        _logger: logger instance.
+        handlers: output handlers.
+    Returns:
+        Queue handler that attached to logger.
+    """
+    queue_handler = BoundedQueueHandler()
+    writer = LogWriter(queue_handler.queue, *handlers, respect_handler_level=True)
+    _logger.addHandler(queue_handler)
+    writer.start()
+
+    def stop_log_writer():
+        """Finish writing queued records"""
+        _logger.removeHandler(queue_handler)
+        writer.stop()
+        if queue_handler.dropped:
+            for _handler in handlers:
+                _handler.handle(_logger.makeRecord(
+                    _logger.name, logging.WARNING, __file__, 0,
+                    "LOGGING: %s record(s) dropped", (queue_handler.dropped,), None))
+        for _handler in handlers:
+            _handler.close()
+
+    atexit.register(stop_log_writer)
+    return queue_handler
+
+
+def set_logging_level(
+    _logger: logging.Logger, log_stream=None, log_level=1, log_file_size=0) -> None:
     """Set logging level
 
+    All output is written from a background thread,
+    so that slow console or disk never blocks logging thread.
+
     Args:
         _logger: logger instance.
         log_stream: log stream object.
@@ -73,16 +149,22 @@ def set_logging_level(_logger: logging.Logger, log_stream=None, log_level=1) ->
             0 = output only warning or error to console.
             1 = output all log to console.
             2 = output all log to both console & file.
+        log_file_size: maximum log file size (MB) before rotating, 0 to disable rotating.
     """
     _logger.setLevel(logging.INFO)
+    handlers = []
     if log_stream is not None:
-        new_stream_handler(_logger, log_stream)
+        handlers.append(new_stream_handler(log_stream))
 
-    if log_level == 1:
-        new_stream_handler(_logger, sys.stdout)
-        _logger.info("LOGGING: output to console")
-    elif log_level == 2:
-        new_stream_handler(_logger, sys.stdout)
+    if log_level == 0:
+        handlers.append(new_stream_handler(sys.stderr, logging.WARNING))
+    else:
+        handlers.append(new_stream_handler(sys.stdout))
+    if log_level == 2:
+        handlers.append(new_file_handler(PATH_GLOBAL, LOG_FILE, log_file_size))
+
+    start_log_writer(_logger, handlers)
+    if log_level >= 1:
         _logger.info("LOGGING: output to console")
-        new_file_handler(_logger, PATH_GLOBAL, LOG_FILE)
+    if log_level == 2:
         _logger.info("LOGGING: output to %s", LOG_FILE)
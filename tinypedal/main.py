@@ -131,7 +131,7 @@ def init_gui():
 def start_app():
     """Init main window"""
     cli_args = get_cli_argument()
-    set_logging_level(logger, log_stream, cli_args.log_level)
+    set_logging_level(logger, log_stream, cli_args.log_level, cli_args.log_file_size)
     # Main GUI
     root = init_gui()
     single_instance_check(cli_args.single_instance)
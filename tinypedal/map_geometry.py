@@ -0,0 +1,207 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Track map geometry
+"""
+
+from __future__ import annotations
+import threading
+from array import array
+from typing import Sequence
+
+from . import calculation as calc
+
+MAX_CACHED_GEOMETRY = 4
+MAP_PIXEL_TOLERANCE = 0.5  # pixels, map simplify tolerance at display scale
+
+
+class TrackProfile:
+    """Track geometry profile
+
+    Per-node curve & slope analysis of section that starts from each node.
+
+    Attributes:
+        section_nodes: number of nodes per section.
+        distance: cumulative distance (meters).
+        heading: heading angle (radians).
+        direction: turning direction, -1 = left, 1 = right, 0 = no turning.
+        radius: curve (osculating circle) radius (meters).
+        arc_angle: curve arc angle (degree).
+        center_x: curve center x position.
+        center_y: curve center y position.
+        length: section length (meters).
+        height: section height delta (meters).
+        gradient: section slope percent (fraction).
+    """
+
+    __slots__ = (
+        "section_nodes",
+        "distance",
+        "heading",
+        "direction",
+        "radius",
+        "arc_angle",
+        "center_x",
+        "center_y",
+        "length",
+        "height",
+        "gradient",
+    )
+
+    def __init__(
+        self, coords: Sequence[calc.CoordXY], dists: Sequence[calc.CoordXY], section_nodes: int):
+        total_nodes = min(len(coords), len(dists))
+        max_nodes = int(min(section_nodes, total_nodes - 2))
+        self.section_nodes = max_nodes
+        self.distance = array("d", (data[0] for data in dists[:total_nodes]))
+        self.heading = array("d", bytes(8 * total_nodes))
+        self.direction = array("b", bytes(total_nodes))
+        self.radius = array("d", bytes(8 * total_nodes))
+        self.arc_angle = array("d", bytes(8 * total_nodes))
+        self.center_x = array("d", bytes(8 * total_nodes))
+        self.center_y = array("d", bytes(8 * total_nodes))
+        self.length = array("d", bytes(8 * total_nodes))
+        self.height = array("d", bytes(8 * total_nodes))
+        self.gradient = array("d", bytes(8 * total_nodes))
+        if max_nodes < 2:
+            return
+
+        map_length = self.distance[-1]
+        mid_offset = int(max_nodes / 2)
+        for index in range(total_nodes):
+            # Same node selection as gen_section_path (viewer)
+            point_one = coords[index]
+            point_sec = coords[(index + 1) % total_nodes]
+            point_mid = coords[(index + mid_offset) % total_nodes]
+            point_end = coords[(index + max_nodes - 1) % total_nodes]
+            arc_center = calc.tri_coords_circle_center(*point_one, *point_mid, *point_end)
+            yaw_rad = calc.oriyaw2rad(
+                point_sec[1] - point_one[1], point_sec[0] - point_one[0])
+            self.heading[index] = yaw_rad
+            self.direction[index] = calc.turning_direction(yaw_rad, *point_one, *point_end)
+            self.radius[index] = calc.distance(point_one, arc_center)
+            self.arc_angle[index] = calc.quad_coords_angle(
+                arc_center, point_one, point_mid, point_end)
+            self.center_x[index], self.center_y[index] = arc_center
+            # Section length & height delta, wrap around start/finish line
+            end_index = index + max_nodes
+            if end_index >= total_nodes:
+                end_index -= total_nodes
+                length = map_length - dists[index][0] + dists[end_index][0]
+            else:
+                length = dists[end_index][0] - dists[index][0]
+            height = dists[end_index][1] - dists[index][1]
+            self.length[index] = length
+            self.height[index] = height
+            self.gradient[index] = calc.slope_percent(height, length)
+
+
+class MapGeometry:
+    """Shared track map geometry
+
+    Node importance (simplification pyramid) is built once per coordinates dataset,
+    and shared by all widgets, each widget selects nodes with tolerance
+    that matches its own pixel scale.
+
+    Track geometry profile is built once per coordinates & distance dataset
+    and section size.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_profiles",
+        "_lock",
+    )
+
+    def __init__(self):
+        self._cache: dict[tuple[int, bool], tuple[Sequence, array]] = {}
+        self._profiles: dict[tuple[int, int, int], tuple[Sequence, Sequence, TrackProfile]] = {}
+        self._lock = threading.Lock()
+
+    def importance(self, coords: Sequence[calc.CoordXY], vertical: bool = False) -> array:
+        """Get node importance of coordinates dataset, build if not cached
+
+        Args:
+            coords: coordinates dataset.
+            vertical: measure vertical deviation (for plot).
+
+        Returns:
+            Node importance array.
+        """
+        key = id(coords), vertical
+        with self._lock:
+            cached = self._cache.get(key, None)
+        if cached is not None and cached[0] is coords:
+            return cached[1]
+        importance = calc.polyline_importance(coords, vertical)
+        with self._lock:
+            if len(self._cache) >= MAX_CACHED_GEOMETRY:
+                self._cache.pop(next(iter(self._cache)))
+            # Keep dataset reference, so that id is not reused
+            self._cache[key] = coords, importance
+        return importance
+
+    def simplify(
+        self, coords: Sequence[calc.CoordXY], tolerance: float,
+        vertical: bool = False, source: Sequence[calc.CoordXY] | None = None) -> list:
+        """Simplify coordinates
+
+        Args:
+            coords: coordinates dataset to select nodes from.
+            tolerance: maximum deviation tolerance in source coordinates unit, 0 for full detail.
+            vertical: measure vertical deviation (for plot).
+            source: source (unscaled) coordinates dataset which node importance is built from,
+                must have same number of nodes as coords. Default is coords.
+
+        Returns:
+            Simplified coordinates list.
+        """
+        if tolerance <= 0:
+            return list(coords)
+        if source is None:
+            source = coords
+        return calc.simplify_nodes(coords, self.importance(source, vertical), tolerance)
+
+    def profile(
+        self, coords: Sequence[calc.CoordXY], dists: Sequence[calc.CoordXY],
+        section_nodes: int) -> TrackProfile:
+        """Get track geometry profile, build if not cached
+
+        Args:
+            coords: coordinates dataset.
+            dists: distance & elevation dataset.
+            section_nodes: number of nodes per curve section.
+
+        Returns:
+            TrackProfile object.
+        """
+        key = id(coords), id(dists), section_nodes
+        with self._lock:
+            cached = self._profiles.get(key, None)
+        if cached is not None and cached[0] is coords and cached[1] is dists:
+            return cached[2]
+        profile = TrackProfile(coords, dists, section_nodes)
+        with self._lock:
+            if len(self._profiles) >= MAX_CACHED_GEOMETRY:
+                self._profiles.pop(next(iter(self._profiles)))
+            self._profiles[key] = coords, dists, profile
+        return profile
+
+
+geometry = MapGeometry()
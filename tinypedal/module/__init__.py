@@ -27,11 +27,13 @@ in template/setting_module.py dictionary.
 __all__ = [
     "module_delta",
     "module_energy",
+    "module_events",
     "module_force",
     "module_fuel",
     "module_hybrid",
     "module_mapping",
     "module_notes",
+    "module_pace",
     "module_relative",
     "module_restapi",
     "module_sectors",
@@ -20,8 +20,12 @@
 Data module base
 """
 
+from __future__ import annotations
 import logging
 import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Hashable
 
 from ..overlay_control import octrl, OverlayState
 from ..setting import Setting
@@ -70,3 +74,59 @@ class DataModule:
 
     def update_data(self):
         """Update module data, rewrite in child class"""
+
+
+class VehicleSlots:
+    """Per-vehicle state slots
+
+    Keep module state of recently focused vehicles, so that switching
+    focused vehicle (such as in spectate mode) reuses existing state
+    instead of rebuilding from scratch. State of least recently focused
+    vehicle is removed once exceeded maximum slots.
+
+    Args:
+        factory: callable that creates new vehicle state.
+        max_slots: maximum number of tracked vehicles.
+    """
+
+    __slots__ = (
+        "_factory",
+        "_max_slots",
+        "_slots",
+        "_last_key",
+        "_last_state",
+    )
+
+    def __init__(self, factory: Callable[[], Any], max_slots: int):
+        self._factory = factory
+        self._max_slots = max(max_slots, 1)
+        self._slots: OrderedDict[Hashable, Any] = OrderedDict()
+        self._last_key = None
+        self._last_state = None
+
+    def select(self, key: Hashable) -> Any:
+        """Select vehicle state, create new state if not tracked
+
+        Args:
+            key: vehicle identifier.
+
+        Returns:
+            Vehicle state.
+        """
+        if key == self._last_key:
+            return self._last_state
+        state = self._slots.pop(key, None)
+        if state is None:
+            state = self._factory()
+        self._slots[key] = state
+        while len(self._slots) > self._max_slots:
+            self._slots.popitem(last=False)
+        self._last_key = key
+        self._last_state = state
+        return state
+
+    def clear(self):
+        """Clear all vehicle state"""
+        self._slots.clear()
+        self._last_key = None
+        self._last_state = None
@@ -20,18 +20,29 @@
 Delta module
 """
 
+import logging
 from functools import partial
 
 from ._base import DataModule
 from ..module_info import minfo
 from ..api_control import api
+from ..event_bus import ebus, LAP_COMPLETED
 from .. import calculation as calc
 from .. import validator as val
+from ..job_executor import jobs
 from ..userfile.delta_best import load_delta_best_file, save_delta_best_file
+from ..userfile.file_cache import file_cache
+from ..userfile.state_journal import state_journal, METERS_PENDING, METERS_SAVED
+from ..userfile.lap_history import lap_history
+
+logger = logging.getLogger(__name__)
 
 DELTA_ZERO = 0.0,0.0
 DELTA_DEFAULT = (DELTA_ZERO,)
 MAGIC_NUM = 99999
+MAX_CURSOR_STEPS = 8  # maximum forward cursor steps before binary search
+JOURNAL_KEY_METERS = "meters_driven"
+JOURNAL_METERS_STEP = 1000  # meters, driven distance journal interval
 
 round6 = partial(round, ndigits=6)
 
@@ -39,6 +50,8 @@ round6 = partial(round, ndigits=6)
 class Realtime(DataModule):
     """Delta time data"""
 
+    requires = ("module_events",)  # lap detection, started along with this module
+
     def __init__(self, config, module_name):
         super().__init__(config, module_name)
 
@@ -48,6 +61,7 @@ class Realtime(DataModule):
         update_interval = self.active_interval
 
         userpath_delta_best = self.cfg.path.delta_best
+        userpath_lap_history = self.cfg.path.lap_history
         output = minfo.delta
 
         last_session_id = ("",-1,-1,-1)
@@ -67,6 +81,12 @@ class Realtime(DataModule):
         )
         laptime_pace_margin = max(self.mcfg["laptime_pace_margin"], 0.1)
         gen_position_sync = val.position_sync()
+        delta_best_reader = DeltaReader()
+        delta_last_reader = DeltaReader()
+        delta_session_reader = DeltaReader()
+        delta_stint_reader = DeltaReader()
+        lap_events = ebus.subscribe(LAP_COMPLETED)
+        meters_saving = False  # waiting for driven distance config saved
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -89,7 +109,9 @@ class Realtime(DataModule):
                         laptime_session_best = MAGIC_NUM
                         last_session_id = (combo_id, *session_id)
 
-                    delta_list_best, laptime_best = load_delta_best_file(
+                    delta_list_best, laptime_best = file_cache.load(
+                        f"{userpath_delta_best}{combo_id}.csv",
+                        load_delta_best_file,
                         filepath=userpath_delta_best,
                         filename=combo_id,
                         defaults=(DELTA_DEFAULT, MAGIC_NUM)
@@ -107,7 +129,7 @@ class Realtime(DataModule):
                     laptime_last = 0.0  # last laptime
                     laptime_pace = laptime_best  # avearge laptime pace
 
-                    last_lap_stime = -1.0  # lap-start-time
+                    pos_lap_end = 0.0  # furthest vehicle position of current lap
                     pos_recorded = 0.0  # last recorded vehicle position
                     pos_last = 0.0  # last checked vehicle position
                     pos_estimate = 0.0  # estimated vehicle position
@@ -115,10 +137,20 @@ class Realtime(DataModule):
                     pos_synced_last = 0.0  # last synced estimated vehicle position
                     is_pos_synced = False  # vehicle position synced with API
                     gps_last = (0.0,0.0,0.0)  # last global position
-                    meters_driven = self.cfg.user.setting["cruise"]["meters_driven"]
+                    meters_config = self.cfg.user.setting["cruise"]["meters_driven"]
+                    meters_driven = meters_config
+                    # Replay unsaved driven distance (such as after crash),
+                    # only if counted from current config value, so that changed config value is kept
+                    journal_values = state_journal.pending(
+                        METERS_PENDING, METERS_SAVED, JOURNAL_KEY_METERS)
+                    if (journal_values is not None and journal_values[1] == meters_config and
+                        journal_values[0] > meters_driven):
+                        meters_driven = journal_values[0]
+                        logger.info("JOURNAL: driven distance restored")
+                    meters_journal = meters_driven
+                    lap_events.clear()
 
                 # Read telemetry
-                lap_stime = api.read.timing.start()
                 laptime_curr = max(api.read.timing.current_laptime(), 0)
                 laptime_valid = api.read.timing.last_laptime()
                 pos_curr = api.read.lap.distance()
@@ -132,28 +164,32 @@ class Realtime(DataModule):
                     laptime_stint_best = MAGIC_NUM
 
                 # Lap start & finish detection
-                if lap_stime > last_lap_stime != -1:
-                    laptime_last = lap_stime - last_lap_stime
+                player_slot_id = api.read.vehicle.slot_id()
+                for event in lap_events.drain():
+                    if event.slotID != player_slot_id:
+                        continue
+                    laptime_last = event.value - event.lastValue
                     if len(delta_list_raw) > 1:  # set end value
-                        delta_list_raw.append((round6(pos_last + 10), round6(laptime_last)))
+                        delta_list_raw.append((round6(pos_lap_end + 10), round6(laptime_last)))
                         delta_list_last = tuple(delta_list_raw)
                         validating = api.read.timing.elapsed()
                     delta_list_raw = [DELTA_ZERO]  # reset
-                    pos_last = pos_recorded = pos_curr
+                    pos_lap_end = pos_last = pos_recorded = pos_curr
                     recording = laptime_curr < 1
                     is_pit_lap = 0
-                last_lap_stime = lap_stime  # reset
 
                 # 1 sec position distance check after new lap begins
                 # Reset to 0 if higher than normal distance
                 if 0 < laptime_curr < 1 and pos_curr > 300:
-                    pos_last = pos_recorded = pos_curr = 0
+                    pos_lap_end = pos_last = pos_recorded = pos_curr = 0
 
                 # Update if position value is different & positive
                 if 0 <= pos_curr != pos_last:
                     if recording and pos_curr - pos_recorded >= min_delta_distance:
                         delta_list_raw.append((round6(pos_curr), round6(laptime_curr)))
                         pos_recorded = pos_curr
+                    if pos_lap_end < pos_curr:
+                        pos_lap_end = pos_curr
                     pos_last = pos_curr  # reset last position
                     is_pos_synced = True
 
@@ -163,6 +199,13 @@ class Realtime(DataModule):
                     if (1 < timer <= 10 and  # compare current time
                         laptime_valid > 0 and  # is valid laptime
                         int(laptime_valid - laptime_last) == 0):  # is matched laptime
+                        lap_history.record(
+                            filepath=userpath_lap_history,
+                            combo_id=combo_id,
+                            session_id=api.read.check.session_id(),
+                            lap=api.read.lap.completed_laps() - 1,
+                            laptime=laptime_last,
+                        )
                         # Update laptime pace
                         if not is_pit_lap:
                             # Set initial laptime if invalid, or align to faster laptime
@@ -177,7 +220,16 @@ class Realtime(DataModule):
                         if laptime_last < laptime_best:
                             laptime_best = laptime_last
                             output.deltaBestData = delta_list_best = delta_list_last
-                            save_delta_best_file(
+                            # Store data to file cache first, in case reloaded before saved
+                            filename_full = f"{userpath_delta_best}{combo_id}.csv"
+                            saved_data = (delta_list_best, delta_list_best[-1][1])
+                            file_cache.store(filename_full, saved_data)
+                            jobs.submit(
+                                "save delta best",
+                                file_cache.save,
+                                filename_full,
+                                save_delta_best_file,
+                                saved_data,
                                 filepath=userpath_delta_best,
                                 filename=combo_id,
                                 dataset=delta_list_best,
@@ -208,30 +260,34 @@ class Realtime(DataModule):
                     # Update driven distance
                     if moved_distance < 1500 * update_interval:
                         meters_driven += moved_distance
+                        if meters_driven - meters_journal >= JOURNAL_METERS_STEP:
+                            meters_journal = meters_driven
+                            state_journal.append(
+                                METERS_PENDING, JOURNAL_KEY_METERS, (meters_driven, meters_config))
 
                 # Calc delta
                 if pos_synced_last != pos_synced:
                     pos_synced_last = pos_synced
                     delay_update = laptime_curr > 0.3
-                    delta_best_raw = calc.delta_telemetry(
+                    delta_best_raw = delta_best_reader.delta(
                         delta_list_best,
                         pos_synced,
                         laptime_curr,
                         delay_update,
                     )
-                    delta_last_raw = calc.delta_telemetry(
+                    delta_last_raw = delta_last_reader.delta(
                         delta_list_last,
                         pos_synced,
                         laptime_curr,
                         delay_update,
                     )
-                    delta_session_raw = calc.delta_telemetry(
+                    delta_session_raw = delta_session_reader.delta(
                         delta_list_session,
                         pos_synced,
                         laptime_curr,
                         delay_update,
                     )
-                    delta_stint_raw = calc.delta_telemetry(
+                    delta_stint_raw = delta_stint_reader.delta(
                         delta_list_stint,
                         pos_synced,
                         laptime_curr,
@@ -266,3 +322,61 @@ class Realtime(DataModule):
                     last_session_id = (combo_id, *session_id)
                     self.cfg.user.setting["cruise"]["meters_driven"] = int(meters_driven)
                     self.cfg.save()
+                    # Journal latest value, marked as saved after config is saved with delay
+                    state_journal.append(
+                        METERS_PENDING, JOURNAL_KEY_METERS, (int(meters_driven), meters_config))
+                    meters_saving = True
+                elif meters_saving and not self.cfg.is_saving:
+                    meters_saving = False
+                    state_journal.append(METERS_SAVED, JOURNAL_KEY_METERS)
+
+        ebus.unsubscribe(lap_events)
+
+
+class DeltaReader:
+    """Delta telemetry reader
+
+    Keep cursor of last node index, and advance forward as position increases,
+    binary search is only used if position moved backward (resync or new lap),
+    dataset changed, or cursor is too far behind.
+    """
+
+    __slots__ = (
+        "_dataset",
+        "_index",
+    )
+
+    def __init__(self):
+        self._dataset = None
+        self._index = 0
+
+    def delta(self, dataset: tuple, position: float, target: float, condition: bool = True) -> float:
+        """Calculate delta telemetry data, same result as calc.delta_telemetry"""
+        if not condition:
+            return 0
+        last_index = len(dataset) - 1
+        index = self._index
+        if (dataset is not self._dataset or index > last_index or
+            (index > 0 and dataset[index - 1][0] >= position)):
+            self._dataset = dataset
+            index = calc.binary_search_higher_column(dataset, position, 0, last_index)
+        else:
+            # Find nearest higher node index
+            steps = 0
+            while index < last_index and dataset[index][0] < position:
+                index += 1
+                steps += 1
+                if steps >= MAX_CURSOR_STEPS:
+                    index = calc.binary_search_higher_column(dataset, position, index, last_index)
+                    break
+        self._index = index
+        if index > 0:
+            index_lower = index - 1
+            return target - calc.linear_interp(
+                position,
+                dataset[index_lower][0],
+                dataset[index_lower][1],
+                dataset[index][0],
+                dataset[index][1],
+            )
+        return 0
@@ -26,12 +26,15 @@ from ._base import DataModule
 from .module_fuel import calc_data
 from ..module_info import minfo
 from ..api_control import api
+from ..event_bus import ebus, LAP_COMPLETED
 from .. import calculation as calc
 
 
 class Realtime(DataModule):
     """Energy usage data"""
 
+    requires = ("module_events",)  # lap detection, started along with this module
+
     def __init__(self, config, module_name):
         super().__init__(config, module_name)
 
@@ -41,6 +44,7 @@ class Realtime(DataModule):
         update_interval = self.active_interval
 
         userpath_energy_delta = self.cfg.path.energy_delta
+        lap_events = ebus.subscribe(LAP_COMPLETED)
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -53,6 +57,7 @@ class Realtime(DataModule):
                     gen_calc_energy = calc_data(
                         output=minfo.energy,
                         telemetry_func=telemetry_energy,
+                        lap_events=lap_events,
                         filepath=userpath_energy_delta,
                         filename=combo_id,
                         extension=".energy",
@@ -74,6 +79,8 @@ class Realtime(DataModule):
                     minfo.hybrid.fuelEnergyBias = (
                         minfo.fuel.estimatedLaps - minfo.energy.estimatedLaps
                     )
+                else:
+                    lap_events.clear()
 
             else:
                 if reset:
@@ -82,6 +89,8 @@ class Realtime(DataModule):
                     # Trigger save check
                     gen_calc_energy.send(False)
 
+        ebus.unsubscribe(lap_events)
+
 
 def telemetry_energy() -> tuple[float, float]:
     """Telemetry energy, output in percentage"""
@@ -0,0 +1,133 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Events module
+"""
+
+from __future__ import annotations
+
+from ._base import DataModule
+from ..api_control import api
+from ..event_bus import (
+    ebus,
+    Event,
+    LAP_COMPLETED,
+    SECTOR_CROSSED,
+    PIT_ENTRY,
+    PIT_EXIT,
+    SESSION_CHANGE,
+)
+
+
+class Realtime(DataModule):
+    """Lap, sector, pit & session events"""
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        reset = False
+        update_interval = self.active_interval
+
+        while not self._event.wait(update_interval):
+            if self.state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+                    detector = EventDetector()
+
+                detector.update()
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+
+class EventDetector:
+    """Detect lap, sector, pit & session changes of all vehicles
+
+    Vehicle state is tracked by slot id, no event is published
+    on first update of a vehicle.
+    """
+
+    __slots__ = (
+        "_vehicles",
+        "_session_stamp",
+        "_session_etime",
+    )
+
+    def __init__(self):
+        # slot id: [lap start time, sector index, in pits]
+        self._vehicles: dict[int, list] = {}
+        self._session_stamp = None
+        self._session_etime = 0
+
+    def update(self):
+        """Update & publish events"""
+        publish = ebus.publish
+        session_stamp, session_etime, _ = api.read.check.session_id()
+        elapsed = api.read.timing.elapsed()
+
+        # Session change, or session restarted
+        if (self._session_stamp != session_stamp or
+            self._session_etime > session_etime):
+            if self._session_stamp is not None:
+                publish(Event(
+                    SESSION_CHANGE, -1, -1, session_stamp, self._session_stamp, 0.0, elapsed))
+            self._session_stamp = session_stamp
+            self._vehicles.clear()
+        self._session_etime = session_etime
+
+        vehicles = self._vehicles
+        for index in range(max(api.read.vehicle.total_vehicles(), 0)):
+            slot_id = api.read.vehicle.slot_id(index)
+            lap_stime = api.read.timing.start(index)
+            sector_index = api.read.lap.sector_index(index)
+            in_pits = api.read.vehicle.in_pits(index)
+
+            last = vehicles.get(slot_id, None)
+            if last is None:
+                vehicles[slot_id] = [lap_stime, sector_index, in_pits]
+                continue
+
+            if lap_stime > last[0]:
+                publish(Event(
+                    LAP_COMPLETED, index, slot_id, lap_stime, last[0],
+                    api.read.lap.distance(index), elapsed))
+            last[0] = lap_stime
+
+            if sector_index != last[1]:
+                publish(Event(
+                    SECTOR_CROSSED, index, slot_id, sector_index, last[1],
+                    api.read.lap.distance(index), elapsed))
+                last[1] = sector_index
+
+            if in_pits != last[2]:
+                if in_pits:
+                    publish(Event(
+                        PIT_ENTRY, index, slot_id, 1, 0,
+                        api.read.lap.distance(index), elapsed))
+                else:
+                    publish(Event(
+                        PIT_EXIT, index, slot_id, 0, 1,
+                        api.read.lap.distance(index), elapsed))
+                last[2] = in_pits
@@ -22,7 +22,7 @@ Force module
 
 from functools import partial
 
-from ._base import DataModule
+from ._base import DataModule, VehicleSlots
 from ..module_info import minfo
 from ..api_control import api
 from .. import calculation as calc
@@ -47,12 +47,10 @@ class Realtime(DataModule):
             calc.ema_factor(min(max(self.mcfg["max_average_g_force_samples"], 3), 1000))
         )
 
-        calc_max_lgt = TransientMax(self.mcfg["max_g_force_reset_delay"])
-        calc_max_lat = TransientMax(self.mcfg["max_g_force_reset_delay"])
-        calc_max_avg_lat = TransientMax(self.mcfg["max_average_g_force_reset_delay"], True)
-        calc_braking_rate = BrakingRate(g_accel)
-        calc_transient_rate = TransientMax(3)
-        calc_max_braking_rate = TransientMax(self.mcfg["max_braking_rate_reset_delay"], True)
+        vehicle_slots = VehicleSlots(
+            partial(ForceState, self.mcfg, g_accel),
+            self.mcfg["number_of_tracked_vehicles"],
+        )
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -61,16 +59,11 @@ class Realtime(DataModule):
                     reset = True
                     update_interval = self.active_interval
 
-                    calc_max_lgt.reset()
-                    calc_max_lat.reset()
-                    calc_max_avg_lat.reset()
-                    calc_braking_rate.reset()
-                    calc_transient_rate.reset()
-                    calc_max_braking_rate.reset()
+                    vehicle_slots.clear()
 
-                    avg_lat_gforce_ema = 0
-                    max_braking_rate = 0
-                    delta_braking_rate = 0
+                # Select focused vehicle state
+                veh = vehicle_slots.select(
+                    (api.read.vehicle.slot_id(), api.read.vehicle.vehicle_name()))
 
                 # Read telemetry
                 lap_etime = api.read.timing.elapsed()
@@ -87,27 +80,29 @@ class Realtime(DataModule):
                 lat_gforce_raw = lat_accel / g_accel
 
                 # Max G
-                max_lgt_gforce = calc_max_lgt.update(abs(lgt_gforce_raw), lap_etime)
-                max_lat_gforce = calc_max_lat.update(abs(lat_gforce_raw), lap_etime)
+                max_lgt_gforce = veh.calc_max_lgt.update(abs(lgt_gforce_raw), lap_etime)
+                max_lat_gforce = veh.calc_max_lat.update(abs(lat_gforce_raw), lap_etime)
 
                 # Max average lateral G
-                avg_lat_gforce_ema = calc_ema_gforce(
-                    avg_lat_gforce_ema,
-                    min(abs(lat_gforce_raw), avg_lat_gforce_ema + max_g_diff)
+                veh.avg_lat_gforce_ema = avg_lat_gforce_ema = calc_ema_gforce(
+                    veh.avg_lat_gforce_ema,
+                    min(abs(lat_gforce_raw), veh.avg_lat_gforce_ema + max_g_diff)
                 )
-                max_avg_lat_gforce = calc_max_avg_lat.update(avg_lat_gforce_ema, lap_etime)
+                max_avg_lat_gforce = veh.calc_max_avg_lat.update(avg_lat_gforce_ema, lap_etime)
 
                 # Downforce
                 dforce_ratio = calc.force_ratio(dforce_f, dforce_f + dforce_r)
 
                 # Braking rate
-                braking_rate = calc_braking_rate.calc(lap_etime, speed, brake_raw, impact_time)
-                max_transient_rate = calc_transient_rate.update(braking_rate, lap_etime)
-                temp_max_rate = calc_max_braking_rate.update(max_transient_rate, lap_etime)
+                braking_rate = veh.calc_braking_rate.calc(lap_etime, speed, brake_raw, impact_time)
+                max_transient_rate = veh.calc_transient_rate.update(braking_rate, lap_etime)
+                temp_max_rate = veh.calc_max_braking_rate.update(max_transient_rate, lap_etime)
                 if max_transient_rate > 0:
-                    delta_braking_rate = max_transient_rate - max_braking_rate
+                    veh.delta_braking_rate = max_transient_rate - veh.max_braking_rate
                 else:  # Set after reset max_transient_rate
-                    max_braking_rate = temp_max_rate
+                    veh.max_braking_rate = temp_max_rate
+                max_braking_rate = veh.max_braking_rate
+                delta_braking_rate = veh.delta_braking_rate
 
                 # Output force data
                 output.lgtGForceRaw = lgt_gforce_raw
@@ -129,6 +124,38 @@ class Realtime(DataModule):
                     update_interval = self.idle_interval
 
 
+class ForceState:
+    """Force state of single vehicle"""
+
+    __slots__ = (
+        "calc_max_lgt",
+        "calc_max_lat",
+        "calc_max_avg_lat",
+        "calc_braking_rate",
+        "calc_transient_rate",
+        "calc_max_braking_rate",
+        "avg_lat_gforce_ema",
+        "max_braking_rate",
+        "delta_braking_rate",
+    )
+
+    def __init__(self, mcfg: dict, g_accel: float):
+        """
+        Args:
+            mcfg: module config.
+            g_accel: gravitational acceleration.
+        """
+        self.calc_max_lgt = TransientMax(mcfg["max_g_force_reset_delay"])
+        self.calc_max_lat = TransientMax(mcfg["max_g_force_reset_delay"])
+        self.calc_max_avg_lat = TransientMax(mcfg["max_average_g_force_reset_delay"], True)
+        self.calc_braking_rate = BrakingRate(g_accel)
+        self.calc_transient_rate = TransientMax(3)
+        self.calc_max_braking_rate = TransientMax(mcfg["max_braking_rate_reset_delay"], True)
+        self.avg_lat_gforce_ema = 0.0
+        self.max_braking_rate = 0.0
+        self.delta_braking_rate = 0.0
+
+
 class TransientMax:
     """Transient max"""
 
@@ -21,6 +21,7 @@ Fuel module
 """
 
 from __future__ import annotations
+from array import array
 from functools import partial
 from math import ceil
 from collections.abc import Callable
@@ -28,8 +29,12 @@ from collections.abc import Callable
 from ._base import DataModule
 from ..module_info import minfo, FuelInfo, ConsumptionDataSet
 from ..api_control import api
+from ..event_bus import ebus, EventListener, LAP_COMPLETED
 from .. import calculation as calc
+from ..job_executor import jobs
 from ..userfile.fuel_delta import load_fuel_delta_file, save_fuel_delta_file
+from ..userfile.file_cache import file_cache
+from ..userfile.lap_history import lap_history
 
 DELTA_ZERO = 0.0,0.0
 DELTA_DEFAULT = (DELTA_ZERO,)
@@ -40,6 +45,8 @@ round6 = partial(round, ndigits=6)
 class Realtime(DataModule):
     """Fuel usage data"""
 
+    requires = ("module_events",)  # lap detection, started along with this module
+
     def __init__(self, config, module_name):
         super().__init__(config, module_name)
 
@@ -49,6 +56,8 @@ class Realtime(DataModule):
         update_interval = self.active_interval
 
         userpath_fuel_delta = self.cfg.path.fuel_delta
+        userpath_lap_history = self.cfg.path.lap_history
+        lap_events = ebus.subscribe(LAP_COMPLETED)
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -61,6 +70,7 @@ class Realtime(DataModule):
                     gen_calc_fuel = calc_data(
                         output=minfo.fuel,
                         telemetry_func=telemetry_fuel,
+                        lap_events=lap_events,
                         filepath=userpath_fuel_delta,
                         filename=combo_id,
                         extension=".fuel",
@@ -76,16 +86,26 @@ class Realtime(DataModule):
                 # Update consumption history
                 if (minfo.history.consumption[0][2] != minfo.delta.lapTimeLast
                     > minfo.delta.lapTimeCurrent > 2):  # record 2s after pass finish line
-                    minfo.history.consumption.appendleft(
-                        ConsumptionDataSet(
-                            api.read.lap.completed_laps() - 1,
-                            minfo.delta.isValidLap,
-                            minfo.delta.lapTimeLast,
-                            minfo.fuel.lastLapConsumption,
-                            minfo.energy.lastLapConsumption,
-                            minfo.hybrid.batteryDrainLast,
-                            minfo.hybrid.batteryRegenLast,
-                        )
+                    consumption = ConsumptionDataSet(
+                        api.read.lap.completed_laps() - 1,
+                        minfo.delta.isValidLap,
+                        minfo.delta.lapTimeLast,
+                        minfo.fuel.lastLapConsumption,
+                        minfo.energy.lastLapConsumption,
+                        minfo.hybrid.batteryDrainLast,
+                        minfo.hybrid.batteryRegenLast,
+                    )
+                    minfo.history.consumption.appendleft(consumption)
+                    lap_history.record(
+                        filepath=userpath_lap_history,
+                        combo_id=combo_id,
+                        session_id=api.read.check.session_id(),
+                        lap=consumption.completedLaps,
+                        is_valid=int(consumption.isValidLap),
+                        fuel_used=consumption.lastLapUsedFuel,
+                        energy_used=consumption.lastLapUsedEnergy,
+                        battery_drain=consumption.batteryDrainLast,
+                        battery_regen=consumption.batteryRegenLast,
                     )
 
             else:
@@ -95,6 +115,71 @@ class Realtime(DataModule):
                     # Trigger save check
                     gen_calc_fuel.send(False)
 
+        ebus.unsubscribe(lap_events)
+
+
+class ConsumptionProfile:
+    """Distance-binned consumption profile
+
+    Recorded consumption nodes of a lap, and index of first node at or after
+    start of each distance bin. Bin index is updated as each node is recorded,
+    so that node lookup at any lap distance takes constant time,
+    and recorded lap is used as reference lap without rebuilding.
+
+    Args:
+        bin_distance: distance (meters) per bin, same as minimum node distance.
+        dataset: recorded nodes of (distance, consumption, ...), sorted by distance.
+    """
+
+    __slots__ = (
+        "bin_distance",
+        "nodes",
+        "bins",
+    )
+
+    def __init__(self, bin_distance: float, dataset: tuple = DELTA_DEFAULT):
+        self.bin_distance = max(bin_distance, 1)
+        self.nodes = []
+        self.bins = array("l")
+        for node in dataset:
+            self.append(node)
+
+    def append(self, node: tuple):
+        """Append recorded node, point bins started before node distance to node"""
+        bins = self.bins
+        node_index = len(self.nodes)
+        self.nodes.append(node)
+        last_bin = int(node[0] // self.bin_distance)
+        while len(bins) <= last_bin:
+            bins.append(node_index)
+
+    def delta(self, position: float, consumption: float, condition: bool = True) -> float:
+        """Delta consumption compare to recorded lap at lap distance
+
+        Same result as calc.delta_telemetry.
+        """
+        nodes = self.nodes
+        index_last = len(nodes) - 1
+        if not condition or index_last < 1 or position < 0:
+            return 0
+        bin_index = int(position // self.bin_distance)
+        if bin_index < len(self.bins):
+            index_higher = self.bins[bin_index]
+        else:
+            index_higher = index_last
+        while index_higher < index_last and nodes[index_higher][0] < position:
+            index_higher += 1
+        if index_higher > 0:
+            index_lower = index_higher - 1
+            return consumption - calc.linear_interp(
+                position,
+                nodes[index_lower][0],
+                nodes[index_lower][1],
+                nodes[index_higher][0],
+                nodes[index_higher][1],
+            )
+        return 0
+
 
 def telemetry_fuel() -> tuple[float, float]:
     """Telemetry fuel"""
@@ -104,22 +189,25 @@ def telemetry_fuel() -> tuple[float, float]:
 
 
 def calc_data(
-    output: FuelInfo, telemetry_func: Callable, filepath: str, filename: str, extension: str,
-    min_delta_distance: float):
+    output: FuelInfo, telemetry_func: Callable, lap_events: EventListener,
+    filepath: str, filename: str, extension: str, min_delta_distance: float):
     """Calculate data"""
     recording = False
     delayed_save = False
     validating = 0
     is_pit_lap = 0  # whether pit in or pit out lap
 
-    delta_list_last, used_last, laptime_last = load_fuel_delta_file(
+    delta_list_last, used_last, laptime_last = file_cache.load(
+        f"{filepath}{filename}{extension}",
+        load_fuel_delta_file,
         filepath=filepath,
         filename=filename,
         extension=extension,
         defaults=(DELTA_DEFAULT, 0, 0)
     )
-    delta_list_raw = [DELTA_ZERO]  # distance, fuel used, laptime
-    delta_list_temp = DELTA_DEFAULT  # last lap temp
+    profile_last = ConsumptionProfile(min_delta_distance, delta_list_last)  # last valid lap
+    profile_raw = ConsumptionProfile(min_delta_distance)  # distance, fuel used, laptime
+    profile_temp = None  # last lap temp
     delta_fuel = 0.0  # delta fuel consumption compare to last lap
 
     amount_start = 0.0  # start fuel reading
@@ -137,22 +225,32 @@ def calc_data(
     est_pits_early = 0.0  # estimate end-lap pit stop counts
     used_est_less = 0.0  # estimate fuel consumption for one less pit stop
 
-    last_lap_stime = -1.0  # last lap start time
     laps_left = 0.0  # amount laps left at current lap distance
     end_timer_laps_left = 0.0  # amount laps left from start of current lap to end of race timer
+    pos_lap_end = 0.0  # furthest vehicle position of current lap
     pos_recorded = 0.0  # last recorded vehicle position
     pos_last = 0.0  # last checked vehicle position
     pos_estimate = 0.0  # estimated vehicle position
     is_pos_synced = False  # vehicle position synced with API
     gps_last = (0.0,0.0,0.0)  # last global position
+    lap_events.clear()
 
     while True:
         updating = yield None
 
         # Save check
         if not updating:
-            if delayed_save:
-                save_fuel_delta_file(
+            if delayed_save and len(delta_list_last) >= 10:
+                # Store data to file cache first, in case reloaded before saved
+                filename_full = f"{filepath}{filename}{extension}"
+                saved_data = (delta_list_last, delta_list_last[-1][1], delta_list_last[-1][2])
+                file_cache.store(filename_full, saved_data)
+                jobs.submit(
+                    f"save {extension[1:]} delta",
+                    file_cache.save,
+                    filename_full,
+                    save_fuel_delta_file,
+                    saved_data,
                     filepath=filepath,
                     filename=filename,
                     extension=extension,
@@ -162,7 +260,6 @@ def calc_data(
 
         # Read telemetry
         capacity, amount_curr = telemetry_func()
-        lap_stime = api.read.timing.start()
         laptime_curr = max(api.read.timing.current_laptime(), 0)
         time_left = api.read.session.remaining()
         in_garage = api.read.vehicle.in_garage()
@@ -182,32 +279,36 @@ def calc_data(
             amount_last = amount_curr
 
         # Lap start & finish detection
-        if lap_stime > last_lap_stime != -1:
-            if len(delta_list_raw) > 1 and not is_pit_lap:
-                delta_list_raw.append((  # set end value
-                    round6(pos_last + 10),
+        player_slot_id = api.read.vehicle.slot_id()
+        for event in lap_events.drain():
+            if event.slotID != player_slot_id:
+                continue
+            if len(profile_raw.nodes) > 1 and not is_pit_lap:
+                profile_raw.append((  # set end value
+                    round6(pos_lap_end + 10),
                     round6(used_curr),
-                    round6(lap_stime - last_lap_stime)
+                    round6(event.value - event.lastValue)
                 ))
-                delta_list_temp = tuple(delta_list_raw)
+                profile_temp = profile_raw
                 validating = api.read.timing.elapsed()
-            delta_list_raw = [DELTA_ZERO]  # reset
-            pos_last = pos_recorded = pos_curr
+            profile_raw = ConsumptionProfile(min_delta_distance)  # reset
+            pos_lap_end = pos_last = pos_recorded = pos_curr
             used_last_raw = used_curr
             used_curr = 0
             recording = laptime_curr < 1
             is_pit_lap = 0
-        last_lap_stime = lap_stime  # reset
 
         # Distance desync check at start of new lap, reset if higher than normal distance
         if 0 < laptime_curr < 1 and pos_curr > 300:
-            pos_last = pos_recorded = pos_curr = 0
+            pos_lap_end = pos_last = pos_recorded = pos_curr = 0
 
         # Update if position value is different & positive
         if 0 <= pos_curr != pos_last:
             if recording and pos_curr - pos_recorded >= min_delta_distance:
-                delta_list_raw.append((round6(pos_curr), round6(used_curr)))
+                profile_raw.append((round6(pos_curr), round6(used_curr)))
                 pos_recorded = pos_curr
+            if pos_lap_end < pos_curr:
+                pos_lap_end = pos_curr
             pos_last = pos_curr  # reset last position
             is_pos_synced = True
 
@@ -217,8 +318,9 @@ def calc_data(
             if (0.3 < timer <= 3 and  # compare current time
                 api.read.timing.last_laptime() > 0):  # is valid laptime
                 used_last = used_last_raw
-                delta_list_last = delta_list_temp
-                delta_list_temp = DELTA_DEFAULT
+                profile_last = profile_temp
+                profile_temp = None
+                delta_list_last = tuple(profile_last.nodes)
                 delayed_save = True
                 validating = 0
             elif timer > 3:  # switch off after 3s
@@ -233,8 +335,7 @@ def calc_data(
                 pos_estimate += calc.distance(gps_last, gps_curr)
             gps_last = gps_curr
             # Update delta
-            delta_fuel = calc.delta_telemetry(
-                delta_list_last,
+            delta_fuel = profile_last.delta(
                 pos_estimate,
                 used_curr,
                 laptime_curr > 0.3 and not in_garage,  # 300ms delay
@@ -23,11 +23,14 @@ Hybrid module
 from ._base import DataModule
 from ..module_info import minfo
 from ..api_control import api
+from ..event_bus import ebus, LAP_COMPLETED
 
 
 class Realtime(DataModule):
     """Hybrid data"""
 
+    requires = ("module_events",)  # lap detection, started along with this module
+
     def __init__(self, config, module_name):
         super().__init__(config, module_name)
 
@@ -37,6 +40,7 @@ class Realtime(DataModule):
         update_interval = self.active_interval
 
         output = minfo.hybrid
+        lap_events = ebus.subscribe(LAP_COMPLETED)
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -56,22 +60,22 @@ class Realtime(DataModule):
                     motor_inactive_timer = 99999
                     motor_inactive_timer_start = False
                     lap_etime_last = 0
-                    last_lap_stime = -1  # last lap start time
+                    lap_events.clear()
 
                 # Read telemetry
-                lap_stime = api.read.timing.start()
                 lap_etime = api.read.timing.elapsed()
                 battery_charge = api.read.emotor.battery_charge() * 100
                 motor_state = api.read.emotor.state()
 
                 # Lap start & finish detection
-                if lap_stime > last_lap_stime != -1:
-                    battery_drain_last = battery_drain
-                    battery_regen_last = battery_regen
-                    battery_drain = 0
-                    battery_regen = 0
-                    motor_active_timer = 0
-                last_lap_stime = lap_stime  # reset
+                player_slot_id = api.read.vehicle.slot_id()
+                for event in lap_events.drain():
+                    if event.slotID == player_slot_id:
+                        battery_drain_last = battery_drain
+                        battery_regen_last = battery_regen
+                        battery_drain = 0
+                        battery_regen = 0
+                        motor_active_timer = 0
 
                 if last_battery_charge:
                     if last_battery_charge > battery_charge > 0:  # drain
@@ -114,3 +118,5 @@ class Realtime(DataModule):
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
+
+        ebus.unsubscribe(lap_events)
@@ -21,12 +21,16 @@ Mapping module
 """
 
 from functools import partial
+from time import time
 
 from ._base import DataModule
 from ..module_info import minfo
 from ..api_control import api
+from ..event_bus import ebus, EventListener, LAP_COMPLETED, SECTOR_CROSSED
 from ..validator import file_last_modified
 from .. import calculation as calc
+from ..map_geometry import geometry
+from ..job_executor import jobs
 from ..userfile.track_map import load_track_map_file, save_track_map_file
 
 round4 = partial(round, ndigits=4)
@@ -35,6 +39,8 @@ round4 = partial(round, ndigits=4)
 class Realtime(DataModule):
     """Mapping data"""
 
+    requires = ("module_events",)  # lap & sector detection, started along with this module
+
     def __init__(self, config, module_name):
         super().__init__(config, module_name)
 
@@ -47,6 +53,7 @@ class Realtime(DataModule):
         output = minfo.mapping
 
         recorder = MapRecorder(userpath_track_map)
+        lap_events = ebus.subscribe(LAP_COMPLETED, SECTOR_CROSSED)
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -61,20 +68,28 @@ class Realtime(DataModule):
                         output.coordinates = recorder.output.coords
                         output.elevations = recorder.output.dists
                         output.sectors = recorder.output.sectors
+                        # Build shared map geometry before widgets update
+                        geometry.importance(output.coordinates)
+                        geometry.importance(output.elevations, True)
                         output.lastModified = recorder.last_modified
                     else:
                         recorder.reset()
                         output.reset()
+                    lap_events.clear()
 
                 if not recorder.map_exist:
-                    recorder.update()
+                    recorder.update(lap_events)
                     if recorder.map_exist:
                         reset = False  # load recorded map in next loop
+                else:
+                    lap_events.clear()
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
 
+        ebus.unsubscribe(lap_events)
+
 
 class MapCoords:
     """Map coords data"""
@@ -115,12 +130,12 @@ class MapRecorder:
     def __init__(self, filepath: str):
         self._recording = False
         self._validating = False
-        self._last_sector_idx = -1
         self._last_lap_stime = -1.0  # last lap start time
         self._pos_last = 0.0  # last checked player vehicle position
         # File info
         self.map_exist = False
         self.last_modified = 0.0
+        self._saving = False  # recorded map is being saved in background
         self._filepath = filepath
         self._filename = ""
         # Map data
@@ -132,33 +147,55 @@ class MapRecorder:
         """Reset to defaults"""
         self._recording = False
         self._validating = False
-        self._last_sector_idx = -1
         self._last_lap_stime = -1.0
         self._pos_last = 0.0
+        self._recorder_data.reset()
 
-    def update(self):
+    def update(self, lap_events: EventListener):
         """Update map data"""
-        self.__start(api.read.timing.start())
+        player_slot_id = api.read.vehicle.slot_id()
+        for event in lap_events.drain():
+            if event.slotID != player_slot_id:
+                continue
+            if event.type == LAP_COMPLETED:
+                self.__start(event.value)
+            elif self._recording:
+                self.__record_sector(int(event.value), event.distance)
         if self._validating:
             self.__validate(api.read.timing.elapsed(), api.read.timing.last_laptime())
         if self._recording:
-            self.__record_sector(api.read.lap.sector_index())
             self.__record_path(round4(api.read.lap.distance()))
 
     def __start(self, lap_stime: float):
-        """Lap start & finish detection"""
-        # Init reset
-        if self._last_lap_stime == -1:
-            self._recorder_data.reset()
-            self._last_lap_stime = lap_stime
-        # New lap
-        if lap_stime > self._last_lap_stime:
+        """New lap, split path recorded after crossing finish line to new lap"""
+        recorder_data = self._recorder_data
+        split_index = self.__lap_split_index()
+        coords = recorder_data.coords[split_index:]
+        dists = recorder_data.dists[split_index:]
+        del recorder_data.coords[split_index:]
+        del recorder_data.dists[split_index:]
+        if self._recording:
             self.__record_end()
-            self._recorder_data.reset()
-            self._last_lap_stime = lap_stime
-            self._pos_last = 0
-            self._recording = True
-            #logger.info("map recording")
+        recorder_data.reset()
+        recorder_data.coords.extend(coords)
+        recorder_data.dists.extend(dists)
+        self._last_lap_stime = lap_stime
+        self._recording = True
+        #logger.info("map recording")
+
+    def __lap_split_index(self) -> int:
+        """Index of first recorded node after position dropped at finish line
+
+        Position only increases within recorded lap, lap event may arrive
+        after a few nodes of new lap are recorded.
+        """
+        dists = self._recorder_data.dists
+        index = len(dists) - 1
+        while index > 0 and dists[index - 1][0] < dists[index][0]:
+            index -= 1
+        if index > 0:
+            return index
+        return len(dists)
 
     def __validate(self, lap_etime: float, laptime_valid: float):
         """Validate map data after crossing finish line"""
@@ -175,14 +212,14 @@ class MapRecorder:
             self._temp_data.clear()
             self._validating = False
 
-    def __record_sector(self, sector_idx: int):
-        """Record sector index"""
-        if self._last_sector_idx != sector_idx:
-            if sector_idx == 1:
-                self._recorder_data.sectors[0] = len(self._recorder_data.coords) - 1
-            elif sector_idx == 2:
-                self._recorder_data.sectors[1] = len(self._recorder_data.coords) - 1
-            self._last_sector_idx = sector_idx
+    def __record_sector(self, sector_idx: int, pos_sector: float):
+        """Record sector index, as last recorded node before sector line"""
+        if 1 <= sector_idx <= 2:
+            dists = self._recorder_data.dists
+            index = calc.binary_search_lower_column(dists, pos_sector, 0, len(dists) - 1)
+            if index >= 0 and dists[index][0] >= pos_sector:
+                index -= 1
+            self._recorder_data.sectors[sector_idx - 1] = index
 
     def __record_path(self, pos_curr: float):
         """Record driving path"""
@@ -206,6 +243,10 @@ class MapRecorder:
 
     def load_map(self, filename: str):
         """Load map data file"""
+        # Use recorded map until saved
+        if self._saving and self._filename == filename:
+            self.map_exist = True
+            return
         self._filename = filename
         # Check if same map loaded
         modified = file_last_modified(
@@ -239,13 +280,34 @@ class MapRecorder:
         self.output.coords = self._temp_data.coords
         self.output.dists = self._temp_data.dists
         self.output.sectors = self._temp_data.sectors
-        # Save to svg file
-        save_track_map_file(
-            filepath=self._filepath,
-            filename=self._filename,
-            view_box=calc.svg_view_box(self._temp_data.coords, 20),
-            raw_coords=self._temp_data.coords,
-            raw_dists=self._temp_data.dists,
-            sector_index=self._temp_data.sectors,
+        # Save to svg file in background, recorded map is used until saved
+        self.last_modified = time()
+        self._saving = True
+        jobs.submit(
+            "save track map",
+            self.__save_file,
+            self._filename,
+            self._temp_data.coords,
+            self._temp_data.dists,
+            self._temp_data.sectors,
         )
         #logger.info("map saved, stopped map recording")
+
+    def __save_file(self, filename: str, raw_coords: tuple, raw_dists: tuple, sector_index: tuple):
+        """Save map data file"""
+        try:
+            save_track_map_file(
+                filepath=self._filepath,
+                filename=filename,
+                view_box=calc.svg_view_box(raw_coords, 20),
+                raw_coords=raw_coords,
+                raw_dists=raw_dists,
+                sector_index=sector_index,
+            )
+            self.last_modified = file_last_modified(
+                filepath=self._filepath,
+                filename=filename,
+                extension=".svg",
+            )
+        finally:
+            self._saving = False
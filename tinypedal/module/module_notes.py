@@ -21,7 +21,10 @@ Notes module
 """
 
 from __future__ import annotations
+from array import array
 from collections.abc import Callable
+from sys import intern
+from typing import Any, NamedTuple
 
 from ._base import DataModule
 from ..module_info import minfo, NotesInfo
@@ -29,13 +32,20 @@ from ..api_control import api
 from .. import calculation as calc
 from ..userfile.track_notes import (
     load_notes_file,
+    notes_file_mtime,
     parse_csv_notes_only,
-    COLUMN_DISTANCE,
     HEADER_PACE_NOTES,
     HEADER_TRACK_NOTES,
 )
 
 
+class CompiledNotes(NamedTuple):
+    """Compiled notes"""
+
+    distances: array
+    notes: tuple[dict, ...]
+
+
 class Realtime(DataModule):
     """Notes data"""
 
@@ -53,6 +63,7 @@ class Realtime(DataModule):
         output_tracknotes = minfo.tracknotes
 
         setting_playback = self.cfg.user.setting["pace_notes_playback"]
+        notes_cache = {}
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -65,6 +76,7 @@ class Realtime(DataModule):
 
                     # Load pace notes
                     pace_notes = load_pace_notes_file(
+                        cache=notes_cache,
                         config=setting_playback,
                         filepath=userpath_pace_notes,
                         filename=track_name,
@@ -72,25 +84,28 @@ class Realtime(DataModule):
                         parser=parse_csv_notes_only,
                         extension=".tppn",
                     )
-                    gen_pacenotes = notes_selector(
-                        output=output_pacenotes,
-                        dataset=pace_notes,
-                    )
-                    gen_pacenotes.send(None)
+                    if pace_notes:
+                        gen_pacenotes = notes_selector(
+                            output=output_pacenotes,
+                            dataset=pace_notes,
+                        )
+                        gen_pacenotes.send(None)
 
                     # Load track notes
-                    track_notes = load_notes_file(
+                    track_notes = load_notes_cache(
+                        cache=notes_cache,
                         filepath=userpath_track_notes,
                         filename=track_name,
                         table_header=HEADER_TRACK_NOTES,
                         parser=parse_csv_notes_only,
                         extension=".tptn"
                     )
-                    gen_tracknotes = notes_selector(
-                        output=output_tracknotes,
-                        dataset=track_notes,
-                    )
-                    gen_tracknotes.send(None)
+                    if track_notes:
+                        gen_tracknotes = notes_selector(
+                            output=output_tracknotes,
+                            dataset=track_notes,
+                        )
+                        gen_tracknotes.send(None)
 
                 # Update position
                 pos_synced = minfo.delta.lapDistance
@@ -112,14 +127,15 @@ class Realtime(DataModule):
 
 
 def load_pace_notes_file(
-    config: dict, filepath: str, filename: str,
+    cache: dict, config: dict, filepath: str, filename: str,
     table_header: tuple, parser: Callable, extension: str):
     """Load pace notes"""
     if config["enable_manual_file_selector"]:
         filepath = ""
         filename = config["pace_notes_file_name"]
         extension = ""
-    return load_notes_file(
+    return load_notes_cache(
+        cache=cache,
         filepath=filepath,
         filename=filename,
         table_header=table_header,
@@ -128,16 +144,76 @@ def load_pace_notes_file(
     )
 
 
-def notes_selector(output: NotesInfo, dataset: list[dict] | None):
+def load_notes_cache(
+    cache: dict, filepath: str, filename: str,
+    table_header: tuple, parser: Callable, extension: str) -> CompiledNotes | None:
+    """Load compiled notes from cache, reload from file only if modified
+
+    Args:
+        cache: compiled notes cache dictionary, key = full file name,
+            value = (file modified time, compiled notes).
+
+    Returns:
+        Compiled notes, or None if unavailable.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
+    modified = notes_file_mtime(filename_full)
+    cached = cache.get(filename_full, None)
+    if cached is not None and cached[0] == modified:
+        return cached[1]
+    notes = compile_notes(
+        load_notes_file(
+            filepath=filepath,
+            filename=filename,
+            table_header=table_header,
+            parser=parser,
+            extension=extension,
+        ),
+        table_header[0],
+    )
+    cache[filename_full] = modified, notes
+    return notes
+
+
+def compile_notes(notes: list[dict] | None, column_key: str) -> CompiledNotes | None:
+    """Compile notes into sorted distance array and interned note rows
+
+    Args:
+        notes: sorted list of notes.
+        column_key: distance column key.
+
+    Returns:
+        Compiled notes, or None if no valid notes.
+    """
+    if not notes:
+        return None
+    return CompiledNotes(
+        distances=array("d", (note_line[column_key] for note_line in notes)),
+        notes=tuple(
+            {key: intern_value(value) for key, value in note_line.items()}
+            for note_line in notes
+        ),
+    )
+
+
+def intern_value(value: Any) -> Any:
+    """Intern string value"""
+    if isinstance(value, str):
+        return intern(value)
+    return value
+
+
+def notes_selector(output: NotesInfo, dataset: CompiledNotes):
     """Notes selector
 
     Args:
         output: module info.
-        dataset: list of notes.
+        dataset: compiled notes.
     """
     last_index = 0
-    end_index = end_note_index(dataset)
-    dist_ref = reference_notes_index(dataset)
+    dist_ref = dataset.distances
+    notes = dataset.notes
+    end_index = len(notes) - 1
     output.reset()  # initial reset before updating
 
     while True:
@@ -151,25 +227,11 @@ def notes_selector(output: NotesInfo, dataset: list[dict] | None):
         next_index = next_note_index(pos_curr, curr_index, dist_ref)
 
         output.currentIndex = curr_index
-        output.currentNote = dataset[curr_index]
+        output.currentNote = notes[curr_index]
         output.nextIndex = next_index
-        output.nextNote = dataset[next_index]
+        output.nextNote = notes[next_index]
 
 
-def next_note_index(pos_curr: float, curr_index: int, dist_ref: list) -> int:
+def next_note_index(pos_curr: float, curr_index: int, dist_ref: array) -> int:
     """Next note line index"""
     return (curr_index + 1) * (pos_curr < dist_ref[-1])
-
-
-def end_note_index(notes: list | None) -> int:
-    """End note line index"""
-    if notes is None:
-        return 0
-    return len(notes) - 1
-
-
-def reference_notes_index(notes: list | None) -> list | None:
-    """Reference notes index"""
-    if notes is None:
-        return None
-    return [note_line[COLUMN_DISTANCE] for note_line in notes]
@@ -0,0 +1,204 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Pace module
+"""
+
+from __future__ import annotations
+from collections import deque
+
+from ._base import DataModule
+from ..module_info import minfo
+from ..api_control import api
+from ..event_bus import ebus, LAP_COMPLETED, PIT_ENTRY, PIT_EXIT, SESSION_CHANGE
+from .. import calculation as calc
+
+MAGIC_NUM = 99999
+MAX_PACE_HISTORY = 10  # number of recent valid laps for rolling best & consistency
+
+
+class Realtime(DataModule):
+    """Vehicle laptime pace data"""
+
+    requires = ("module_events",)  # lap detection, started along with this module
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        reset = False
+        update_interval = self.active_interval
+
+        output = minfo.pace
+        ema_factor = calc.ema_factor(min(max(self.mcfg["laptime_pace_samples"], 1), 20))
+        laptime_pace_margin = max(self.mcfg["laptime_pace_margin"], 0.1)
+        events = ebus.subscribe(LAP_COMPLETED, PIT_ENTRY, PIT_EXIT, SESSION_CHANGE)
+
+        while not self._event.wait(update_interval):
+            if self.state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+                    trackers: dict[int, PaceTracker] = {}
+                    output.reset()
+                    events.clear()
+
+                # Session change resets all trackers, drop events before change
+                lap_events = []
+                for event in events.drain():
+                    if event.type == SESSION_CHANGE:
+                        trackers.clear()
+                        lap_events.clear()
+                    else:
+                        lap_events.append(event)
+
+                # Map slot id to current vehicle index
+                elapsed = api.read.timing.elapsed()
+                veh_total = max(api.read.vehicle.total_vehicles(), 0)
+                slot_index: dict[int, int] = {}
+                for index in range(veh_total):
+                    slot_id = api.read.vehicle.slot_id(index)
+                    slot_index[slot_id] = index
+                    if slot_id not in trackers:
+                        tracker = trackers[slot_id] = PaceTracker(ema_factor, laptime_pace_margin)
+                        tracker.check_class(index)
+
+                # Remove trackers of vehicles no longer in session
+                for slot_id in trackers.keys() - slot_index.keys():
+                    trackers.pop(slot_id)
+
+                # Per-lap update, read by current index of event slot id
+                for event in lap_events:
+                    index = slot_index.get(event.slotID, None)
+                    if index is None:
+                        continue
+                    if event.type == LAP_COMPLETED:
+                        trackers[event.slotID].lap_completed(index, event.elapsed)
+                    else:  # pit entry or exit
+                        trackers[event.slotID].is_pit_lap = 1
+
+                for slot_id, index in slot_index.items():
+                    tracker = trackers[slot_id]
+                    if tracker.validating:
+                        tracker.validate(index, elapsed)
+                    # Output by vehicle index, as index may change while slot id is fixed
+                    output.laptimePace[index] = tracker.laptime_pace
+                    output.laptimeBest[index] = tracker.laptime_best
+                    output.consistency[index] = tracker.consistency
+                output.total = veh_total
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+        ebus.unsubscribe(events)
+
+
+class PaceTracker:
+    """Laptime pace tracker of single vehicle
+
+    Pace is only calculated once per completed lap (from lap completed event)
+    after last laptime is validated.
+
+    Args:
+        ema_factor: smoothing factor for exponential moving average pace.
+        margin: maximum laptime pace increment per lap (seconds).
+    """
+
+    __slots__ = (
+        "ema_factor",
+        "margin",
+        "laptime_pace",
+        "laptime_best",
+        "consistency",
+        "history",
+        "vehicle_class",
+        "is_pit_lap",
+        "validating",
+    )
+
+    def __init__(self, ema_factor: float, margin: float):
+        self.ema_factor = ema_factor
+        self.margin = margin
+        self.laptime_pace = MAGIC_NUM
+        self.laptime_best = MAGIC_NUM
+        self.consistency = 0.0
+        self.history: deque[float] = deque(maxlen=MAX_PACE_HISTORY)
+        self.vehicle_class = None
+        self.is_pit_lap = 0
+        self.validating = 0.0
+
+    def check_class(self, index: int):
+        """Reset pace if vehicle class changes"""
+        veh_class = api.read.vehicle.class_name(index)
+        if self.vehicle_class != veh_class:
+            self.vehicle_class = veh_class
+            self.history.clear()
+            self.laptime_pace = self.laptime_best = reset_laptime(index)
+            self.consistency = 0.0
+
+    def lap_completed(self, index: int, elapsed: float):
+        """Start validating completed lap"""
+        self.check_class(index)
+        self.validating = elapsed
+        self.is_pit_lap = api.read.vehicle.in_pits(index)
+
+    def validate(self, index: int, elapsed: float):
+        """Validate completed lap, last laptime is updated with delay after passing finish line"""
+        timer = elapsed - self.validating
+        if 1 < timer <= 10:
+            laptime_last = api.read.timing.last_laptime(index)
+            if verify_laptime(laptime_last):
+                self.validating = 0
+                if not self.is_pit_lap:
+                    self.update_pace(laptime_last)
+                elif self.laptime_pace >= MAGIC_NUM:
+                    self.laptime_pace = reset_laptime(index)
+        elif timer > 10 or timer < 0:  # switch off after 10s
+            self.validating = 0
+
+    def update_pace(self, laptime_last: float):
+        """Update pace from completed lap"""
+        if self.laptime_pace > laptime_last:
+            self.laptime_pace = laptime_last
+        else:
+            self.laptime_pace = min(
+                calc.exp_mov_avg(self.ema_factor, self.laptime_pace, laptime_last),
+                self.laptime_pace + self.margin,
+            )
+        self.history.append(laptime_last)
+        self.laptime_best = min(self.history)
+        if len(self.history) > 1:
+            self.consistency = calc.std_dev(self.history)
+
+
+def reset_laptime(index: int) -> float:
+    """Reset laptime"""
+    return min(filter(verify_laptime,
+        (api.read.timing.last_laptime(index),
+        api.read.timing.best_laptime(index),
+        MAGIC_NUM)))
+
+
+def verify_laptime(laptime: float) -> bool:
+    """Verify laptime"""
+    return laptime > 0
@@ -21,13 +21,21 @@ Sectors module
 """
 
 from __future__ import annotations
+import logging
 from functools import partial
+from collections.abc import Callable
 
 from ._base import DataModule
 from ..module_info import minfo, SectorsInfo
 from ..api_control import api
+from ..event_bus import ebus, SECTOR_CROSSED
 from .. import validator as val
+from ..job_executor import jobs
+from ..userfile.lap_history import lap_history
 from ..userfile.sector_best import load_sector_best_file, save_sector_best_file
+from ..userfile.state_journal import state_journal, SECTORS_PENDING, SECTORS_SAVED
+
+logger = logging.getLogger(__name__)
 
 MAGIC_NUM = 99999.0
 
@@ -37,6 +45,8 @@ round6 = partial(round, ndigits=6)
 class Realtime(DataModule):
     """Sectors data"""
 
+    requires = ("module_events",)  # sector detection, started along with this module
+
     def __init__(self, config, module_name):
         super().__init__(config, module_name)
 
@@ -46,6 +56,8 @@ class Realtime(DataModule):
         update_interval = self.active_interval
 
         userpath_sector_best = self.cfg.path.sector_best
+        userpath_lap_history = self.cfg.path.lap_history
+        sector_events = ebus.subscribe(SECTOR_CROSSED)
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -64,39 +76,124 @@ class Realtime(DataModule):
                         defaults=[MAGIC_NUM,MAGIC_NUM,MAGIC_NUM],
                     )
 
+                    # Replay unsaved sector best (such as after crash)
+                    journal_values = state_journal.pending(SECTORS_PENDING, SECTORS_SAVED, combo_id)
+                    if journal_values is not None:
+                        (best_s_tb, best_s_pb, all_best_s_tb, all_best_s_pb
+                         ) = replay_sector_best(
+                            journal_values, session_id,
+                            best_s_tb, best_s_pb, all_best_s_tb, all_best_s_pb)
+                        save_sector_best(
+                            userpath_sector_best, combo_id, session_id,
+                            best_s_tb, best_s_pb, all_best_s_tb, all_best_s_pb)
+                        logger.info("JOURNAL: sectors best restored")
+                    last_journal = None
+
+                    record_sectors = partial(
+                        record_lap_sectors,
+                        filepath=userpath_lap_history,
+                        combo_id=combo_id,
+                    )
+
                     if self.mcfg["enable_all_time_best_sectors"]:
                         gen_calc_sectors_session = calc_sectors(None, best_s_tb, best_s_pb)
-                        gen_calc_sectors_alltime = calc_sectors(minfo.sectors, all_best_s_tb, all_best_s_pb)
+                        gen_calc_sectors_alltime = calc_sectors(
+                            minfo.sectors, all_best_s_tb, all_best_s_pb, record_sectors)
                     else:
-                        gen_calc_sectors_session = calc_sectors(minfo.sectors, best_s_tb, best_s_pb)
+                        gen_calc_sectors_session = calc_sectors(
+                            minfo.sectors, best_s_tb, best_s_pb, record_sectors)
                         gen_calc_sectors_alltime = calc_sectors(None, all_best_s_tb, all_best_s_pb)
                     next(gen_calc_sectors_session)
                     next(gen_calc_sectors_alltime)
-
-                # Run calculation
-                tele_sectors = telemetry_sectors()
-                gen_calc_sectors_session.send(tele_sectors)
-                gen_calc_sectors_alltime.send(tele_sectors)
+                    checking = True  # initial check on current sector
+                    sector_events.clear()
+
+                # Sector detection
+                player_slot_id = api.read.vehicle.slot_id()
+                for event in sector_events.drain():
+                    if event.slotID == player_slot_id:
+                        checking = True
+
+                # Run calculation, until sector time updated
+                if checking:
+                    tele_sectors = telemetry_sectors()
+                    (best_s_tb, best_s_pb, new_best_session, checking_session
+                     ) = gen_calc_sectors_session.send(tele_sectors)
+                    (all_best_s_tb, all_best_s_pb, new_best_all, checking_alltime
+                     ) = gen_calc_sectors_alltime.send(tele_sectors)
+                    checking = checking_session or checking_alltime
+
+                    # Journal new sector best, not saved until inactive
+                    if new_best_all or new_best_session:
+                        journal = (
+                            *session_id, *best_s_tb, *best_s_pb, *all_best_s_tb, *all_best_s_pb)
+                        if last_journal != journal:
+                            last_journal = journal
+                            state_journal.append(SECTORS_PENDING, combo_id, journal)
 
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
 
-                    best_s_tb, best_s_pb, new_best_session = gen_calc_sectors_session.send(tele_sectors)
-                    all_best_s_tb, all_best_s_pb, new_best_all = gen_calc_sectors_alltime.send(tele_sectors)
                     if new_best_all or new_best_session:
-                        save_sector_best_file(
-                            filepath=userpath_sector_best,
-                            filename=combo_id,
-                            dataset=(
-                                session_id,
-                                list(map(round6, best_s_tb)),
-                                list(map(round6, best_s_pb)),
-                                list(map(round6, all_best_s_tb)),
-                                list(map(round6, all_best_s_pb))
-                            ),
-                        )
+                        save_sector_best(
+                            userpath_sector_best, combo_id, session_id,
+                            best_s_tb, best_s_pb, all_best_s_tb, all_best_s_pb)
+
+        ebus.unsubscribe(sector_events)
+
+
+def save_sector_best(
+    filepath: str, combo_id: str, session_id: tuple[int, int, int],
+    best_s_tb: list, best_s_pb: list, all_best_s_tb: list, all_best_s_pb: list):
+    """Save sector best file in background"""
+    dataset = (
+        session_id,
+        list(map(round6, best_s_tb)),
+        list(map(round6, best_s_pb)),
+        list(map(round6, all_best_s_tb)),
+        list(map(round6, all_best_s_pb))
+    )
+    jobs.submit("save sector best", write_sector_best, filepath, combo_id, dataset)
+
+
+def write_sector_best(filepath: str, combo_id: str, dataset: tuple):
+    """Write sector best file, and mark journal as saved"""
+    save_sector_best_file(
+        filepath=filepath,
+        filename=combo_id,
+        dataset=dataset,
+    )
+    state_journal.append(SECTORS_SAVED, combo_id)
+
+
+def replay_sector_best(
+    journal_values: tuple[float, ...], session_id: tuple[int, int, int],
+    best_s_tb: list, best_s_pb: list, all_best_s_tb: list, all_best_s_pb: list):
+    """Merge unsaved sector best from journal, keep faster sector time"""
+    # Session best only if same session, same as sector best file
+    if (journal_values[0] == session_id[0] and
+        journal_values[1] <= session_id[1] and
+        journal_values[2] <= session_id[2]):
+        best_s_tb = merge_sector_tb(best_s_tb, journal_values[3:6])
+        best_s_pb = merge_sector_pb(best_s_pb, journal_values[6:9])
+    all_best_s_tb = merge_sector_tb(all_best_s_tb, journal_values[9:12])
+    all_best_s_pb = merge_sector_pb(all_best_s_pb, journal_values[12:15])
+    return best_s_tb, best_s_pb, all_best_s_tb, all_best_s_pb
+
+
+def merge_sector_tb(best_s_tb: list, journal_s_tb: tuple) -> list:
+    """Merge theoretical best sector time"""
+    return [min(best, journal) for best, journal in zip(best_s_tb, journal_s_tb)]
+
+
+def merge_sector_pb(best_s_pb: list, journal_s_pb: tuple) -> list:
+    """Merge personal best laptime sector time"""
+    journal_s_pb = list(journal_s_pb)
+    if val.sector_time(journal_s_pb) and sum(journal_s_pb) < sum(best_s_pb):
+        return journal_s_pb
+    return best_s_pb
 
 
 def telemetry_sectors() -> tuple[int, float, float, float, float]:
@@ -109,8 +206,27 @@ def telemetry_sectors() -> tuple[int, float, float, float, float]:
     return sector_idx, laptime_valid, curr_sector1, curr_sector2, last_sector2
 
 
-def calc_sectors(output: SectorsInfo, best_s_tb: list, best_s_pb: list):
-    """Calculate sectors data"""
+def record_lap_sectors(sectors: list, filepath: str, combo_id: str):
+    """Record completed lap sector times to lap history"""
+    lap_history.record(
+        filepath=filepath,
+        combo_id=combo_id,
+        session_id=api.read.check.session_id(),
+        lap=api.read.lap.completed_laps() - 1,
+        sector1=round6(sectors[0]),
+        sector2=round6(sectors[1]),
+        sector3=round6(sectors[2]),
+    )
+
+
+def calc_sectors(
+    output: SectorsInfo, best_s_tb: list, best_s_pb: list, recorder: Callable | None = None):
+    """Calculate sectors data
+
+    Yields:
+        Best sector times, new best state, and whether sector time is still being checked.
+    """
+    checking = True
     no_delta_s = True
     new_best = False  # save check whether new sector best time is set
     last_sector_idx = -1  # previous recorded sector index value
@@ -121,7 +237,7 @@ def calc_sectors(output: SectorsInfo, best_s_tb: list, best_s_pb: list):
 
     while True:
         (sector_idx, laptime_valid, curr_sector1, curr_sector2, last_sector2
-         ) = yield best_s_tb, best_s_pb, new_best
+         ) = yield best_s_tb, best_s_pb, new_best, checking
 
         # Update previous & best sector time
         if last_sector_idx != sector_idx:  # keep checking until conditions met
@@ -148,6 +264,10 @@ def calc_sectors(output: SectorsInfo, best_s_tb: list, best_s_pb: list):
                     best_s_tb[2] = prev_s[2]
                     new_best = True
 
+                # Record completed lap sector time
+                if recorder is not None and val.sector_time(prev_s):
+                    recorder(prev_s)
+
                 # Save sector time from personal best laptime
                 if laptime_valid < laptime_best and val.sector_time(prev_s):
                     laptime_best = laptime_valid
@@ -207,3 +327,5 @@ def calc_sectors(output: SectorsInfo, best_s_tb: list, best_s_pb: list):
                 output.sectorBestPB = best_s_pb
                 output.deltaSectorBestPB = delta_s_pb
                 output.deltaSectorBestTB = delta_s_tb
+
+        checking = last_sector_idx != sector_idx
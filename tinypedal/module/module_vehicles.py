@@ -23,7 +23,14 @@ Vehicles module
 from __future__ import annotations
 
 from ._base import DataModule
-from ..module_info import minfo, MAX_VEHICLES, VehiclesInfo, VehiclePitTimer
+from ..module_info import (
+    minfo,
+    MAX_VEHICLES,
+    VEHICLE_GRID_SIZE,
+    VEHICLE_GRID_RANGE,
+    VehiclesInfo,
+    VehiclePitTimer,
+)
 from ..api_control import api
 from .. import calculation as calc
 
@@ -82,6 +89,7 @@ class Realtime(DataModule):
         nearest_line = 999999.0
         nearest_timegap = -999999.0
         nearest_yellow = 999999.0
+        nearby_grid = {}
 
         # Sorting reference index
         leader_idx = 0
@@ -151,6 +159,17 @@ class Realtime(DataModule):
                 # Relative distance & time gap
                 relative_straight_distance = data.relativeStraightDistance = calc.distance(
                     (plr_pos_x, plr_pos_y), (opt_pos_x, opt_pos_y))
+
+                # Nearby vehicle grid (non local players)
+                if relative_straight_distance < VEHICLE_GRID_RANGE:
+                    grid_cell = (
+                        int(data.relativeRotatedPositionX // VEHICLE_GRID_SIZE),
+                        int(data.relativeRotatedPositionY // VEHICLE_GRID_SIZE),
+                    )
+                    if grid_cell in nearby_grid:
+                        nearby_grid[grid_cell].append(index)
+                    else:
+                        nearby_grid[grid_cell] = [index]
                 plr_lap_distance = api.read.lap.distance()
                 plr_lap_progress = calc.lap_progress_distance(plr_lap_distance, track_length)
                 plr_laps_done = api.read.lap.completed_laps()
@@ -203,6 +222,7 @@ class Realtime(DataModule):
         output.nearestLine = nearest_line
         output.nearestTraffic = -nearest_timegap
         output.nearestYellow = nearest_yellow
+        output.nearbyGrid = nearby_grid
         output.drawOrder = draw_order
         output.dataSetVersion += 1
 
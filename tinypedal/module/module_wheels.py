@@ -21,8 +21,9 @@ Wheels module
 """
 
 from collections import deque
+from functools import partial
 
-from ._base import DataModule
+from ._base import DataModule, VehicleSlots
 from ..module_info import minfo
 from ..api_control import api
 from .. import calculation as calc
@@ -41,13 +42,14 @@ class Realtime(DataModule):
 
         output = minfo.wheels
 
-        list_radius_f = deque([], 160)
-        list_radius_r = deque([], 160)
         max_rot_bias_f = max(self.mcfg["maximum_rotation_difference_front"], 0.00001)
         max_rot_bias_r = max(self.mcfg["maximum_rotation_difference_rear"], 0.00001)
         min_rot_axle = max(self.mcfg["minimum_axle_rotation"], 0)
         min_coords = min(max(self.mcfg["cornering_radius_sampling_interval"], 5), 100)
-        list_coords = deque([(0,0)] * min_coords * 2, min_coords * 2)
+        vehicle_slots = VehicleSlots(
+            partial(WheelsState, min_coords, self.mcfg),
+            self.mcfg["number_of_tracked_vehicles"],
+        )
 
         while not self._event.wait(update_interval):
             if self.state.active:
@@ -56,25 +58,11 @@ class Realtime(DataModule):
                     reset = True
                     update_interval = self.active_interval
 
-                    if self.mcfg["last_vehicle_info"] == api.read.check.vehicle_id():
-                        radius_front = self.mcfg["last_wheel_radius_front"]
-                        radius_rear = self.mcfg["last_wheel_radius_rear"]
-                        min_samples_f = 160
-                        min_samples_r = 160
-                    else:
-                        list_radius_f.clear()
-                        list_radius_r.clear()
-                        radius_front = 0
-                        radius_rear = 0
-                        min_samples_f = 20
-                        min_samples_r = 20
-
-                    samples_slice_f = sample_slice_indices(min_samples_f)
-                    samples_slice_r = sample_slice_indices(min_samples_r)
-                    locking_f = 1
-                    locking_r = 1
-                    gps_last = 0
-                    cornering_radius = 0
+                    vehicle_slots.clear()
+
+                # Select focused vehicle state
+                veh = vehicle_slots.select(
+                    (api.read.vehicle.slot_id(), api.read.vehicle.vehicle_name()))
 
                 # Read telemetry
                 speed = api.read.vehicle.speed()
@@ -89,43 +77,48 @@ class Realtime(DataModule):
                 rot_bias_r = calc.wheel_rotation_bias(rot_axle_r, wheel_rot[2], wheel_rot[3])
 
                 if rot_axle_f < -min_rot_axle:
-                    locking_f = calc.differential_locking_percent(rot_axle_f, wheel_rot[0])
+                    veh.locking_f = calc.differential_locking_percent(rot_axle_f, wheel_rot[0])
                 if rot_axle_r < -min_rot_axle:
-                    locking_r = calc.differential_locking_percent(rot_axle_r, wheel_rot[2])
+                    veh.locking_r = calc.differential_locking_percent(rot_axle_r, wheel_rot[2])
 
                 # Record wheel radius value within max rotation difference
                 if rot_axle_f < -min_rot_axle and 0 < rot_bias_f < max_rot_bias_f:
-                    list_radius_f.append(calc.rot2radius(speed, rot_axle_f))
+                    veh.list_radius_f.append(calc.rot2radius(speed, rot_axle_f))
                     # Front average wheel radius
-                    if len(list_radius_f) >= min_samples_f:
-                        radius_front = calc.mean(sorted(list_radius_f)[samples_slice_f])
-                        if min_samples_f < 160:
-                            min_samples_f *= 2  # double sample counts
-                            samples_slice_f = sample_slice_indices(min_samples_f)
+                    if len(veh.list_radius_f) >= veh.min_samples_f:
+                        veh.radius_front = calc.mean(
+                            sorted(veh.list_radius_f)[veh.samples_slice_f])
+                        if veh.min_samples_f < 160:
+                            veh.min_samples_f *= 2  # double sample counts
+                            veh.samples_slice_f = sample_slice_indices(veh.min_samples_f)
 
                 if rot_axle_r < -min_rot_axle and 0 < rot_bias_r < max_rot_bias_r:
-                    list_radius_r.append(calc.rot2radius(speed, rot_axle_r))
+                    veh.list_radius_r.append(calc.rot2radius(speed, rot_axle_r))
                     # Rear average wheel radius
-                    if len(list_radius_r) >= min_samples_r:
-                        radius_rear = calc.mean(sorted(list_radius_r)[samples_slice_r])
-                        if min_samples_r < 160:
-                            min_samples_r *= 2
-                            samples_slice_r = sample_slice_indices(min_samples_r)
+                    if len(veh.list_radius_r) >= veh.min_samples_r:
+                        veh.radius_rear = calc.mean(
+                            sorted(veh.list_radius_r)[veh.samples_slice_r])
+                        if veh.min_samples_r < 160:
+                            veh.min_samples_r *= 2
+                            veh.samples_slice_r = sample_slice_indices(veh.min_samples_r)
 
                 # Calculate cornering radius based on tri-coordinates position
-                if gps_last != gps_curr:
-                    gps_last = gps_curr
+                if veh.gps_last != gps_curr:
+                    veh.gps_last = gps_curr
+                    list_coords = veh.list_coords
                     list_coords.append(gps_curr)
                     arc_center_pos = calc.tri_coords_circle_center(
                         *list_coords[0], *list_coords[min_coords], *list_coords[-1])
-                    cornering_radius = calc.distance(list_coords[0], arc_center_pos)
+                    veh.cornering_radius = calc.distance(list_coords[0], arc_center_pos)
 
                 # Output wheels data
+                radius_front = veh.radius_front
+                radius_rear = veh.radius_rear
                 output.radiusFront = radius_front
                 output.radiusRear = radius_rear
-                output.lockingPercentFront = locking_f
-                output.lockingPercentRear = locking_r
-                output.corneringRadius = cornering_radius
+                output.lockingPercentFront = veh.locking_f
+                output.lockingPercentRear = veh.locking_r
+                output.corneringRadius = veh.cornering_radius
                 output.slipRatio[0] = calc.slip_ratio(wheel_rot[0], radius_front, speed)
                 output.slipRatio[1] = calc.slip_ratio(wheel_rot[1], radius_front, speed)
                 output.slipRatio[2] = calc.slip_ratio(wheel_rot[2], radius_rear, speed)
@@ -142,6 +135,52 @@ class Realtime(DataModule):
                     self.cfg.save()
 
 
+class WheelsState:
+    """Wheels state of single vehicle"""
+
+    __slots__ = (
+        "list_radius_f",
+        "list_radius_r",
+        "radius_front",
+        "radius_rear",
+        "min_samples_f",
+        "min_samples_r",
+        "samples_slice_f",
+        "samples_slice_r",
+        "locking_f",
+        "locking_r",
+        "gps_last",
+        "cornering_radius",
+        "list_coords",
+    )
+
+    def __init__(self, min_coords: int, mcfg: dict):
+        """
+        Args:
+            min_coords: cornering radius sampling interval.
+            mcfg: module config, load last wheel radius if same vehicle.
+        """
+        self.list_radius_f = deque([], 160)
+        self.list_radius_r = deque([], 160)
+        if mcfg["last_vehicle_info"] == api.read.check.vehicle_id():
+            self.radius_front = mcfg["last_wheel_radius_front"]
+            self.radius_rear = mcfg["last_wheel_radius_rear"]
+            self.min_samples_f = 160
+            self.min_samples_r = 160
+        else:
+            self.radius_front = 0
+            self.radius_rear = 0
+            self.min_samples_f = 20
+            self.min_samples_r = 20
+        self.samples_slice_f = sample_slice_indices(self.min_samples_f)
+        self.samples_slice_r = sample_slice_indices(self.min_samples_r)
+        self.locking_f = 1
+        self.locking_r = 1
+        self.gps_last = 0
+        self.cornering_radius = 0
+        self.list_coords = deque([(0,0)] * min_coords * 2, min_coords * 2)
+
+
 def sample_slice_indices(samples: int) -> slice:
     """Calculate sample slice indices from minimum samples"""
     return slice(int(samples * 0.25), int(samples * 0.75))
@@ -47,8 +47,14 @@ def create_module_pack(target: Any) -> dict:
 class ModuleControl:
     """Module and widget control
 
+    Module can declare names of other modules it requires with "requires"
+    class attribute, which are started along with module even if not enabled.
+    Required module names that are not in target are started from provider.
+
     Args:
         target: module.
+        type_id: module type indentifier, either "module" or "widget".
+        provider: control of modules that can be required by modules of target.
 
     Attributes:
         type_id: module type indentifier, either "module" or "widget".
@@ -58,17 +64,23 @@ class ModuleControl:
         "type_id",
         "_imported_modules",
         "_active_modules",
+        "_provider",
+        "_dependents",
     )
 
-    def __init__(self, target: Any, type_id: str):
+    def __init__(self, target: Any, type_id: str, provider: ModuleControl | None = None):
         self.type_id = type_id
         self._imported_modules = create_module_pack(target)
         self._active_modules: dict = {}
+        self._provider = provider
+        self._dependents: list[ModuleControl] = []
+        if provider is not None:
+            provider._dependents.append(self)
 
     def start(self, name: str = ""):
         """Start module, specify name for selected module"""
         if name:
-            self.__start_selected(name)
+            self.__start_selected(name, self.__is_required(name))
         else:
             self.__start_enabled()
 
@@ -88,7 +100,11 @@ class ModuleControl:
         """Toggle module"""
         if cfg.user.setting[name]["enable"]:
             cfg.user.setting[name]["enable"] = False
-            self.__close_selected(name)
+            if self.__is_required(name):  # keep running for active modules that require it
+                logger.info("REQUIRED: %s kept running", name.replace("_", " "))
+            else:
+                self.__close_selected(name)
+            self.__close_unrequired()
         else:
             cfg.user.setting[name]["enable"] = True
             self.__start_selected(name)
@@ -103,10 +119,10 @@ class ModuleControl:
         logger.info("ACTIVE: all %s(s)", self.type_id)
 
     def disable_all(self):
-        """Disable all modules"""
+        """Disable all modules, keep running modules that are required"""
         for _name in self._imported_modules.keys():
             cfg.user.setting[_name]["enable"] = False
-        self.close()
+        self.__close_unrequired()
         cfg.save()
         logger.info("CLOSED: all %s(s)", self.type_id)
 
@@ -115,13 +131,47 @@ class ModuleControl:
         for _name in self._imported_modules.keys():
             self.__start_selected(_name)
 
-    def __start_selected(self, name: str):
-        """Start selected module"""
-        if cfg.user.setting[name]["enable"] and name not in self._active_modules:
+    def __start_selected(self, name: str, required: bool = False):
+        """Start selected module, and modules it requires
+
+        Args:
+            name: module name.
+            required: start even if not enabled, as required by other module.
+        """
+        if (required or cfg.user.setting[name]["enable"]) and name not in self._active_modules:
+            for required_name in self.__requires(name):
+                if required_name in self._imported_modules:
+                    self.__start_selected(required_name, True)
+                elif self._provider is not None:
+                    self._provider.__start_selected(required_name, True)
             # Create module instance and add to dict
             self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
             self._active_modules[name].start()
 
+    def __requires(self, name: str) -> tuple[str, ...]:
+        """Names of modules required by selected module"""
+        return getattr(self._imported_modules[name].Realtime, "requires", ())
+
+    def __is_required(self, name: str) -> bool:
+        """Whether module is required by any other active module, or by active dependent module"""
+        return any(
+            name in control.__requires(active_name)
+            for control in (self, *self._dependents)
+            for active_name in control._active_modules
+            if control is not self or active_name != name
+        )
+
+    def __close_unrequired(self):
+        """Close active modules (and provider modules) that are disabled and no longer required
+
+        Closed in reverse of start order, as required modules are started first.
+        """
+        for _name in reversed(tuple(self._active_modules)):
+            if not cfg.user.setting[_name]["enable"] and not self.__is_required(_name):
+                self.__close_selected(_name)
+        if self._provider is not None:
+            self._provider.__close_unrequired()
+
     def __close_enabled(self):
         """Close all enabled module"""
         for _name in tuple(self._active_modules):
@@ -154,4 +204,4 @@ class ModuleControl:
 
 
 mctrl = ModuleControl(module, "module")
-wctrl = ModuleControl(widget, "widget")
+wctrl = ModuleControl(widget, "widget", mctrl)
@@ -21,10 +21,15 @@ Module info
 """
 
 from __future__ import annotations
+from array import array
+from bisect import bisect_left, insort
 from collections import deque
-from typing import NamedTuple
+from math import isfinite
+from typing import Iterator, NamedTuple
 
 MAX_VEHICLES = 128
+VEHICLE_GRID_SIZE = 10  # meters, nearby vehicle grid cell size
+VEHICLE_GRID_RANGE = 200  # meters, maximum distance of vehicles added to nearby grid
 
 
 class DeltaInfo:
@@ -156,6 +161,190 @@ class ConsumptionDataSet(NamedTuple):
     batteryRegenLast: float = 0.0
 
 
+CONSUMPTION_TYPECODES = "lbddddd"  # typed column for each ConsumptionDataSet field
+CONSUMPTION_STATS = (  # fields with running statistics from valid laps
+    "lapTimeLast",
+    "lastLapUsedFuel",
+    "lastLapUsedEnergy",
+    "batteryDrainLast",
+    "batteryRegenLast",
+)
+
+
+class ConsumptionHistory:
+    """Consumption history ring buffer
+
+    Fixed capacity typed columns, newest data set at index 0.
+    Running statistics of valid laps are updated on each append,
+    oldest data set is removed from statistics once overwritten:
+        mean: running sum & count, O(1).
+        minimum, maximum: monotonic queue of (lap sequence, value), O(1) amortized.
+        percentile: sorted list of values, bisect insert & delete.
+    Non-finite values are excluded from statistics.
+
+    Args:
+        capacity: maximum number of data sets.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_head",
+        "_size",
+        "_sequence",
+        "_columns",
+        "_stats_index",
+        "_stats_count",
+        "_stats_sum",
+        "_stats_min",
+        "_stats_max",
+        "_stats_sorted",
+        "_valid_laps",
+    )
+
+    def __init__(self, capacity: int):
+        self._capacity = max(capacity, 1)
+        self._head = 0  # next write slot, also oldest slot if full
+        self._size = 0
+        self._sequence = 0  # total number of appended data sets
+        self._columns = tuple(
+            array(typecode, [0]) * self._capacity
+            for typecode in CONSUMPTION_TYPECODES
+        )
+        self._stats_index = tuple(
+            ConsumptionDataSet._fields.index(name) for name in CONSUMPTION_STATS
+        )
+        self._stats_count: dict[str, int] = {name: 0 for name in CONSUMPTION_STATS}
+        self._stats_sum: dict[str, float] = {name: 0.0 for name in CONSUMPTION_STATS}
+        self._stats_min: dict[str, deque[tuple[int, float]]] = {
+            name: deque() for name in CONSUMPTION_STATS}
+        self._stats_max: dict[str, deque[tuple[int, float]]] = {
+            name: deque() for name in CONSUMPTION_STATS}
+        self._stats_sorted: dict[str, list[float]] = {name: [] for name in CONSUMPTION_STATS}
+        self._valid_laps = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> ConsumptionDataSet:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("consumption history index out of range")
+        slot = (self._head - 1 - index) % self._capacity
+        columns = self._columns
+        return ConsumptionDataSet(
+            columns[0][slot],
+            bool(columns[1][slot]),
+            columns[2][slot],
+            columns[3][slot],
+            columns[4][slot],
+            columns[5][slot],
+            columns[6][slot],
+        )
+
+    def __iter__(self) -> Iterator[ConsumptionDataSet]:
+        for index in range(self._size):
+            yield self[index]
+
+    def appendleft(self, data: ConsumptionDataSet):
+        """Add new data set, overwrite oldest data set if full"""
+        slot = self._head
+        columns = self._columns
+        if self._size == self._capacity and columns[1][slot]:
+            self.__remove_stats(slot, self._sequence - self._capacity)
+        for column, value in zip(columns, data):
+            column[slot] = value
+        if data.isValidLap:
+            self.__add_stats(slot, self._sequence)
+        self._head = (slot + 1) % self._capacity
+        self._sequence += 1
+        if self._size < self._capacity:
+            self._size += 1
+
+    def __add_stats(self, slot: int, sequence: int):
+        """Add data set in slot to running statistics"""
+        self._valid_laps += 1
+        for name, column_index in zip(CONSUMPTION_STATS, self._stats_index):
+            value = self._columns[column_index][slot]
+            if not isfinite(value):
+                continue
+            self._stats_count[name] += 1
+            self._stats_sum[name] += value
+            queue_min = self._stats_min[name]
+            while queue_min and queue_min[-1][1] >= value:
+                queue_min.pop()
+            queue_min.append((sequence, value))
+            queue_max = self._stats_max[name]
+            while queue_max and queue_max[-1][1] <= value:
+                queue_max.pop()
+            queue_max.append((sequence, value))
+            insort(self._stats_sorted[name], value)
+
+    def __remove_stats(self, slot: int, sequence: int):
+        """Remove (oldest) data set in slot from running statistics"""
+        self._valid_laps -= 1
+        for name, column_index in zip(CONSUMPTION_STATS, self._stats_index):
+            value = self._columns[column_index][slot]
+            if not isfinite(value):
+                continue
+            self._stats_count[name] -= 1
+            self._stats_sum[name] -= value
+            queue_min = self._stats_min[name]
+            if queue_min and queue_min[0][0] == sequence:
+                queue_min.popleft()
+            queue_max = self._stats_max[name]
+            if queue_max and queue_max[0][0] == sequence:
+                queue_max.popleft()
+            data = self._stats_sorted[name]
+            del data[bisect_left(data, value)]
+        if self._valid_laps == 0:  # reset accumulated float error
+            for name in CONSUMPTION_STATS:
+                self._stats_sum[name] = 0.0
+
+    @property
+    def valid_laps(self) -> int:
+        """Number of valid laps in history"""
+        return self._valid_laps
+
+    def mean(self, name: str) -> float:
+        """Mean value of valid laps, 0 if no valid lap"""
+        samples = self._stats_count[name]
+        if samples > 0:
+            return self._stats_sum[name] / samples
+        return 0.0
+
+    def minimum(self, name: str) -> float:
+        """Minimum value of valid laps, 0 if no valid lap"""
+        queue_min = self._stats_min[name]
+        if queue_min:
+            return queue_min[0][1]
+        return 0.0
+
+    def maximum(self, name: str) -> float:
+        """Maximum value of valid laps, 0 if no valid lap"""
+        queue_max = self._stats_max[name]
+        if queue_max:
+            return queue_max[0][1]
+        return 0.0
+
+    def percentile(self, name: str, percent: float) -> float:
+        """Percentile value (linear interpolation) of valid laps, 0 if no valid lap
+
+        Args:
+            name: data set field name.
+            percent: percentile fraction, 0 to 1.
+        """
+        data = self._stats_sorted[name]
+        if not data:
+            return 0.0
+        position = min(max(percent, 0), 1) * (len(data) - 1)
+        index_lower = int(position)
+        if index_lower + 1 < len(data):
+            return data[index_lower] + (position - index_lower) * (
+                data[index_lower + 1] - data[index_lower])
+        return data[index_lower]
+
+
 class HistoryInfo:
     """History output data"""
 
@@ -164,7 +353,8 @@ class HistoryInfo:
     )
 
     def __init__(self):
-        self.consumption: deque[ConsumptionDataSet] = deque([ConsumptionDataSet()], 100)
+        self.consumption: ConsumptionHistory = ConsumptionHistory(100)
+        self.consumption.appendleft(ConsumptionDataSet())
 
 
 class HybridInfo:
@@ -217,6 +407,30 @@ class MappingInfo:
         self.lastModified: float = 0.0
 
 
+class PaceInfo:
+    """Pace module output data
+
+    Per-vehicle laptime pace, indexed by vehicle index.
+    """
+
+    __slots__ = (
+        "total",
+        "laptimePace",
+        "laptimeBest",
+        "consistency",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset"""
+        self.total: int = 0
+        self.laptimePace = array("d", bytes(8 * MAX_VEHICLES))
+        self.laptimeBest = array("d", bytes(8 * MAX_VEHICLES))
+        self.consistency = array("d", bytes(8 * MAX_VEHICLES))
+
+
 class NotesInfo:
     """Notes module output data"""
 
@@ -330,6 +544,7 @@ class VehiclesInfo:
         "nearestLine",
         "nearestTraffic",
         "nearestYellow",
+        "nearbyGrid",
     )
 
     def __init__(self):
@@ -344,6 +559,7 @@ class VehiclesInfo:
         self.nearestLine: float = 999999.0
         self.nearestTraffic: float = 999999.0
         self.nearestYellow: float = 999999.0
+        self.nearbyGrid: dict[tuple[int, int], list[int]] = {}
 
 
 class WheelsInfo:
@@ -383,7 +599,12 @@ class VehiclePitTimer:
 
 
 class VehicleDataSet:
-    """Vehicle data set"""
+    """Vehicle data set
+
+    Kept as per-vehicle __slots__ object rather than typed columns,
+    reading slot attribute is faster than indexing typed array,
+    which creates new float object on each read.
+    """
 
     __slots__ = (
         "isPlayer",
@@ -462,6 +683,7 @@ class ModuleInfo:
         "history",
         "hybrid",
         "mapping",
+        "pace",
         "pacenotes",
         "relative",
         "restapi",
@@ -479,6 +701,7 @@ class ModuleInfo:
         self.history = HistoryInfo()
         self.hybrid = HybridInfo()
         self.mapping = MappingInfo()
+        self.pace = PaceInfo()
         self.pacenotes = NotesInfo()
         self.relative = RelativeInfo()
         self.restapi = RestAPIInfo()
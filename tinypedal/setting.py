@@ -91,6 +91,7 @@ class FilePath:
         "sector_best",
         "energy_delta",
         "fuel_delta",
+        "lap_history",
         "track_map",
         "pace_notes",
         "track_notes",
@@ -106,6 +107,7 @@ class FilePath:
         self.sector_best: str = ""
         self.energy_delta: str = ""
         self.fuel_delta: str = ""
+        self.lap_history: str = ""
         self.track_map: str = ""
         self.pace_notes: str = ""
         self.track_notes: str = ""
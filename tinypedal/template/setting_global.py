@@ -51,6 +51,7 @@ GLOBAL_DEFAULT = {
         "sector_best_path": "deltabest/",
         "energy_delta_path": "deltabest/",
         "fuel_delta_path": "deltabest/",
+        "lap_history_path": "deltabest/",
         "track_map_path": "trackmap/",
         "pace_notes_path": "pacenotes/",
         "track_notes_path": "tracknotes/",
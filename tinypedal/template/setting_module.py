@@ -37,6 +37,11 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "minimum_delta_distance": 5,
     },
+    "module_events": {
+        "enable": True,
+        "update_interval": 50,
+        "idle_update_interval": 400,
+    },
     "module_force": {
         "enable": True,
         "update_interval": 10,
@@ -47,6 +52,7 @@ MODULE_DEFAULT = {
         "max_average_g_force_difference": 0.2,
         "max_average_g_force_reset_delay": 30,
         "max_braking_rate_reset_delay": 60,
+        "number_of_tracked_vehicles": 8,
     },
     "module_fuel": {
         "enable": True,
@@ -69,6 +75,13 @@ MODULE_DEFAULT = {
         "update_interval": 10,
         "idle_update_interval": 400,
     },
+    "module_pace": {
+        "enable": True,
+        "update_interval": 100,
+        "idle_update_interval": 400,
+        "laptime_pace_samples": 6,
+        "laptime_pace_margin": 5,
+    },
     "module_relative": {
         "enable": True,
         "update_interval": 100,
@@ -106,6 +119,7 @@ MODULE_DEFAULT = {
         "maximum_rotation_difference_front": 0.002,
         "maximum_rotation_difference_rear": 0.002,
         "cornering_radius_sampling_interval": 10,
+        "number_of_tracked_vehicles": 8,
         "last_vehicle_info": "unknown",
         "last_wheel_radius_front": 0,
         "last_wheel_radius_rear": 0,
@@ -20,9 +20,11 @@
 Fuel calculator
 """
 
+from __future__ import annotations
+import threading
 from math import ceil, floor
 
-from PySide2.QtCore import Qt, QMargins
+from PySide2.QtCore import Qt, QMargins, Signal
 from PySide2.QtGui import QColor, QPalette
 from PySide2.QtWidgets import (
     QWidget,
@@ -43,7 +45,8 @@ from PySide2.QtWidgets import (
 
 from ..api_control import api
 from ..setting import cfg
-from ..module_info import minfo
+from ..module_info import minfo, ConsumptionDataSet
+from ..userfile.lap_history import load_lap_history
 from .. import calculation as calc
 from .. import formatter as fmt
 from ._common import BaseDialog
@@ -64,6 +67,22 @@ def set_read_only_style(line_edit, invalid=False):
     line_edit.setStyleSheet(f"background:{color};")
 
 
+def load_consumption_history(filepath: str, combo_id: str) -> list[ConsumptionDataSet]:
+    """Load consumption history of combo from lap history database"""
+    return [
+        ConsumptionDataSet(
+            completedLaps=lap_data[0],
+            isValidLap=bool(lap_data[1]),
+            lapTimeLast=lap_data[2] or 0.0,
+            lastLapUsedFuel=lap_data[3] or 0.0,
+            lastLapUsedEnergy=lap_data[4] or 0.0,
+            batteryDrainLast=lap_data[5] or 0.0,
+            batteryRegenLast=lap_data[6] or 0.0,
+        )
+        for lap_data in load_lap_history(filepath, combo_id)
+    ]
+
+
 def fuel_units(fuel):
     """2 different fuel unit conversion, default is Liter"""
     if cfg.units["fuel_unit"] == "Gallon":
@@ -79,11 +98,18 @@ def fuel_unit_text():
 
 
 class FuelCalculator(BaseDialog):
-    """Fuel calculator"""
+    """Fuel calculator
+
+    Attributes:
+        history_loaded: signal for lap history database loaded (request id, history).
+    """
+    history_loaded = Signal(int, list)
 
     def __init__(self, master):
         super().__init__(master)
         self.set_utility_title("Fuel Calculator")
+        self._history_request = 0
+        self.history_loaded.connect(self.__history_loaded)
 
         # Set view
         self.panel_calculator = QWidget()
@@ -166,12 +192,44 @@ class FuelCalculator(BaseDialog):
             self.input_fuel.energy_used.setValue(energy_used)
 
     def refresh_table(self):
-        """Refresh history data table"""
+        """Refresh history data table
+
+        Show current session consumption history first,
+        then replace with lap history of current combo once loaded
+        from database in background thread, so database access
+        does not block GUI.
+        """
+        self._history_request += 1
+        self.fill_table(list(minfo.history.consumption))
+        combo_id = api.read.check.combo_id()
+        if combo_id:
+            threading.Thread(
+                target=self.__loading_history,
+                args=(self._history_request, cfg.path.lap_history, combo_id),
+                daemon=True,
+            ).start()
+
+    def __loading_history(self, request_id: int, filepath: str, combo_id: str):
+        """Lap history loading thread"""
+        consumption_history = load_consumption_history(filepath, combo_id)
+        if consumption_history:
+            try:
+                self.history_loaded.emit(request_id, consumption_history)
+            except RuntimeError:  # dialog closed
+                pass
+
+    def __history_loaded(self, request_id: int, consumption_history: list):
+        """Update table with loaded lap history, skip outdated request"""
+        if request_id == self._history_request:
+            self.fill_table(consumption_history)
+
+    def fill_table(self, consumption_history: list[ConsumptionDataSet]):
+        """Fill history data table"""
         self.table_history.clearContents()
-        self.table_history.setRowCount(len(minfo.history.consumption))
+        self.table_history.setRowCount(len(consumption_history))
         row_index = 0
 
-        for lap_data in minfo.history.consumption:
+        for lap_data in consumption_history:
             lapnumber = self.__add_table_item(f"{lap_data.completedLaps}", 0)
             laptime = self.__add_table_item(calc.sec2laptime(lap_data.lapTimeLast), 33)
             used_fuel = self.__add_table_item(f"{fuel_units(lap_data.lastLapUsedFuel):.3f}", 33)
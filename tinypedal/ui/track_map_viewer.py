@@ -21,6 +21,7 @@ Track map viewer
 """
 
 import os
+from math import ceil, log2
 
 from PySide2.QtCore import Qt, Signal, QPointF, QRect
 from PySide2.QtGui import QPainterPath, QPainter, QPen
@@ -45,6 +46,7 @@ from ..setting import cfg
 from ._common import BaseDialog, QSS_EDITOR_BUTTON
 from . config import UserConfig
 from .. import calculation as calc
+from ..map_geometry import geometry, MAP_PIXEL_TOLERANCE
 from ..userfile.track_map import load_track_map_file, QFILTER_SVG
 
 
@@ -104,7 +106,8 @@ class MapView(QWidget):
         self.raw_coords = None
         self.raw_dists = None
 
-        self.map_path = None
+        self.map_paths = {}
+        self.map_closed = False
         self.sfinish_path = None
         self.sector1_path = None
         self.sector2_path = None
@@ -373,19 +376,14 @@ class MapView(QWidget):
 
     def create_map_path(self, raw_coords, sectors_index):
         """Create map path"""
-        map_path = QPainterPath()
         sfinish_path = QPainterPath()
         sector1_path = QPainterPath()
         sector1_path = QPainterPath()
 
-        for index, coords in enumerate(raw_coords):
-            if index == 0:
-                map_path.moveTo(*coords)
-            else:
-                map_path.lineTo(*coords)
+        # Map paths are created on demand for each zoom level
+        self.map_paths.clear()
         # Close map loop if start & end distance less than 500 meters
-        if calc.distance(raw_coords[0], raw_coords[-1]) < 500:
-            map_path.closeSubpath()
+        self.map_closed = calc.distance(raw_coords[0], raw_coords[-1]) < 500
         # Create start/finish path
         sfinish_path = self.create_sector_path(
             sfinish_path, self.ecfg["start_line_length"], 0, 1)
@@ -397,11 +395,27 @@ class MapView(QWidget):
             sector1_path, self.ecfg["sector_line_length"],
             sectors_index[1], sectors_index[1] + 1)
 
-        self.map_path = map_path
         self.sfinish_path = sfinish_path
         self.sector1_path = sector1_path
         self.sector2_path = sector1_path
 
+    def select_map_path(self):
+        """Select map path simplified for current zoom level"""
+        zoom_level = ceil(log2(self.map_scale))
+        map_path = self.map_paths.get(zoom_level, None)
+        if map_path is None:
+            map_path = QPainterPath()
+            for index, coords in enumerate(geometry.simplify(
+                self.raw_coords, MAP_PIXEL_TOLERANCE / 2 ** zoom_level)):
+                if index == 0:
+                    map_path.moveTo(*coords)
+                else:
+                    map_path.lineTo(*coords)
+            if self.map_closed:
+                map_path.closeSubpath()
+            self.map_paths[zoom_level] = map_path
+        return map_path
+
     def create_sector_path(self, sector_path, length, node_idx1, node_idx2):
         """Create sector line"""
         pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
@@ -460,31 +474,24 @@ class MapView(QWidget):
         center_offset_y = self.center_y - pos_y * self.map_scale
 
         # Calculation
+        profile = geometry.profile(self.raw_coords, self.raw_dists, self.curve_nodes)
+        index = self.map_seek_index
         curve_section = list(gen_section_path(
-            self.map_nodes, self.curve_nodes, self.map_seek_index, self.raw_coords))
-        mid_index = int(len(curve_section)/2)
-        point_one = curve_section[0].x(), curve_section[0].y()
-        point_sec = curve_section[1].x(), curve_section[1].y()
-        point_mid = curve_section[mid_index].x(), curve_section[mid_index].y()
+            self.map_nodes, self.curve_nodes, index, self.raw_coords))
+        point_one = self.raw_coords[index]
         point_end = curve_section[-1].x(), curve_section[-1].y()
-        arc_center_pos = calc.tri_coords_circle_center(*point_one, *point_mid, *point_end)
-        arc_radius = calc.distance(point_one, arc_center_pos)
-        arc_angle = calc.quad_coords_angle(
-            arc_center_pos, point_one, point_mid, point_end)
-        yaw_radians = calc.oriyaw2rad(
-            point_sec[1] - point_one[1], point_sec[0] - point_one[0])
-        turn_direct = calc.turning_direction(
-            yaw_radians, *point_one, *point_end)
-
-        curve_length = calc_section_length(
-            self.map_length, self.map_nodes, self.curve_nodes,
-            self.map_seek_index, self.raw_dists)
+        arc_center_pos = profile.center_x[index], profile.center_y[index]
+        arc_radius = profile.radius[index]
+        arc_angle = profile.arc_angle[index]
+        yaw_radians = profile.heading[index]
+        turn_direct = profile.direction[index]
+
+        curve_length = profile.length[index]
         length_desc = calc.select_grade(self.length_grades, curve_length)
         curve_desc = curve_description(arc_radius, turn_direct, self.curve_grades)
 
-        slope_delta = calc_section_height_delta(
-            self.map_nodes, self.curve_nodes, self.map_seek_index, self.raw_dists)
-        slope_percent = calc.slope_percent(slope_delta, curve_length)
+        slope_delta = profile.height[index]
+        slope_percent = profile.gradient[index]
         slope_angle = calc.slope_angle(slope_delta, curve_length)
         slope_desc = calc.select_grade(self.slope_grades, abs(slope_percent))
 
@@ -515,18 +522,20 @@ class MapView(QWidget):
 
     def draw_map_image(self, painter):
         """Draw map image"""
+        map_path = self.select_map_path()
+
         # Draw map outline
         if self.ecfg["map_outline_width"] > 0:
             self.pen.setWidth(self.ecfg["map_width"] + self.ecfg["map_outline_width"])
             self.pen.setColor(self.ecfg["map_outline_color"])
             painter.setPen(self.pen)
-            painter.drawPath(self.map_path)
+            painter.drawPath(map_path)
 
         # Draw map
         self.pen.setWidth(self.ecfg["map_width"])
         self.pen.setColor(self.ecfg["map_color"])
         painter.setPen(self.pen)
-        painter.drawPath(self.map_path)
+        painter.drawPath(map_path)
 
         # Draw start/finish line
         self.pen.setWidth(self.ecfg["start_line_width"])
@@ -683,32 +692,6 @@ def gen_section_path(
         yield QPointF(*raw_coords[index])
 
 
-def calc_section_length(
-    map_length: float, total_nodes: int, section_nodes: int,
-    seek_index: int, raw_dists: tuple) -> float:
-    """Calculate section length from selected nodes"""
-    max_nodes = int(min(section_nodes, total_nodes - 2))
-    end_index = seek_index + max_nodes
-    if end_index >= total_nodes:
-        length = (
-            map_length - raw_dists[seek_index][0]
-            + raw_dists[end_index - total_nodes][0])
-    else:
-        length = raw_dists[end_index][0] - raw_dists[seek_index][0]
-    return length
-
-
-def calc_section_height_delta(
-    total_nodes: int, section_nodes: int, seek_index: int, raw_dists: tuple) -> float:
-    """Calculate section height delta from selected nodes"""
-    max_nodes = int(min(section_nodes, total_nodes - 2))
-    end_index = seek_index + max_nodes
-    if end_index >= total_nodes:
-        end_index -= total_nodes
-    height_delta = raw_dists[end_index][1] - raw_dists[seek_index][1]
-    return height_delta
-
-
 def curve_description(arc_radius: float, turn_direct: int, curve_grade: tuple) -> str:
     """Curve description"""
     if arc_radius >= curve_grade[-1][0]:
@@ -35,6 +35,7 @@ from PySide2.QtWidgets import (
 )
 
 from ..api_control import api
+from ..class_style import cstyle
 from ..setting import cfg, copy_setting
 from ..module_control import wctrl
 from .. import formatter as fmt
@@ -220,6 +221,7 @@ class VehicleClassEditor(BaseEditor):
         """Save setting"""
         self.update_classes_temp()
         cfg.user.classes = copy_setting(self.classes_temp)
+        cstyle.reset()
         cfg.save(0, filetype="classes")
         while cfg.is_saving:  # wait saving finish
             time.sleep(0.01)
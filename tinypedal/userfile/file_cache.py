@@ -0,0 +1,151 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+User file cache function
+"""
+
+from __future__ import annotations
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+MAX_CACHED_FILES = 16
+
+
+class UserFileCache:
+    """Parsed user file cache
+
+    Parsed file data is kept in memory by full file name, and reused
+    if file is not modified since last load, so that returning to track
+    (such as exiting garage) does not read and parse same file again.
+    Data saved from background job is stored before saving (see store()),
+    and returned until file is saved.
+    Cached data is shared, and must not be modified by caller.
+
+    Args:
+        max_files: maximum number of cached files,
+            least recently loaded file is removed once exceeded.
+    """
+
+    __slots__ = (
+        "_files",
+        "_max_files",
+        "_lock",
+    )
+
+    def __init__(self, max_files: int = MAX_CACHED_FILES):
+        self._files: OrderedDict[str, tuple[tuple[int, int], Any]] = OrderedDict()
+        self._max_files = max(max_files, 1)
+        self._lock = threading.Lock()
+
+    def load(self, filename_full: str, loader: Callable, **kwargs: Any) -> Any:
+        """Load parsed file data from cache, reload from file only if modified
+
+        Args:
+            filename_full: full file name, which is used as cache key.
+            loader: file loader function.
+            kwargs: loader function arguments.
+
+        Returns:
+            Loader function return value.
+        """
+        with self._lock:
+            cached = self._files.get(filename_full, None)
+            if cached is not None and cached[0] is None:  # file is being saved
+                self._files.move_to_end(filename_full)
+                return cached[1]
+        modified = file_stamp(filename_full)
+        if modified is None:  # not cache missing file
+            self.remove(filename_full)
+            return loader(**kwargs)
+        with self._lock:
+            cached = self._files.get(filename_full, None)
+            if cached is not None and cached[0] == modified:
+                self._files.move_to_end(filename_full)
+                return cached[1]
+        data = loader(**kwargs)
+        # Loader may re-save validated file, check again
+        modified = file_stamp(filename_full)
+        if modified is not None:
+            with self._lock:
+                self._files[filename_full] = modified, data
+                self._files.move_to_end(filename_full)
+                if len(self._files) > self._max_files:
+                    self._files.popitem(last=False)
+        return data
+
+    def store(self, filename_full: str, data: Any):
+        """Store data that is about to be saved to file
+
+        Stored data is returned by load() until file is saved,
+        so that loading does not read partially written file.
+
+        Args:
+            filename_full: full file name, which is used as cache key.
+            data: data in same format as loader function return value.
+        """
+        with self._lock:
+            self._files[filename_full] = None, data
+            self._files.move_to_end(filename_full)
+            if len(self._files) > self._max_files:
+                self._files.popitem(last=False)
+
+    def save(self, filename_full: str, saver: Callable, data: Any, **kwargs: Any):
+        """Save file & update stored data with file stamp, can be run from background job
+
+        Args:
+            filename_full: full file name, which is used as cache key.
+            saver: file saver function.
+            data: stored data, see store().
+            kwargs: saver function arguments.
+        """
+        last_modified = file_stamp(filename_full)
+        try:
+            saver(**kwargs)
+        except BaseException:
+            self.remove(filename_full)
+            raise
+        modified = file_stamp(filename_full)
+        with self._lock:
+            cached = self._files.get(filename_full, None)
+            if cached is None or cached[1] is not data:  # replaced by newer data
+                return
+            if modified is None or modified == last_modified:  # not saved by saver
+                self._files.pop(filename_full)
+            else:
+                self._files[filename_full] = modified, data
+
+    def remove(self, filename_full: str):
+        """Remove cached file data"""
+        with self._lock:
+            self._files.pop(filename_full, None)
+
+
+def file_stamp(filename_full: str) -> tuple[int, int] | None:
+    """File modified time (ns) & size, None if unavailable"""
+    try:
+        stat = os.stat(filename_full)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+file_cache = UserFileCache()
@@ -0,0 +1,238 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Lap history database function
+"""
+
+from __future__ import annotations
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from time import time
+
+logger = logging.getLogger(__name__)
+
+DATABASE_FILENAME = "laphistory.db"
+LAP_COLUMNS = (
+    "laptime",
+    "is_valid",
+    "fuel_used",
+    "energy_used",
+    "battery_drain",
+    "battery_regen",
+    "sector1",
+    "sector2",
+    "sector3",
+)
+SQL_CREATE_TABLES = (
+    """CREATE TABLE IF NOT EXISTS sessions (
+        session_index INTEGER PRIMARY KEY,
+        combo_id TEXT NOT NULL,
+        session_stamp INTEGER NOT NULL,
+        created REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS laps (
+        combo_id TEXT NOT NULL,
+        session_index INTEGER NOT NULL,
+        lap INTEGER NOT NULL,
+        laptime REAL,
+        is_valid INTEGER,
+        fuel_used REAL,
+        energy_used REAL,
+        battery_drain REAL,
+        battery_regen REAL,
+        sector1 REAL,
+        sector2 REAL,
+        sector3 REAL,
+        recorded REAL NOT NULL,
+        PRIMARY KEY (combo_id, session_index, lap)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_laps_session ON laps (session_index)",
+)
+SESSION_ETIME_TOLERANCE = 60  # seconds, allowed session elapsed time mismatch between modules
+LOADING_TIMEOUT = 0.5  # seconds, maximum waiting time for database lock while loading
+
+
+class LapHistoryWriter:
+    """Lap history database background writer
+
+    Lap records are queued and written by a single background thread,
+    each record only updates its own columns of the same lap row.
+    Records are dropped if queue is full.
+
+    Args:
+        max_queue: maximum number of queued records.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_thread",
+        "_lock",
+        "_sessions",
+        "dropped",
+    )
+
+    def __init__(self, max_queue: int = 1000):
+        self._queue = queue.Queue(max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._sessions: dict[tuple[str, str], tuple[int, int, int]] = {}
+        self.dropped = 0
+
+    def record(
+        self, filepath: str, combo_id: str, session_id: tuple[int, int, int],
+        lap: int, **columns: float):
+        """Queue lap record, return immediately
+
+        Args:
+            filepath: database file path.
+            combo_id: track & vehicle combo id.
+            session_id: session identity (session stamp, elapsed time, total laps).
+            lap: lap index.
+            columns: column name & value pairs, see LAP_COLUMNS.
+        """
+        if lap < 0:
+            return
+        try:
+            self._queue.put_nowait((filepath, combo_id, session_id, lap, columns, time()))
+        except queue.Full:
+            self.dropped += 1
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__writing, daemon=True)
+                self._thread.start()
+
+    def close(self, timeout: float = 2):
+        """Finish writing queued records and stop writer thread"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+        if self.dropped:
+            logger.warning("LAP HISTORY: %s record(s) dropped", self.dropped)
+
+    def __writing(self):
+        """Writing thread"""
+        connections: dict[str, sqlite3.Connection] = {}
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            filepath = data[0]
+            try:
+                conn = connections.get(filepath, None)
+                if conn is None:
+                    conn = connections[filepath] = create_connection(filepath)
+                self.__write_record(conn, *data)
+                if self._queue.empty():  # batch commit
+                    conn.commit()
+            except (sqlite3.Error, OSError) as error:
+                logger.error("LAP HISTORY: failed writing, %s", error)
+        for conn in connections.values():
+            try:
+                conn.commit()
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def __write_record(
+        self, conn: sqlite3.Connection, filepath: str, combo_id: str,
+        session_id: tuple[int, int, int], lap: int, columns: dict, recorded: float):
+        """Write lap record, insert or update existing lap columns"""
+        names = [name for name in columns if name in LAP_COLUMNS]
+        if not names:
+            return
+        session_index = self.__session_index(conn, filepath, combo_id, session_id, recorded)
+        conn.execute(
+            f"INSERT INTO laps (combo_id, session_index, lap, recorded, {', '.join(names)}) "
+            f"VALUES (?, ?, ?, ?, {', '.join('?' * len(names))}) "
+            "ON CONFLICT (combo_id, session_index, lap) DO UPDATE SET "
+            f"{', '.join(f'{name} = excluded.{name}' for name in names)}",
+            (combo_id, session_index, lap, recorded, *(columns[name] for name in names)),
+        )
+
+    def __session_index(
+        self, conn: sqlite3.Connection, filepath: str, combo_id: str,
+        session_id: tuple[int, int, int], recorded: float) -> int:
+        """Get session index, create new session if not same session"""
+        key = filepath, combo_id
+        last = self._sessions.get(key, None)
+        if (last is not None and
+            last[0] == session_id[0] and
+            last[1] <= session_id[1] + SESSION_ETIME_TOLERANCE):
+            session_index = last[2]
+        else:
+            session_index = conn.execute(
+                "INSERT INTO sessions (combo_id, session_stamp, created) VALUES (?, ?, ?)",
+                (combo_id, session_id[0], recorded),
+            ).lastrowid
+        self._sessions[key] = (
+            session_id[0],
+            max(session_id[1], last[1] if last is not None else 0),
+            session_index,
+        )
+        return session_index
+
+
+def create_connection(filepath: str) -> sqlite3.Connection:
+    """Create lap history database connection & tables"""
+    conn = sqlite3.connect(f"{filepath}{DATABASE_FILENAME}", check_same_thread=False)
+    for sql in SQL_CREATE_TABLES:
+        conn.execute(sql)
+    conn.commit()
+    return conn
+
+
+def load_lap_history(filepath: str, combo_id: str, limit: int = 1000) -> list[tuple]:
+    """Load lap history from database (read-only), newest lap first
+
+    Database is opened read-only with short lock timeout,
+    returns empty list if locked by writer thread.
+
+    Returns:
+        List of (lap, is_valid, laptime, fuel_used, energy_used,
+        battery_drain, battery_regen, sector1, sector2, sector3).
+    """
+    filename_full = f"{filepath}{DATABASE_FILENAME}"
+    if not os.path.exists(filename_full):
+        return []
+    try:
+        database_uri = f"{Path(os.path.abspath(filename_full)).as_uri()}?mode=ro"
+        with closing(sqlite3.connect(
+            database_uri, timeout=LOADING_TIMEOUT, uri=True)) as conn:
+            return conn.execute(
+                "SELECT lap, is_valid, laptime, fuel_used, energy_used, "
+                "battery_drain, battery_regen, sector1, sector2, sector3 "
+                "FROM laps WHERE combo_id = ? "
+                "ORDER BY session_index DESC, lap DESC LIMIT ?",
+                (combo_id, limit),
+            ).fetchall()
+    except sqlite3.Error as error:
+        logger.info("LOADING: failed loading lap history database, %s", error)
+        return []
+
+
+lap_history = LapHistoryWriter()
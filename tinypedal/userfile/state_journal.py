@@ -0,0 +1,169 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+State journal function
+"""
+
+from __future__ import annotations
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+from ..const import PATH_GLOBAL
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "journal.bin"
+JOURNAL_CAPACITY = 256  # number of records in ring
+JOURNAL_VALUES = 15  # number of values per record
+JOURNAL_RECORD = struct.Struct(f"<QII128s{JOURNAL_VALUES}d")  # seq, kind, crc, key, values
+
+# Record kind
+SECTORS_PENDING = 1  # session id (3), session TB (3), session PB (3), all time TB (3), all time PB (3)
+SECTORS_SAVED = 2
+METERS_PENDING = 3  # meters driven (1), config value (1) that meters driven is counted from
+METERS_SAVED = 4
+
+
+class StateJournal:
+    """Crash-safe state journal
+
+    Fixed-size memory-mapped ring file, each record is a fixed-size slot
+    with sequence number and checksum. Records are written to mapped memory
+    without flushing, page cache writes data to file even if APP crashes.
+
+    Modules append "pending" records while state changes, and "saved" records
+    after state is saved to its own file. On next start, state of latest
+    "pending" record that has no following "saved" record is replayed.
+
+    Args:
+        filepath: journal file path.
+        filename: journal file name.
+    """
+
+    __slots__ = (
+        "_filename_full",
+        "_file",
+        "_mmap",
+        "_seq",
+        "_lock",
+    )
+
+    def __init__(self, filepath: str, filename: str = JOURNAL_FILENAME):
+        self._filename_full = os.path.join(filepath, filename)
+        self._file = None
+        self._mmap = None
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def append(self, kind: int, key: str, values: tuple[float, ...] = ()):
+        """Append record, overwrite oldest record if full
+
+        Args:
+            kind: record kind.
+            key: record key, such as combo id.
+            values: record values, up to JOURNAL_VALUES.
+        """
+        values = tuple(values[:JOURNAL_VALUES]) + (0.0,) * (JOURNAL_VALUES - len(values))
+        key_bytes = key.encode("utf-8")[:128]
+        with self._lock:
+            if not self.__open():
+                return
+            self._seq += 1
+            crc = record_crc(self._seq, kind, key_bytes, values)
+            offset = (self._seq % JOURNAL_CAPACITY) * JOURNAL_RECORD.size
+            JOURNAL_RECORD.pack_into(self._mmap, offset, self._seq, kind, crc, key_bytes, *values)
+
+    def pending(self, pending_kind: int, saved_kind: int, key: str) -> tuple[float, ...] | None:
+        """Get values of latest pending record that is not saved
+
+        Args:
+            pending_kind: pending record kind.
+            saved_kind: saved record kind.
+            key: record key.
+
+        Returns:
+            Record values, or None if not found or already saved.
+        """
+        key_bytes = key.encode("utf-8")[:128]
+        latest_seq = 0
+        latest = None
+        with self._lock:
+            if not self.__open():
+                return None
+            for seq, kind, record_key, values in self.__records():
+                if (seq > latest_seq and record_key == key_bytes and
+                    kind in (pending_kind, saved_kind)):
+                    latest_seq = seq
+                    latest = values if kind == pending_kind else None
+        return latest
+
+    def close(self):
+        """Flush & close journal file"""
+        with self._lock:
+            if self._mmap is not None:
+                try:
+                    self._mmap.flush()
+                    self._mmap.close()
+                    self._file.close()
+                except (OSError, ValueError):
+                    pass
+            self._mmap = None
+            self._file = None
+
+    def __open(self) -> bool:
+        """Open & map journal file if not opened"""
+        if self._mmap is not None:
+            return True
+        size = JOURNAL_CAPACITY * JOURNAL_RECORD.size
+        try:
+            mode = "r+b" if os.path.exists(self._filename_full) else "w+b"
+            self._file = open(self._filename_full, mode)
+            if os.fstat(self._file.fileno()).st_size != size:
+                self._file.truncate(size)
+            self._mmap = mmap.mmap(self._file.fileno(), size)
+        except (OSError, ValueError) as error:
+            logger.error("JOURNAL: failed opening %s, %s", JOURNAL_FILENAME, error)
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._mmap = None
+            return False
+        self._seq = max((record[0] for record in self.__records()), default=0)
+        return True
+
+    def __records(self):
+        """Valid records"""
+        for offset in range(0, len(self._mmap), JOURNAL_RECORD.size):
+            seq, kind, crc, key_bytes, *values = JOURNAL_RECORD.unpack_from(self._mmap, offset)
+            key_bytes = key_bytes.rstrip(b"\0")
+            if seq and crc == record_crc(seq, kind, key_bytes, values):
+                yield seq, kind, key_bytes, tuple(values)
+
+
+def record_crc(seq: int, kind: int, key_bytes: bytes, values: tuple | list) -> int:
+    """Record checksum"""
+    return zlib.crc32(struct.pack(
+        f"<QI128s{JOURNAL_VALUES}d", seq, kind, key_bytes, *values))
+
+
+state_journal = StateJournal(PATH_GLOBAL)
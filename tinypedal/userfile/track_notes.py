@@ -188,6 +188,14 @@ def load_notes_file(
         return None
 
 
+def notes_file_mtime(filename_full: str) -> float:
+    """Notes file last modified time, -1 if unavailable"""
+    try:
+        return os.path.getmtime(filename_full)
+    except OSError:
+        return -1.0
+
+
 def write_csv_notes(
     notes_file: Any, table_header: tuple, dataset: list, metadata: dict, _: str):
     """Write TinyPedal notes format to file"""
@@ -21,10 +21,13 @@ Overlay base window, events.
 """
 
 from __future__ import annotations
+import logging
 import re
+from math import ceil
+from time import monotonic
 from typing import Any, NamedTuple
 
-from PySide2.QtCore import Qt, Slot, QBasicTimer
+from PySide2.QtCore import Qt, Slot, QBasicTimer, QObject
 from PySide2.QtGui import QPalette, QFont, QFontMetrics, QPixmap
 from PySide2.QtWidgets import QWidget, QLabel, QLayout, QGridLayout
 
@@ -34,6 +37,96 @@ from ..overlay_control import octrl, OverlayState
 from ..setting import Setting
 
 FONT_WEIGHT_LIST = rxp.CHOICE_COMMON[rxp.CFG_FONT_WEIGHT]
+FRAME_CLOCK_TOLERANCE = 0.0005  # seconds, timer precision allowance for due bucket
+
+logger = logging.getLogger(__name__)
+
+
+class FrameClock(QObject):
+    """Shared frame clock for all overlay widgets
+
+    Widgets are grouped in buckets of same update interval,
+    each bucket keeps its own accumulated update deadline.
+    Single timer is rescheduled to the nearest bucket deadline
+    after each timer event, and all due buckets are updated
+    within one timer event.
+
+    Widget update error is logged once per widget with traceback,
+    further errors from same widget are only counted,
+    and reported when widget is unregistered.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QBasicTimer()
+        self._buckets: dict[int, list[Overlay]] = {}
+        self._next_update: dict[int, float] = {}
+        self._failed: dict[Overlay, int] = {}
+
+    def register(self, overlay: Overlay, interval: int):
+        """Register widget to update bucket
+
+        Args:
+            overlay: widget with timerEvent method.
+            interval: update interval in milliseconds.
+        """
+        bucket = self._buckets.get(interval, None)
+        if bucket is None:
+            self._buckets[interval] = [overlay]
+            self._next_update[interval] = monotonic() + interval / 1000
+        elif overlay not in bucket:
+            bucket.append(overlay)
+        self.__schedule(monotonic())
+
+    def unregister(self, overlay: Overlay):
+        """Unregister widget from update bucket"""
+        for interval, bucket in tuple(self._buckets.items()):
+            if overlay in bucket:
+                bucket.remove(overlay)
+                if not bucket:
+                    self._buckets.pop(interval)
+                    self._next_update.pop(interval)
+        failed = self._failed.pop(overlay, 0)
+        if failed > 1:
+            logger.warning(
+                "ERROR: widget update failed %s times (%s)", failed, overlay.widget_name)
+        self.__schedule(monotonic())
+
+    def __schedule(self, now: float):
+        """Schedule timer to nearest bucket deadline"""
+        if not self._next_update:
+            self._timer.stop()
+            return
+        delay = min(self._next_update.values()) - now
+        self._timer.start(max(ceil(delay * 1000), 0), Qt.PreciseTimer, self)
+
+    def timerEvent(self, event):
+        """Update due buckets"""
+        now = monotonic()
+        due_time = now + FRAME_CLOCK_TOLERANCE
+        for interval, bucket in tuple(self._buckets.items()):
+            next_update = self._next_update[interval]
+            if next_update > due_time:
+                continue
+            next_update += interval / 1000
+            if next_update < now:  # reset if lagged behind more than one interval
+                next_update = now + interval / 1000
+            self._next_update[interval] = next_update
+            for overlay in tuple(bucket):
+                try:
+                    overlay.timerEvent(event)
+                except Exception:  # keep updating other widgets
+                    self.__update_failed(overlay)
+        self.__schedule(monotonic())
+
+    def __update_failed(self, overlay: Overlay):
+        """Log first widget update error, count further errors"""
+        failed = self._failed.get(overlay, 0)
+        if not failed:
+            logger.exception(
+                "ERROR: widget update failed (%s), further errors are suppressed",
+                overlay.widget_name)
+        self._failed[overlay] = failed + 1
 
 
 class Overlay(QWidget):
@@ -61,8 +154,7 @@ class Overlay(QWidget):
         self._mouse_pressed = 0
         self._move_size = max(self.cfg.application["grid_move_size"], 1)
 
-        # Set update timer
-        self._update_timer = QBasicTimer()
+        # Set update interval for shared frame clock
         self._update_interval = max(
             self.wcfg["update_interval"],
             self.cfg.application["minimum_update_interval"],
@@ -74,11 +166,11 @@ class Overlay(QWidget):
         self.__set_window_style()
         self.__set_window_attributes()  # 1
         self.__set_window_flags()  # 2
-        self._update_timer.start(self._update_interval, self)
+        fclock.register(self, self._update_interval)
 
     def stop(self):
         """Stop and close widget"""
-        self._update_timer.stop()
+        fclock.unregister(self)
         self.__break_signal()
         self.unload_resource()
         self.wcfg = None
@@ -537,3 +629,6 @@ class FontMetrics(NamedTuple):
     leading: int = 0
     capital: int = 0
     descent: int = 0
+
+
+fclock = FrameClock()
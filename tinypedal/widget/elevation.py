@@ -25,6 +25,7 @@ from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QPen, QBrush
 
 from .. import calculation as calc
 from ..api_control import api
+from ..map_geometry import geometry, MAP_PIXEL_TOLERANCE
 from ..module_info import minfo
 from ._base import Overlay
 
@@ -167,21 +168,17 @@ class Realtime(Overlay):
             # Set boundary start node
             map_path.moveTo(-999, self.map_scaled[-2][1])  # 2nd last node y pos
 
-            # Set middle nodes
-            total_nodes = len(self.map_scaled)
-            skip_node = total_nodes // self.display_width * self.display_detail_level
-            skipped_last_node = (total_nodes - 1) % skip_node if skip_node else 0
+            # Set middle nodes, simplified within pixel tolerance of detail level
             last_dist = 0
-            last_skip = 0
-            for coords in self.map_scaled:
-                if coords[0] > last_dist and last_skip >= skip_node:
+            for coords in geometry.simplify(
+                self.map_scaled,
+                self.display_detail_level * MAP_PIXEL_TOLERANCE / self.map_scale[1],
+                vertical=True,
+                source=raw_coords,
+                ):
+                if coords[0] > last_dist:
                     map_path.lineTo(*coords)
-                    last_skip = 0
                 last_dist = coords[0]
-                last_skip += 1
-
-            if skipped_last_node:  # set last node if skipped
-                map_path.lineTo(*self.map_scaled[-1])
 
             # Set boundary end node
             map_path.lineTo(self.display_width + 999, self.map_scaled[1][1])  # 2nd node y pos
@@ -20,11 +20,14 @@
 Navigation Widget
 """
 
+from math import ceil, floor, hypot
+
 from PySide2.QtCore import Qt, QRectF, QPointF
 from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QRadialGradient, QPen, QBrush
 
 from .. import calculation as calc
 from ..api_control import api
+from ..map_geometry import geometry, MAP_PIXEL_TOLERANCE
 from ..module_info import minfo
 from ._base import Overlay
 
@@ -53,6 +56,13 @@ class Realtime(Overlay):
         self.view_range = self.wcfg["view_radius"] * 2.5
         self.veh_offset_y = self.area_size * max(self.wcfg["vehicle_offset"], 0)
         self.veh_size = max(int(self.wcfg["vehicle_size"]), 1)
+        # Map layer cache, radius to farthest corner from vehicle + redraw margin
+        self.cell_size = self.area_size
+        self.cache_margin = self.area_size * 0.5
+        self.cache_half_size = ceil(hypot(
+            self.area_center,
+            max(self.veh_offset_y, self.area_size - self.veh_offset_y),
+        ) + self.cache_margin)
 
         if self.wcfg["show_circle_vehicle_shape"]:
             self.veh_shape = QRectF(
@@ -75,13 +85,15 @@ class Realtime(Overlay):
             self.veh_size
         )
 
-        self.map_path = None
+        self.map_cells = None
         self.sfinish_path = None
         self.sector_path = None
+        self.map_cache_center = None
         self.create_map_path()
 
         # Config canvas
         self.resize(self.area_size, self.area_size)
+        self.pixmap_map = QPixmap(self.cache_half_size * 2, self.cache_half_size * 2)
         self.pixmap_background = QPixmap(self.area_size, self.area_size)
         self.pixmap_mask = QPixmap(self.area_size, self.area_size)
 
@@ -95,10 +107,12 @@ class Realtime(Overlay):
 
         self.pen_outline = QPen()
         self.pen_outline.setJoinStyle(Qt.RoundJoin)
+        self.pen_outline.setCapStyle(Qt.RoundCap)
         self.pen_outline.setWidth(self.wcfg["map_width"] + self.wcfg["map_outline_width"])
         self.pen_outline.setColor(self.wcfg["map_outline_color"])
         self.pen_map = QPen()
         self.pen_map.setJoinStyle(Qt.RoundJoin)
+        self.pen_map.setCapStyle(Qt.RoundCap)
         self.pen_map.setWidth(self.wcfg["map_width"])
         self.pen_map.setColor(self.wcfg["map_color"])
         self.pen_sfinish = QPen()
@@ -192,18 +206,22 @@ class Realtime(Overlay):
     def create_map_path(self, raw_coords=None):
         """Create map path"""
         if raw_coords:
-            map_path = QPainterPath()
             dist = calc.distance(raw_coords[0], raw_coords[-1])
             (self.map_scaled, self.map_size, self.map_offset
              ) = calc.zoom_map(raw_coords, self.global_scale)
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                else:
-                    map_path.lineTo(*coords)
+            # Create simplified map paths by grid cells
             # Close map loop if start & end distance less than 500 meters
-            if dist < 500:
-                map_path.closeSubpath()
+            map_simplified = geometry.simplify(
+                self.map_scaled, MAP_PIXEL_TOLERANCE / self.global_scale, source=raw_coords)
+            map_cells = {}
+            for cell, polylines in calc.grid_segments(
+                map_simplified, self.cell_size, dist < 500).items():
+                map_path = QPainterPath()
+                for polyline in polylines:
+                    map_path.moveTo(*polyline[0])
+                    for coords in polyline[1:]:
+                        map_path.lineTo(*coords)
+                map_cells[cell] = map_path
             # Create start/finish path
             sfinish_path = QPainterPath()
             self.create_sector_path(
@@ -222,11 +240,12 @@ class Realtime(Overlay):
             self.map_scaled = None
             self.map_size = 1,1
             self.map_offset = 0,0
-            map_path = None
+            map_cells = None
             sfinish_path = None
             sector_path = None
 
-        self.map_path = map_path
+        self.map_cells = map_cells
+        self.map_cache_center = None
         self.sfinish_path = sfinish_path
         self.sector_path = sector_path
 
@@ -236,24 +255,63 @@ class Realtime(Overlay):
         # Player vehicle orientation yaw radians + 180 deg rotation correction
         plr_ori_rad = api.read.vehicle.orientation_yaw_radians() + 3.14159265
         # x, y position & offset relative to player
+        pos_x = api.read.vehicle.position_longitudinal() * self.global_scale - self.map_offset[0]
+        pos_y = api.read.vehicle.position_lateral() * self.global_scale - self.map_offset[1]
         rot_pos_x, rot_pos_y = calc.rotate_coordinate(
             plr_ori_rad,   # plr_ori_rad, rotate view
-            api.read.vehicle.position_longitudinal() * self.global_scale - self.map_offset[0],
-            api.read.vehicle.position_lateral() * self.global_scale - self.map_offset[1]
+            pos_x,
+            pos_y
         )
+        # Redraw map layer cache if player moved outside cache margin
+        if (self.map_cache_center is None
+            or abs(pos_x - self.map_cache_center[0]) > self.cache_margin
+            or abs(pos_y - self.map_cache_center[1]) > self.cache_margin):
+            self.map_cache_center = pos_x, pos_y
+            self.draw_map_cache(pos_x, pos_y)
         # Apply center offset & rotation
         painter.translate(self.area_center - rot_pos_x, self.veh_offset_y - rot_pos_y)
         painter.rotate(calc.rad2deg(plr_ori_rad))
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        painter.drawPixmap(
+            QPointF(
+                self.map_cache_center[0] - self.cache_half_size,
+                self.map_cache_center[1] - self.cache_half_size,
+            ),
+            self.pixmap_map,
+        )
+        painter.resetTransform()
+
+    def draw_map_cache(self, center_x, center_y):
+        """Draw map layer cache around center position (unrotated)
+
+        Only map paths from grid cells within cache area are drawn.
+        """
+        self.pixmap_map.fill(Qt.transparent)
+        painter = QPainter(self.pixmap_map)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.translate(self.cache_half_size - center_x, self.cache_half_size - center_y)
+
+        if self.map_cells:
+            # Combine visible cells into single path to avoid overlapping stroke
+            map_path = QPainterPath()
+            cell_x1 = floor((center_x - self.cache_half_size) / self.cell_size)
+            cell_x2 = floor((center_x + self.cache_half_size) / self.cell_size)
+            cell_y1 = floor((center_y - self.cache_half_size) / self.cell_size)
+            cell_y2 = floor((center_y + self.cache_half_size) / self.cell_size)
+            for cell_x in range(cell_x1, cell_x2 + 1):
+                for cell_y in range(cell_y1, cell_y2 + 1):
+                    cell_path = self.map_cells.get((cell_x, cell_y), None)
+                    if cell_path is not None:
+                        map_path.addPath(cell_path)
 
-        if self.map_path:
             # Draw map outline
             if self.wcfg["map_outline_width"] > 0:
                 painter.setPen(self.pen_outline)
-                painter.drawPath(self.map_path)
+                painter.drawPath(map_path)
 
             # Draw map
             painter.setPen(self.pen_map)
-            painter.drawPath(self.map_path)
+            painter.drawPath(map_path)
 
         # Draw start/finish line
         if self.wcfg["show_start_line"] and self.sfinish_path:
@@ -265,8 +323,6 @@ class Realtime(Overlay):
             painter.setPen(self.pen_sector)
             painter.drawPath(self.sector_path)
 
-        painter.resetTransform()
-
     def draw_vehicle(self, painter, veh_info, veh_draw_order):
         """Draw vehicles"""
         painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
@@ -27,7 +27,7 @@ from PySide2.QtGui import QPainter, QPixmap, QLinearGradient, QRadialGradient, Q
 
 from .. import calculation as calc
 from ..api_control import api
-from ..module_info import minfo
+from ..module_info import minfo, VEHICLE_GRID_SIZE, VEHICLE_GRID_RANGE
 from ._base import Overlay
 
 
@@ -59,6 +59,8 @@ class Realtime(Overlay):
         self.indicator_color_critical = QColor(self.wcfg["indicator_color_critical"])
         self.vehicle_hide_range = self.set_range_dimension("vehicle_maximum_visible_distance")
         self.radar_hide_range = self.set_range_dimension("auto_hide_minimum_distance")
+        self.vehicle_grid_cells = self.set_grid_cells(self.vehicle_hide_range)
+        self.radar_grid_cells = self.set_grid_cells(self.radar_hide_range)
         self.radar_fade_factor = self.set_radar_fade_factor(self.radar_radius)
         self.radar_fade_color = QColor(0, 0, 0)
 
@@ -251,7 +253,7 @@ class Realtime(Overlay):
         nearest_right = indicator.max_range_x
 
         # Draw opponent vehicle within radar range
-        for _, veh_info in zip(range(minfo.vehicles.total), minfo.vehicles.dataSet):
+        for veh_info in self.nearby_vehicles(self.vehicle_grid_cells):
             if veh_info.isPlayer:
                 continue
             # -x = left, +x = right, -y = ahead, +y = behind
@@ -352,7 +354,7 @@ class Realtime(Overlay):
 
     def is_nearby(self):
         """Check nearby vehicles"""
-        for _, veh_info in zip(range(minfo.vehicles.total), minfo.vehicles.dataSet):
+        for veh_info in self.nearby_vehicles(self.radar_grid_cells):
             # -x = left, +x = right, -y = ahead, +y = behind
             if (not veh_info.isPlayer and
                 self.radar_hide_range.behind > veh_info.relativeRotatedPositionY > -self.radar_hide_range.ahead and
@@ -360,6 +362,19 @@ class Realtime(Overlay):
                 return True
         return False
 
+    @staticmethod
+    def nearby_vehicles(grid_cells):
+        """Nearby vehicles from vehicle grid cells, or all vehicles if out of grid range"""
+        veh_info = minfo.vehicles.dataSet
+        if grid_cells is None:
+            return veh_info[:minfo.vehicles.total]
+        return [
+            veh_info[index]
+            for grid_cell, indexes in minfo.vehicles.nearbyGrid.items()
+            if grid_cell in grid_cells
+            for index in indexes
+        ]
+
     def calc_indicator_dimension(self, veh_width, veh_length):
         """Calculate indicator dimension
 
@@ -394,6 +409,19 @@ class Realtime(Overlay):
             min_side = self.wcfg[f"{prefix}_side"]
         return DistanceRect(min_ahead, min_behind, min_side)
 
+    @staticmethod
+    def set_grid_cells(distance_rect):
+        """Set vehicle grid cells that covers range dimension, None if out of grid range"""
+        if calc.distance(
+            (0, 0), (distance_rect.side, max(distance_rect.ahead, distance_rect.behind))
+            ) >= VEHICLE_GRID_RANGE:
+            return None
+        return calc.grid_cells(
+            -distance_rect.side, distance_rect.side,
+            -distance_rect.ahead, distance_rect.behind,
+            VEHICLE_GRID_SIZE,
+        )
+
     def set_radar_fade_factor(self, radar_radius):
         """Set radar fade factor"""
         range_fade_out = min(max(self.wcfg["radar_fade_out_radius"], 0.5), 1)
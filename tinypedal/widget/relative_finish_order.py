@@ -34,6 +34,8 @@ MAGIC_NUM = 99999
 class Realtime(Overlay):
     """Draw widget"""
 
+    requires = ("module_pace",)  # leader laptime pace, started along with this widget
+
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
@@ -59,11 +61,6 @@ class Realtime(Overlay):
         self.extra_laps = max(self.wcfg["number_of_extra_laps"], 1)
         self.refill_sign = "" if self.wcfg["show_absolute_refilling"] else "+"
 
-        self.gen_leader_pace = calc_laptime_pace(
-            min(max(self.wcfg["leader_laptime_pace_samples"], 1), 20),
-            max(self.wcfg["leader_laptime_pace_margin"], 0.1))
-        self.gen_leader_pace.send(None)
-
         # Base style
         self.setStyleSheet(self.set_qss(
             font_family=self.wcfg["font_name"],
@@ -211,7 +208,7 @@ class Realtime(Overlay):
         leader_lap_into = api.read.lap.progress(leader_index)
         player_lap_into = api.read.lap.progress()
 
-        leader_laptime_pace = self.gen_leader_pace.send(leader_index)
+        leader_laptime_pace = minfo.pace.laptimePace[leader_index]
         player_laptime_pace = minfo.delta.lapTimePace
 
         leader_valid = 0 < leader_laptime_pace < MAGIC_NUM
@@ -406,62 +403,3 @@ class Realtime(Overlay):
             if lap_final > 1 - min(self.range_finish, range_limit) / laptime_pace:
                 return -1  # near finish
         return 0
-
-
-def calc_laptime_pace(samples: int = 6, margin: float = 5, laptime: float = MAGIC_NUM):
-    """Calculate lap time pace for specific player"""
-    laptime_pace = laptime
-    laptime_margin = margin
-    ema_factor = calc.ema_factor(samples)
-    last_vehicle_class = ""
-    last_lap_stime = -1.0
-    is_pit_lap = 0  # whether pit in or pit out lap
-    validating = 0.0
-
-    while True:
-        player_index = yield laptime_pace
-        # Calculate laptime pace
-        lap_stime = api.read.timing.start(player_index)
-        veh_class = api.read.vehicle.class_name(player_index)
-        is_pit_lap |= api.read.vehicle.in_pits(player_index)
-
-        # Reset if vehicle class changes
-        if last_vehicle_class != veh_class:
-            last_vehicle_class = veh_class
-            laptime_pace = reset_laptime(player_index)
-
-        if last_lap_stime != lap_stime:
-            last_lap_stime = lap_stime
-            validating = api.read.timing.elapsed()
-            is_pit_lap = 0
-
-        if validating:
-            timer = api.read.timing.elapsed() - validating
-            laptime_last = api.read.timing.last_laptime(player_index)
-            if 1 < timer <= 10 and verify_laptime(laptime_last):
-                if not is_pit_lap:
-                    if laptime_pace > laptime_last:
-                        laptime_pace = laptime_last
-                    else:
-                        laptime_pace = min(
-                            calc.exp_mov_avg(ema_factor, laptime_pace, laptime_last),
-                            laptime_pace + laptime_margin,
-                        )
-                elif laptime_pace >= MAGIC_NUM:
-                    laptime_pace = reset_laptime(player_index)
-                validating = 0
-            elif timer > 10:  # switch off after 10s
-                validating = 0
-
-
-def reset_laptime(index: int) -> float:
-    """Reset laptime"""
-    return min(filter(verify_laptime,
-        (api.read.timing.last_laptime(index),
-        api.read.timing.best_laptime(index),
-        MAGIC_NUM)))
-
-
-def verify_laptime(laptime: float) -> bool:
-    """Verify laptime"""
-    return laptime > 0
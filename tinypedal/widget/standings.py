@@ -25,6 +25,7 @@ from PySide2.QtGui import QPixmap
 from .. import calculation as calc
 from .. import formatter as fmt
 from .. import heatmap as hmp
+from ..class_style import cstyle
 from ..regex_pattern import TEXT_PLACEHOLDER
 from ..api_control import api
 from ..module_info import minfo
@@ -651,11 +652,9 @@ class Realtime(Overlay):
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
-        style = self.cfg.user.classes.get(class_name, None)
-        if style is not None:
-            return style["alias"], style["color"]
-        if class_name and self.wcfg["show_random_color_for_unknown_class"]:
-            return class_name, fmt.random_color_class(class_name)
+        style = cstyle.select(class_name)
+        if style.is_preset or (class_name and self.wcfg["show_random_color_for_unknown_class"]):
+            return style.alias, style.color
         return class_name, self.wcfg["bkg_color_class"]
 
     @staticmethod
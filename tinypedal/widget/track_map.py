@@ -20,15 +20,20 @@
 Track map Widget
 """
 
-from PySide2.QtCore import Qt, QRectF
-from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QPen, QBrush
+from math import ceil
+
+from PySide2.QtCore import Qt, QRect, QRectF
+from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QPen, QBrush, QRegion
 
 from .. import calculation as calc
 from ..api_control import api
-from ..formatter import random_color_class
+from ..class_style import cstyle
+from ..map_geometry import geometry, MAP_PIXEL_TOLERANCE
 from ..module_info import minfo
 from ._base import Overlay
 
+MAX_CACHED_SPRITES = 512
+
 
 class Realtime(Overlay):
     """Draw widget"""
@@ -53,6 +58,11 @@ class Realtime(Overlay):
         veh_size = self.wcfg["font_size"] + round(font_m.width * self.wcfg["bar_padding"])
         self.veh_shape = QRectF(-veh_size * 0.5, -veh_size * 0.5, veh_size, veh_size)
         self.veh_text_shape = self.veh_shape.adjusted(0, font_offset, 0, 0)
+        # Vehicle sprite size, include outline width
+        max_outline_width = max(
+            self.wcfg["vehicle_outline_width"], self.wcfg["vehicle_outline_player_width"], 0)
+        self.veh_sprite_size = ceil(veh_size + max_outline_width) + 2
+        self.veh_sprite_offset = self.veh_sprite_size // 2
 
         # Config canvas
         self.area_size = max(self.wcfg["area_size"], 100)
@@ -65,7 +75,6 @@ class Realtime(Overlay):
         self.pen_veh = self.set_veh_pen_style("vehicle_outline"), self.set_veh_pen_style("vehicle_outline_player")
         self.pen_text = QPen(self.wcfg["font_color"]), QPen(self.wcfg["font_color_player"])
 
-        self.brush_classes = {}
         self.brush_overall = self.set_veh_brush_style(
             "player","leader","in_pit","yellow","laps_ahead","laps_behind","same_lap"
         )
@@ -80,6 +89,12 @@ class Realtime(Overlay):
             self.last_pit_state = -1
             self.pitout_dist = 0
 
+        # Vehicle layer
+        self.veh_sprites = {}
+        self.veh_markers = {}
+        self.veh_layer = ()
+        self.last_draw_order = None
+
         # Last data
         self.last_modified = 0
         self.last_veh_data_version = None
@@ -103,7 +118,11 @@ class Realtime(Overlay):
             veh_data_version = minfo.vehicles.dataSetVersion
             if self.last_veh_data_version != veh_data_version:
                 self.last_veh_data_version = veh_data_version
-                self.update()
+                self.update_vehicle_layer(
+                    self.map_scaled,
+                    minfo.vehicles.dataSet,
+                    minfo.vehicles.drawOrder,
+                )
 
     # GUI update methods
     def update_map(self, data):
@@ -112,6 +131,7 @@ class Realtime(Overlay):
             self.last_modified = data
             map_path = self.create_map_path(minfo.mapping.coordinates)
             self.draw_map_image(map_path, self.circular_map)
+            self.last_draw_order = None  # full repaint
 
     def paintEvent(self, event):
         """Draw"""
@@ -119,12 +139,9 @@ class Realtime(Overlay):
         painter.drawPixmap(0, 0, self.pixmap_map)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
-        self.draw_vehicle(
-            painter,
-            self.map_scaled,
-            minfo.vehicles.dataSet,
-            minfo.vehicles.drawOrder,
-        )
+        # Draw vehicles, only changed region is repainted
+        for pos_x, pos_y, sprite in self.veh_layer:
+            painter.drawPixmap(pos_x, pos_y, sprite)
 
         if self.wcfg["show_pitout_prediction"]:
             self.draw_pitout_prediction(
@@ -141,20 +158,17 @@ class Realtime(Overlay):
             (self.map_scaled, self.map_range, self.map_scale, self.map_offset
              ) = calc.scale_map(raw_coords, self.area_size, self.area_margin)
 
-            total_nodes = len(self.map_scaled)
-            skip_node = total_nodes // (self.temp_map_size * 3) * self.display_detail_level
-            skipped_last_node = (total_nodes - 1) % skip_node if skip_node else 0
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
+            # Simplify map nodes within pixel tolerance of detail level
+            map_simplified = geometry.simplify(
+                self.map_scaled,
+                self.display_detail_level * MAP_PIXEL_TOLERANCE / self.map_scale,
+                source=raw_coords,
+            )
+            for index, coords in enumerate(map_simplified):
                 if index == 0:
                     map_path.moveTo(*coords)
-                elif last_skip >= skip_node:
+                else:
                     map_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
-
-            if skipped_last_node:  # set last node if skipped
-                map_path.lineTo(*self.map_scaled[-1])
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
@@ -253,8 +267,15 @@ class Realtime(Overlay):
                     self.area_size * 0.5
                 )
 
-    def draw_vehicle(self, painter, map_data, veh_info, veh_draw_order):
-        """Draw vehicles"""
+    def update_vehicle_layer(self, map_data, veh_info, veh_draw_order):
+        """Update vehicle layer, repaint changed region only
+
+        Each vehicle marker is drawn from pre-rendered sprite,
+        changed region is the union of old & new marker rects.
+        """
+        veh_markers = {}
+        veh_layer = []
+        offset = self.veh_sprite_offset
         for index in veh_draw_order:
             data = veh_info[index]
             is_player = data.isPlayer
@@ -266,7 +287,6 @@ class Realtime(Overlay):
                 pos_y = round(
                     (data.worldPositionY - self.map_range[2])  # min range y
                     * self.map_scale + self.map_offset[1])  # offset y
-                painter.translate(pos_x, pos_y)
             else:  # vehicles on temp map
                 inpit_offset = self.wcfg["font_size"] * data.inPit
                 pos_x, pos_y = calc.rotate_coordinate(
@@ -274,22 +294,71 @@ class Realtime(Overlay):
                     self.temp_map_size / -2 + inpit_offset,  # x pos
                     0,  # y pos
                 )
-                offset = self.area_size * 0.5
-                painter.translate(offset + pos_x, offset + pos_y)
+                pos_x = round(self.area_size * 0.5 + pos_x)
+                pos_y = round(self.area_size * 0.5 + pos_y)
 
-            painter.setPen(self.pen_veh[is_player])
-            painter.setBrush(self.color_vehicle(data))
-            painter.drawEllipse(self.veh_shape)
-
-            # Draw text standings
+            # Text standings
             if self.wcfg["show_vehicle_standings"]:
                 if self.show_position_in_class:
-                    place_veh = data.positionInClass
+                    place_veh = f"{data.positionInClass}"
                 else:
-                    place_veh = data.positionOverall
-                painter.setPen(self.pen_text[is_player])
-                painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{place_veh}")
-            painter.resetTransform()
+                    place_veh = f"{data.positionOverall}"
+            else:
+                place_veh = ""
+
+            brush = self.color_vehicle(data)
+            sprite_key = brush.color().rgba(), is_player, place_veh
+            sprite = self.veh_sprites.get(sprite_key, None)
+            if sprite is None:
+                sprite = self.draw_vehicle_sprite(sprite_key, brush, is_player, place_veh)
+            veh_markers[index] = pos_x - offset, pos_y - offset, sprite_key
+            veh_layer.append((pos_x - offset, pos_y - offset, sprite))
+
+        self.veh_layer = veh_layer
+        last_markers = self.veh_markers
+        self.veh_markers = veh_markers
+
+        # Full repaint if draw order changed or pit prediction is visible
+        draw_order = tuple(veh_draw_order)
+        if (self.last_draw_order != draw_order or
+            (self.wcfg["show_pitout_prediction"] and
+             (veh_info[minfo.vehicles.playerIndex].inPit or self.last_pit_state > 0))):
+            self.last_draw_order = draw_order
+            self.update()
+            return
+
+        # Changed region
+        size = self.veh_sprite_size
+        region = QRegion()
+        for index, marker in veh_markers.items():
+            last_marker = last_markers.get(index, None)
+            if last_marker == marker:
+                continue
+            region = region.united(QRect(marker[0], marker[1], size, size))
+            if last_marker is not None:
+                region = region.united(QRect(last_marker[0], last_marker[1], size, size))
+        if not region.isEmpty():
+            self.update(region)
+
+    def draw_vehicle_sprite(self, sprite_key, brush, is_player, place_veh):
+        """Draw vehicle sprite pixmap"""
+        if len(self.veh_sprites) >= MAX_CACHED_SPRITES:
+            self.veh_sprites.clear()
+        offset = self.veh_sprite_offset
+        sprite = QPixmap(self.veh_sprite_size, self.veh_sprite_size)
+        sprite.fill(Qt.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setFont(self.font())
+        painter.translate(offset, offset)
+        painter.setPen(self.pen_veh[is_player])
+        painter.setBrush(brush)
+        painter.drawEllipse(self.veh_shape)
+        if place_veh:
+            painter.setPen(self.pen_text[is_player])
+            painter.drawText(self.veh_text_shape, Qt.AlignCenter, place_veh)
+        self.veh_sprites[sprite_key] = sprite
+        return sprite
 
     def draw_pitout_prediction(self, painter, map_data, plr_veh_info):
         """Draw pitout prediction circles"""
@@ -363,20 +432,10 @@ class Realtime(Overlay):
             target_pit_time += self.pit_time_step
             painter.resetTransform()
 
-    def classes_style(self, class_name: str) -> str:
-        """Get vehicle class style from brush cache"""
-        if class_name in self.brush_classes:
-            return self.brush_classes[class_name]
-        # Get vehicle class style from user defined dictionary
-        brush = QBrush(Qt.SolidPattern)
-        styles = self.cfg.user.classes.get(class_name, None)
-        if styles is not None:
-            brush.setColor(styles["color"])
-        else:
-            brush.setColor(random_color_class(class_name))
-        # Add to brush cache
-        self.brush_classes[class_name] = brush
-        return brush
+    @staticmethod
+    def classes_style(class_name: str) -> QBrush:
+        """Get vehicle class style brush from shared class style registry"""
+        return cstyle.select(class_name).brush
 
     # Additional methods
     def color_vehicle(self, veh_info):
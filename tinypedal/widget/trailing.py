@@ -20,6 +20,9 @@
 Trailing Widget
 """
 
+from __future__ import annotations
+from array import array
+
 from PySide2.QtCore import Qt, QPointF, QRect
 from PySide2.QtGui import QPainter, QPixmap, QPen
 
@@ -28,6 +31,49 @@ from ..module_info import minfo
 from ._base import Overlay
 
 
+class SampleBuffer:
+    """Circular sample buffer
+
+    New sample overwrites oldest sample at head index,
+    plot points are only built once per frame from precomputed x-grid.
+
+    Args:
+        max_samples: number of plot points.
+        x_scale: horizontal distance between plot points.
+    """
+
+    __slots__ = (
+        "_data",
+        "_head",
+        "_size",
+        "_points",
+    )
+
+    def __init__(self, max_samples: int, x_scale: int):
+        self._size = max(max_samples - 1, 1)
+        self._data = array("d", [0.0] * self._size)
+        self._head = 0
+        self._points = tuple(QPointF(index * x_scale, 0) for index in range(self._size + 1))
+
+    def append(self, value: float):
+        """Append new sample (Y position)"""
+        self._head -= 1
+        if self._head < 0:
+            self._head = self._size - 1
+        self._data[self._head] = value
+
+    def polyline(self) -> tuple[QPointF, ...]:
+        """Build plot points, newest sample first"""
+        data = self._data
+        head = self._head
+        points = self._points
+        # First point repeats newest sample
+        points[0].setY(data[head])
+        for point, value in zip(points[1:], data[head:] + data[:head]):
+            point.setY(value)
+        return points
+
+
 class Realtime(Overlay):
     """Draw widget"""
 
@@ -51,7 +97,6 @@ class Realtime(Overlay):
             self.wcfg["ffb_line_width"],
         ))
         max_samples = 3 + max_line_width  # 3 offset + max line width
-        self.samples_offset = max_samples - 2
 
         # Config canvas
         self.resize(self.area_width, self.area_height)
@@ -201,22 +246,19 @@ class Realtime(Overlay):
         for _, data, pen, line_style in self.draw_queue:
             painter.setPen(pen)
             if line_style:
-                painter.drawPoints(data)
+                painter.drawPoints(data.polyline())
             else:
-                painter.drawPolyline(data)
+                painter.drawPolyline(data.polyline())
 
     # Additional methods
     def create_data_samples(self, max_samples):
-        """Create data sample list"""
-        return tuple(QPointF(index * self.display_scale, 0) for index in range(max_samples))
+        """Create data sample buffer"""
+        return SampleBuffer(max_samples, self.display_scale)
 
     def update_sample(self, dataset, value):
         """Update input position samples"""
         # Scale & set new input position
-        dataset[0].setY(value * self.display_height + self.margin)
-        # Move old input data (Y) 1 display unit to right
-        for index in range(self.samples_offset, -1, -1):
-            dataset[index + 1].setY(dataset[index].y())
+        dataset.append(value * self.display_height + self.margin)
 
     def set_viewport_orientation(self):
         """Set viewport orientation"""